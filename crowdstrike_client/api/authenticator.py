@@ -1,19 +1,28 @@
 # -*- coding: utf-8 -*-
 """CrowdStrike authenticator module."""
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Mapping
+import time
+from typing import Mapping, Optional, Union
+
+import requests
 
 from crowdstrike_client.api.utils import log_error_response
+from crowdstrike_client.http.async_client import AsyncHTTPClient
 from crowdstrike_client.http.authenticator import (
+    AbcAsyncAuthenticator,
     AbcAuthenticator,
     AuthenticatorException,
+    Token,
 )
 from crowdstrike_client.http.client import HTTPClient
+from crowdstrike_client.http.token_store import AbcTokenStore
 
 
-class OAuth2Authenticator(AbcAuthenticator):
-    """CrowdStrike OAuth2 authenticator."""
+class BaseOAuth2Authenticator:
+    """CrowdStrike OAuth2 authenticator base."""
 
     _HEADER_ACCEPT = "Accept"
     _HEADER_CONTENT_TYPE = "Content-Type"
@@ -36,28 +45,67 @@ class OAuth2Authenticator(AbcAuthenticator):
 
     _TOKEN_ENDPOINT = "/oauth2/token"
 
-    def __init__(self, client: HTTPClient, client_id: str, client_secret: str) -> None:
-        """Initialize CrowdStrike OAuth2 authenticator."""
+    _DEFAULT_REFRESH_MARGIN_SEC = 60.0
+
+    def __init__(
+        self,
+        client: Union[HTTPClient, AsyncHTTPClient],
+        client_id: str,
+        client_secret: str,
+        token_store: Optional[AbcTokenStore] = None,
+        refresh_margin: Optional[float] = None,
+    ) -> None:
+        """Initialize CrowdStrike OAuth2 authenticator.
+
+        :param token_store: Store used to share tokens with other clients and
+            processes using the same base URL and client ID.
+        :param refresh_margin: Seconds before expiry at which a stored token is
+            no longer reused.
+        """
         self.log = logging.getLogger(__name__)
 
+        if refresh_margin is None:
+            refresh_margin = self._DEFAULT_REFRESH_MARGIN_SEC
+
         self._client = client
+        self._token_store = token_store
+        self._token_store_key = self._get_token_store_key(client.base_url, client_id)
+        self._refresh_margin = refresh_margin
 
         self._form_data = {
             self._FROM_DATA_CLIENT_ID: client_id,
             self._FROM_DATA_CLIENT_SECRET: client_secret,
         }
 
+    @staticmethod
+    def _get_token_store_key(base_url: str, client_id: str) -> str:
+        key = f"{base_url}\n{client_id}".encode("utf-8")
+        return hashlib.sha256(key).hexdigest()
+
     def _get_request_headers(self) -> Mapping[str, str]:
         return self._DEFAULT_HEADERS.copy()
 
-    def authenticate(self) -> Dict[str, str]:
-        """Perform authentication."""
-        path = self._TOKEN_ENDPOINT
-        data = self._form_data
-        headers = self._get_request_headers()
+    def _get_stored_token(self, token_store: AbcTokenStore) -> Optional[Token]:
+        token = token_store.get(self._token_store_key)
+        if token is None or token.is_expired(self._refresh_margin):
+            return None
+
+        self.log.debug("Reusing stored access token")
+        return token
 
-        response = self._client.post(path, data=data, headers=headers)
+    def _invalidate_stored_token(self, token: Token) -> None:
+        token_store = self._token_store
+        if token_store is None:
+            return
 
+        with token_store.lock():
+            stored_token = token_store.get(self._token_store_key)
+            if stored_token is not None and stored_token.headers == token.headers:
+                token_store.delete(self._token_store_key)
+
+    def _parse_token_response(
+        self, response: requests.Response, requested_at: float
+    ) -> Token:
         status_code = response.status_code
         if status_code != 201:
             log_error_response(self.log, response)
@@ -75,4 +123,95 @@ class OAuth2Authenticator(AbcAuthenticator):
             expires_in,
         )
 
-        return {self._HEADER_AUTHORIZATION: f"bearer {access_token}"}
+        return Token(
+            {self._HEADER_AUTHORIZATION: f"bearer {access_token}"},
+            expires_at=requested_at + float(expires_in),
+        )
+
+
+class OAuth2Authenticator(BaseOAuth2Authenticator, AbcAuthenticator):
+    """CrowdStrike OAuth2 authenticator."""
+
+    _client: HTTPClient
+
+    def invalidate(self, token: Token) -> None:
+        """Invalidate a token rejected by the server."""
+        self._invalidate_stored_token(token)
+
+    def authenticate(self) -> Token:
+        """Perform authentication."""
+        token_store = self._token_store
+        if token_store is None:
+            return self._request_token()
+
+        token = self._get_stored_token(token_store)
+        if token is not None:
+            return token
+
+        with token_store.lock():
+            token = self._get_stored_token(token_store)
+            if token is not None:
+                return token
+
+            token = self._request_token()
+            token_store.set(self._token_store_key, token)
+            return token
+
+    def _request_token(self) -> Token:
+        path = self._TOKEN_ENDPOINT
+        data = self._form_data
+        headers = self._get_request_headers()
+
+        # Measure expiry from before the request so the token is never
+        # considered valid for longer than the server intended.
+        requested_at = time.time()
+
+        response = self._client.post(path, data=data, headers=headers, idempotent=True)
+        return self._parse_token_response(response, requested_at)
+
+
+class AsyncOAuth2Authenticator(BaseOAuth2Authenticator, AbcAsyncAuthenticator):
+    """CrowdStrike asynchronous OAuth2 authenticator.
+
+    Unlike the synchronous authenticator, the token store lock is not held
+    while requesting a token, as it would block the event loop. Token store
+    calls, which may block on file I/O and locks, run in the default executor.
+    """
+
+    _client: AsyncHTTPClient
+
+    async def invalidate(self, token: Token) -> None:
+        """Invalidate a token rejected by the server."""
+        if self._token_store is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._invalidate_stored_token, token)
+
+    async def authenticate(self) -> Token:
+        """Perform authentication."""
+        token_store = self._token_store
+        if token_store is None:
+            return await self._request_token()
+
+        loop = asyncio.get_running_loop()
+
+        token = await loop.run_in_executor(None, self._get_stored_token, token_store)
+        if token is not None:
+            return token
+
+        token = await self._request_token()
+        await loop.run_in_executor(None, token_store.set, self._token_store_key, token)
+        return token
+
+    async def _request_token(self) -> Token:
+        path = self._TOKEN_ENDPOINT
+        data = self._form_data
+        headers = self._get_request_headers()
+
+        requested_at = time.time()
+
+        response = await self._client.post(
+            path, data=data, headers=headers, idempotent=True
+        )
+        return self._parse_token_response(response, requested_at)
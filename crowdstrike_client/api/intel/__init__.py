@@ -5,6 +5,25 @@ from crowdstrike_client.api.intel.actors import Actors
 from crowdstrike_client.api.intel.indicators import Indicators
 from crowdstrike_client.api.intel.reports import Reports
 from crowdstrike_client.api.intel.rules import Rules
+from crowdstrike_client.api.intel.rule_cache import AbcRuleCache, FileRuleCache
 from crowdstrike_client.api.intel.api import IntelAPI
+from crowdstrike_client.api.intel.async_actors import AsyncActors
+from crowdstrike_client.api.intel.async_indicators import AsyncIndicators
+from crowdstrike_client.api.intel.async_reports import AsyncReports
+from crowdstrike_client.api.intel.async_rules import AsyncRules
+from crowdstrike_client.api.intel.async_api import AsyncIntelAPI
 
-__all__ = ["Actors", "Indicators", "Reports", "Rules", "IntelAPI"]
+__all__ = [
+    "Actors",
+    "Indicators",
+    "Reports",
+    "Rules",
+    "AbcRuleCache",
+    "FileRuleCache",
+    "IntelAPI",
+    "AsyncActors",
+    "AsyncIndicators",
+    "AsyncReports",
+    "AsyncRules",
+    "AsyncIntelAPI",
+]
@@ -2,13 +2,16 @@
 """CrowdStrike Intel API actors module."""
 
 import logging
-from typing import Any, List, Mapping, Optional
+from typing import Any, List, Mapping, Optional, Sequence
 
-from crowdstrike_client.api.models import Response
+from crowdstrike_client.api.models import ParseMode, Response
 from crowdstrike_client.api.models.actor import Actor
 from crowdstrike_client.api.utils import (
     check_200_response,
+    map_concurrently,
+    query_all_offset_pages,
     remove_mapping_with_none_value,
+    split_query_values,
 )
 from crowdstrike_client.http.client import HTTPClient
 
@@ -20,11 +23,20 @@ class Actors:
     _COMBINED_ENDPOINT = "/intel/combined/actors/v1"
     _ENTITIES_ENDPOINT = "/intel/entities/actors/v1"
 
-    def __init__(self, client: HTTPClient) -> None:
-        """Initialize CrowdStrike Intel Actors API."""
+    _DEFAULT_MAX_WORKERS = 4
+    _DEFAULT_MAX_URL_BYTES = 8000
+
+    def __init__(
+        self, client: HTTPClient, parse_mode: ParseMode = ParseMode.VALIDATED
+    ) -> None:
+        """Initialize CrowdStrike Intel Actors API.
+
+        :param parse_mode: Default parse mode for the returned entities.
+        """
         self.log = logging.getLogger(__name__)
 
         self.client = client
+        self.parse_mode = parse_mode
 
     @staticmethod
     def _get_request_params(
@@ -79,6 +91,7 @@ class Actors:
         fql_filter: Optional[str] = None,
         q: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        parse_mode: Optional[ParseMode] = None,
     ) -> Response[Actor]:
         """Query list of actors that match provided FQL filters."""
         path = self._COMBINED_ENDPOINT
@@ -93,15 +106,116 @@ class Actors:
 
         response = self.client.get(path, params=params)
         check_200_response(response)
-        return Response.parse_http_response(response, Actor)
+        return Response.parse_http_response(
+            response, Actor, parse_mode or self.parse_mode
+        )
 
-    def get_entities(
-        self, ids: List[str], fields: Optional[List[str]] = None
+    def query_all_ids(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[str]:
+        """Query all actor IDs that match provided FQL filters.
+
+        The pages after the first one are fetched concurrently.
+        """
+        return query_all_offset_pages(
+            lambda page_offset, page_limit: self.query_ids(
+                offset=page_offset,
+                limit=page_limit,
+                sort=sort,
+                fql_filter=fql_filter,
+                q=q,
+            ),
+            offset,
+            limit,
+            max_workers,
+        )
+
+    def query_all_entities(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Response[Actor]:
+        """Query all actors that match provided FQL filters.
+
+        The pages after the first one are fetched concurrently.
+        """
+        return query_all_offset_pages(
+            lambda page_offset, page_limit: self.query_entities(
+                offset=page_offset,
+                limit=page_limit,
+                sort=sort,
+                fql_filter=fql_filter,
+                q=q,
+                fields=fields,
+                parse_mode=parse_mode,
+            ),
+            offset,
+            limit,
+            max_workers,
+        )
+
+    def _get_entities_chunk(
+        self,
+        ids: Sequence[str],
+        fields: Optional[List[str]],
+        parse_mode: Optional[ParseMode],
     ) -> Response[Actor]:
-        """Get list of specific actors using their IDs."""
         path = self._ENTITIES_ENDPOINT
-        params = self._get_request_params(ids=ids, fields=fields)
+        params = self._get_request_params(ids=list(ids), fields=fields)
 
         response = self.client.get(path, params=params)
         check_200_response(response)
-        return Response.parse_http_response(response, Actor)
+        return Response.parse_http_response(
+            response, Actor, parse_mode or self.parse_mode
+        )
+
+    def get_entities(
+        self,
+        ids: List[str],
+        fields: Optional[List[str]] = None,
+        parse_mode: Optional[ParseMode] = None,
+        max_url_bytes: int = _DEFAULT_MAX_URL_BYTES,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[Actor]:
+        """Get list of specific actors using their IDs.
+
+        IDs are passed in the query string, so they are split into batches
+        whose request URL fits in max_url_bytes, with up to max_workers
+        requests in flight, and the responses are merged in the order of the
+        IDs.
+        """
+        chunks = split_query_values(
+            self.client.base_url + self._ENTITIES_ENDPOINT,
+            self._get_request_params(fields=fields),
+            "ids",
+            ids,
+            max_url_bytes,
+        )
+        if len(chunks) <= 1:
+            return self._get_entities_chunk(ids, fields, parse_mode)
+
+        self.log.debug(
+            "Getting %d actors in %d chunks with %d workers",
+            len(ids),
+            len(chunks),
+            max_workers,
+        )
+
+        responses = map_concurrently(
+            lambda chunk: self._get_entities_chunk(chunk, fields, parse_mode),
+            chunks,
+            max_workers,
+        )
+        return Response.merge(responses)
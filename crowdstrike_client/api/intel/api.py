@@ -8,6 +8,7 @@ from crowdstrike_client.api.intel.actors import Actors
 from crowdstrike_client.api.intel.indicators import Indicators
 from crowdstrike_client.api.intel.reports import Reports
 from crowdstrike_client.api.intel.rules import Rules
+from crowdstrike_client.api.models import ParseMode
 from crowdstrike_client.http.client import HTTPClient
 
 
@@ -19,31 +20,37 @@ class IntelAPI:
     _reports: Optional[Reports] = None
     _rules: Optional[Rules] = None
 
-    def __init__(self, client: HTTPClient) -> None:
-        """Initialize CrowdStrike Intel API."""
+    def __init__(
+        self, client: HTTPClient, parse_mode: ParseMode = ParseMode.VALIDATED
+    ) -> None:
+        """Initialize CrowdStrike Intel API.
+
+        :param parse_mode: Default parse mode for the returned entities.
+        """
         self.log = logging.getLogger(__name__)
 
         self.client = client
+        self.parse_mode = parse_mode
 
     @property
     def actors(self) -> Actors:
         """CrowdStrike Intel Actors API."""
         if self._actors is None:
-            self._actors = Actors(self.client)
+            self._actors = Actors(self.client, self.parse_mode)
         return self._actors
 
     @property
     def indicators(self) -> Indicators:
         """CrowdStrike Intel Indicators API."""
         if self._indicators is None:
-            self._indicators = Indicators(self.client)
+            self._indicators = Indicators(self.client, self.parse_mode)
         return self._indicators
 
     @property
     def reports(self) -> Reports:
         """CrowdStrike Intel Reports API."""
         if self._reports is None:
-            self._reports = Reports(self.client)
+            self._reports = Reports(self.client, self.parse_mode)
         return self._reports
 
     @property
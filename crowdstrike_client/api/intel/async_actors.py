@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike Intel API asynchronous actors module."""
+
+import logging
+from typing import List, Optional, Sequence
+
+from crowdstrike_client.api.intel.actors import Actors
+from crowdstrike_client.api.models import ParseMode, Response
+from crowdstrike_client.api.models.actor import Actor
+from crowdstrike_client.api.utils import (
+    check_200_response,
+    gather_concurrently,
+    query_all_offset_pages_async,
+    split_query_values,
+)
+from crowdstrike_client.http.async_client import AsyncHTTPClient
+
+
+class AsyncActors:
+    """CrowdStrike Intel Actors asynchronous API."""
+
+    _QUERIES_ENDPOINT = Actors._QUERIES_ENDPOINT
+    _COMBINED_ENDPOINT = Actors._COMBINED_ENDPOINT
+    _ENTITIES_ENDPOINT = Actors._ENTITIES_ENDPOINT
+
+    _DEFAULT_MAX_WORKERS = Actors._DEFAULT_MAX_WORKERS
+    _DEFAULT_MAX_URL_BYTES = Actors._DEFAULT_MAX_URL_BYTES
+
+    _get_request_params = staticmethod(Actors._get_request_params)
+
+    def __init__(
+        self, client: AsyncHTTPClient, parse_mode: ParseMode = ParseMode.VALIDATED
+    ) -> None:
+        """Initialize CrowdStrike Intel Actors asynchronous API.
+
+        :param parse_mode: Default parse mode for the returned entities.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self.client = client
+        self.parse_mode = parse_mode
+
+    async def query_ids(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+    ) -> Response[str]:
+        """Query list of actor IDs that match provided FQL filters."""
+        path = self._QUERIES_ENDPOINT
+        params = self._get_request_params(
+            offset=offset, limit=limit, sort=sort, fql_filter=fql_filter, q=q
+        )
+
+        response = await self.client.get(path, params=params)
+        check_200_response(response)
+        return Response.parse_http_response(response, str)
+
+    async def query_entities(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Response[Actor]:
+        """Query list of actors that match provided FQL filters."""
+        path = self._COMBINED_ENDPOINT
+        params = self._get_request_params(
+            offset=offset,
+            limit=limit,
+            sort=sort,
+            fql_filter=fql_filter,
+            q=q,
+            fields=fields,
+        )
+
+        response = await self.client.get(path, params=params)
+        check_200_response(response)
+        return Response.parse_http_response(
+            response, Actor, parse_mode or self.parse_mode
+        )
+
+    async def query_all_ids(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[str]:
+        """Query all actor IDs that match provided FQL filters.
+
+        The pages after the first one are fetched concurrently.
+        """
+        return await query_all_offset_pages_async(
+            lambda page_offset, page_limit: self.query_ids(
+                offset=page_offset,
+                limit=page_limit,
+                sort=sort,
+                fql_filter=fql_filter,
+                q=q,
+            ),
+            offset,
+            limit,
+            max_workers,
+        )
+
+    async def query_all_entities(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Response[Actor]:
+        """Query all actors that match provided FQL filters.
+
+        The pages after the first one are fetched concurrently.
+        """
+        return await query_all_offset_pages_async(
+            lambda page_offset, page_limit: self.query_entities(
+                offset=page_offset,
+                limit=page_limit,
+                sort=sort,
+                fql_filter=fql_filter,
+                q=q,
+                fields=fields,
+                parse_mode=parse_mode,
+            ),
+            offset,
+            limit,
+            max_workers,
+        )
+
+    async def _get_entities_chunk(
+        self,
+        ids: Sequence[str],
+        fields: Optional[List[str]],
+        parse_mode: Optional[ParseMode],
+    ) -> Response[Actor]:
+        path = self._ENTITIES_ENDPOINT
+        params = self._get_request_params(ids=list(ids), fields=fields)
+
+        response = await self.client.get(path, params=params)
+        check_200_response(response)
+        return Response.parse_http_response(
+            response, Actor, parse_mode or self.parse_mode
+        )
+
+    async def get_entities(
+        self,
+        ids: List[str],
+        fields: Optional[List[str]] = None,
+        parse_mode: Optional[ParseMode] = None,
+        max_url_bytes: int = _DEFAULT_MAX_URL_BYTES,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[Actor]:
+        """Get list of specific actors using their IDs.
+
+        IDs are passed in the query string, so they are split into batches
+        whose request URL fits in max_url_bytes, with up to max_workers
+        requests in flight, and the responses are merged in the order of the
+        IDs.
+        """
+        chunks = split_query_values(
+            self.client.base_url + self._ENTITIES_ENDPOINT,
+            self._get_request_params(fields=fields),
+            "ids",
+            ids,
+            max_url_bytes,
+        )
+        if len(chunks) <= 1:
+            return await self._get_entities_chunk(ids, fields, parse_mode)
+
+        responses = await gather_concurrently(
+            lambda chunk: self._get_entities_chunk(chunk, fields, parse_mode),
+            chunks,
+            max_workers,
+        )
+        return Response.merge(responses)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike Intel API asynchronous api module."""
+
+import logging
+from typing import Optional
+
+from crowdstrike_client.api.intel.async_actors import AsyncActors
+from crowdstrike_client.api.intel.async_indicators import AsyncIndicators
+from crowdstrike_client.api.intel.async_reports import AsyncReports
+from crowdstrike_client.api.intel.async_rules import AsyncRules
+from crowdstrike_client.api.models import ParseMode
+from crowdstrike_client.http.async_client import AsyncHTTPClient
+
+
+class AsyncIntelAPI:
+    """CrowdStrike Intel asynchronous API."""
+
+    _actors: Optional[AsyncActors] = None
+    _indicators: Optional[AsyncIndicators] = None
+    _reports: Optional[AsyncReports] = None
+    _rules: Optional[AsyncRules] = None
+
+    def __init__(
+        self, client: AsyncHTTPClient, parse_mode: ParseMode = ParseMode.VALIDATED
+    ) -> None:
+        """Initialize CrowdStrike Intel asynchronous API.
+
+        :param parse_mode: Default parse mode for the returned entities.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self.client = client
+        self.parse_mode = parse_mode
+
+    @property
+    def actors(self) -> AsyncActors:
+        """CrowdStrike Intel Actors asynchronous API."""
+        if self._actors is None:
+            self._actors = AsyncActors(self.client, self.parse_mode)
+        return self._actors
+
+    @property
+    def indicators(self) -> AsyncIndicators:
+        """CrowdStrike Intel Indicators asynchronous API."""
+        if self._indicators is None:
+            self._indicators = AsyncIndicators(self.client, self.parse_mode)
+        return self._indicators
+
+    @property
+    def reports(self) -> AsyncReports:
+        """CrowdStrike Intel Reports asynchronous API."""
+        if self._reports is None:
+            self._reports = AsyncReports(self.client, self.parse_mode)
+        return self._reports
+
+    @property
+    def rules(self) -> AsyncRules:
+        """CrowdStrike Intel Rules asynchronous API."""
+        if self._rules is None:
+            self._rules = AsyncRules(self.client)
+        return self._rules
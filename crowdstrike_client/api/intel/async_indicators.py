@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike Intel API asynchronous indicators module."""
+
+import logging
+from typing import Any, AsyncIterator, List, Mapping, Optional, Sequence, Type, TypeVar
+
+from crowdstrike_client.api.intel.indicators import Indicators
+from crowdstrike_client.api.models import ParseMode, Response
+from crowdstrike_client.api.models.indicator import Indicator
+from crowdstrike_client.api.models.response import parse_next_page_params
+from crowdstrike_client.api.utils import (
+    check_200_response,
+    gather_concurrently,
+    split_into_chunks,
+)
+from crowdstrike_client.http.async_client import AsyncHTTPClient
+
+
+T = TypeVar("T")
+
+
+class AsyncIndicators:
+    """CrowdStrike Intel Indicators asynchronous API."""
+
+    _QUERIES_ENDPOINT = Indicators._QUERIES_ENDPOINT
+    _COMBINED_ENDPOINT = Indicators._COMBINED_ENDPOINT
+    _ENTITIES_ENDPOINT = Indicators._ENTITIES_ENDPOINT
+
+    _DEFAULT_MAX_WORKERS = Indicators._DEFAULT_MAX_WORKERS
+    _DEFAULT_ENTITIES_CHUNK_SIZE = Indicators._DEFAULT_ENTITIES_CHUNK_SIZE
+
+    _get_request_params = staticmethod(Indicators._get_request_params)
+
+    def __init__(
+        self, client: AsyncHTTPClient, parse_mode: ParseMode = ParseMode.VALIDATED
+    ) -> None:
+        """Initialize CrowdStrike Intel Indicators asynchronous API.
+
+        :param parse_mode: Default parse mode for the returned entities.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self.client = client
+        self.parse_mode = parse_mode
+
+    async def query_ids(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+        deep_pagination: bool = False,
+    ) -> Response[str]:
+        """Query list of indicator IDs that match provided FQL filters."""
+        params = self._get_request_params(
+            offset, limit, sort, fql_filter, q, include_deleted, deep_pagination
+        )
+
+        path = self._QUERIES_ENDPOINT
+        response = await self.client.get(path, params=params)
+        check_200_response(response)
+        return Response.parse_http_response(response, str)
+
+    async def query_entities(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+        deep_pagination: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Response[Indicator]:
+        """Query list of indicators that match provided FQL filters."""
+        params = self._get_request_params(
+            offset, limit, sort, fql_filter, q, include_deleted, deep_pagination
+        )
+
+        path = self._COMBINED_ENDPOINT
+        response = await self.client.get(path, params=params)
+        check_200_response(response)
+        return Response.parse_http_response(
+            response, Indicator, parse_mode or self.parse_mode
+        )
+
+    async def _get_entities_chunk(
+        self, ids: Sequence[str], parse_mode: Optional[ParseMode]
+    ) -> Response[Indicator]:
+        path = self._ENTITIES_ENDPOINT
+        data = {"ids": list(ids)}
+
+        response = await self.client.post(path, json=data, idempotent=True)
+        check_200_response(response)
+        return Response.parse_http_response(
+            response, Indicator, parse_mode or self.parse_mode
+        )
+
+    async def get_entities(
+        self,
+        ids: List[str],
+        parse_mode: Optional[ParseMode] = None,
+        chunk_size: int = _DEFAULT_ENTITIES_CHUNK_SIZE,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[Indicator]:
+        """Get list of specific indicators using their IDs.
+
+        IDs are requested in chunks of at most chunk_size, with up to
+        max_workers requests in flight, and the responses are merged in the
+        order of the IDs.
+        """
+        chunks = split_into_chunks(ids, chunk_size)
+        if len(chunks) <= 1:
+            return await self._get_entities_chunk(ids, parse_mode)
+
+        responses = await gather_concurrently(
+            lambda chunk: self._get_entities_chunk(chunk, parse_mode),
+            chunks,
+            max_workers,
+        )
+        return Response.merge(responses)
+
+    async def _iter_pages(
+        self,
+        path: str,
+        resource_type: Type[T],
+        params: Optional[Mapping[str, Any]],
+        parse_mode: Optional[ParseMode] = None,
+    ) -> AsyncIterator[Response[T]]:
+        while True:
+            response = await self.client.get(path, params=params)
+            check_200_response(response)
+            page = Response.parse_http_response(
+                response, resource_type, parse_mode or self.parse_mode
+            )
+
+            yield page
+
+            next_page_params = page.get_next_page_params()
+            if next_page_params is None or not page.resources:
+                return
+
+            params = next_page_params
+
+    def iter_id_pages(
+        self,
+        limit: Optional[int] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+    ) -> AsyncIterator[Response[str]]:
+        """Iterate over all pages of indicator IDs using deep pagination."""
+        params = self._get_request_params(
+            limit=limit,
+            fql_filter=fql_filter,
+            q=q,
+            include_deleted=include_deleted,
+            deep_pagination=True,
+        )
+        return self._iter_pages(self._QUERIES_ENDPOINT, str, params)
+
+    async def iter_ids(
+        self,
+        limit: Optional[int] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+    ) -> AsyncIterator[str]:
+        """Iterate over all indicator IDs using deep pagination."""
+        async for page in self.iter_id_pages(limit, fql_filter, q, include_deleted):
+            for resource in page.resources:
+                yield resource
+
+    def iter_entity_pages(
+        self,
+        limit: Optional[int] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+        parse_mode: Optional[ParseMode] = None,
+        next_page: Optional[str] = None,
+    ) -> AsyncIterator[Response[Indicator]]:
+        """Iterate over all pages of indicators using deep pagination.
+
+        :param next_page: Next page value of an earlier page to resume from,
+            the query arguments are ignored if provided.
+        """
+        if next_page is not None:
+            params = parse_next_page_params(next_page)
+        else:
+            params = self._get_request_params(
+                limit=limit,
+                fql_filter=fql_filter,
+                q=q,
+                include_deleted=include_deleted,
+                deep_pagination=True,
+            )
+        return self._iter_pages(self._COMBINED_ENDPOINT, Indicator, params, parse_mode)
+
+    async def iter_entities(
+        self,
+        limit: Optional[int] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> AsyncIterator[Indicator]:
+        """Iterate over all indicators using deep pagination."""
+        pages = self.iter_entity_pages(
+            limit, fql_filter, q, include_deleted, parse_mode
+        )
+        async for page in pages:
+            for resource in page.resources:
+                yield resource
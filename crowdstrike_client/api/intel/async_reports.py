@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike Intel API asynchronous reports module."""
+
+import logging
+from typing import List, Optional, Sequence
+
+from crowdstrike_client.api.exceptions import CrowdStrikeException
+from crowdstrike_client.api.intel.reports import Reports
+from crowdstrike_client.api.models import ParseMode, Response
+from crowdstrike_client.api.models.download import Download
+from crowdstrike_client.api.models.report import Report
+from crowdstrike_client.api.utils import (
+    check_200_response,
+    gather_concurrently,
+    log_error_response,
+    query_all_offset_pages_async,
+    split_query_values,
+)
+from crowdstrike_client.http.async_client import AsyncHTTPClient
+
+
+class AsyncReports:
+    """CrowdStrike Intel Reports asynchronous API."""
+
+    _QUERIES_ENDPOINT = Reports._QUERIES_ENDPOINT
+    _COMBINED_ENDPOINT = Reports._COMBINED_ENDPOINT
+    _ENTITIES_ENDPOINT = Reports._ENTITIES_ENDPOINT
+    _FILES_ENDPOINT = Reports._FILES_ENDPOINT
+
+    _HEADER_ACCEPT = Reports._HEADER_ACCEPT
+
+    _MIME_APPLICATION_OCTET_STREAM = Reports._MIME_APPLICATION_OCTET_STREAM
+
+    _DEFAULT_MAX_WORKERS = Reports._DEFAULT_MAX_WORKERS
+    _DEFAULT_MAX_URL_BYTES = Reports._DEFAULT_MAX_URL_BYTES
+
+    _get_request_params = staticmethod(Reports._get_request_params)
+
+    def __init__(
+        self, client: AsyncHTTPClient, parse_mode: ParseMode = ParseMode.VALIDATED
+    ) -> None:
+        """Initialize CrowdStrike Intel Reports asynchronous API.
+
+        :param parse_mode: Default parse mode for the returned entities.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self.client = client
+        self.parse_mode = parse_mode
+
+    async def query_ids(
+        self,
+        q: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+    ) -> Response[str]:
+        """Query list of report IDs that match provided FQL filters."""
+        path = self._QUERIES_ENDPOINT
+        params = self._get_request_params(
+            offset=offset, limit=limit, sort=sort, fql_filter=fql_filter, q=q
+        )
+
+        response = await self.client.get(path, params=params)
+        check_200_response(response)
+        return Response.parse_http_response(response, str)
+
+    async def query_entities(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Response[Report]:
+        """Query list of reports that match provided FQL filters."""
+        path = self._COMBINED_ENDPOINT
+        params = self._get_request_params(
+            offset=offset,
+            limit=limit,
+            sort=sort,
+            fql_filter=fql_filter,
+            q=q,
+            fields=fields,
+        )
+
+        response = await self.client.get(path, params=params)
+        check_200_response(response)
+        return Response.parse_http_response(
+            response, Report, parse_mode or self.parse_mode
+        )
+
+    async def query_all_ids(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[str]:
+        """Query all report IDs that match provided FQL filters.
+
+        The pages after the first one are fetched concurrently.
+        """
+        return await query_all_offset_pages_async(
+            lambda page_offset, page_limit: self.query_ids(
+                offset=page_offset,
+                limit=page_limit,
+                sort=sort,
+                fql_filter=fql_filter,
+                q=q,
+            ),
+            offset,
+            limit,
+            max_workers,
+        )
+
+    async def query_all_entities(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Response[Report]:
+        """Query all reports that match provided FQL filters.
+
+        The pages after the first one are fetched concurrently.
+        """
+        return await query_all_offset_pages_async(
+            lambda page_offset, page_limit: self.query_entities(
+                offset=page_offset,
+                limit=page_limit,
+                sort=sort,
+                fql_filter=fql_filter,
+                q=q,
+                fields=fields,
+                parse_mode=parse_mode,
+            ),
+            offset,
+            limit,
+            max_workers,
+        )
+
+    async def _get_entities_chunk(
+        self,
+        ids: Sequence[str],
+        fields: Optional[List[str]],
+        parse_mode: Optional[ParseMode],
+    ) -> Response[Report]:
+        path = self._ENTITIES_ENDPOINT
+        params = self._get_request_params(ids=list(ids), fields=fields)
+
+        response = await self.client.get(path, params=params)
+        check_200_response(response)
+        return Response.parse_http_response(
+            response, Report, parse_mode or self.parse_mode
+        )
+
+    async def get_entities(
+        self,
+        ids: List[str],
+        fields: Optional[List[str]] = None,
+        parse_mode: Optional[ParseMode] = None,
+        max_url_bytes: int = _DEFAULT_MAX_URL_BYTES,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[Report]:
+        """Get list of specific reports using their IDs.
+
+        IDs are passed in the query string, so they are split into batches
+        whose request URL fits in max_url_bytes, with up to max_workers
+        requests in flight, and the responses are merged in the order of the
+        IDs.
+        """
+        chunks = split_query_values(
+            self.client.base_url + self._ENTITIES_ENDPOINT,
+            self._get_request_params(fields=fields),
+            "ids",
+            ids,
+            max_url_bytes,
+        )
+        if len(chunks) <= 1:
+            return await self._get_entities_chunk(ids, fields, parse_mode)
+
+        responses = await gather_concurrently(
+            lambda chunk: self._get_entities_chunk(chunk, fields, parse_mode),
+            chunks,
+            max_workers,
+        )
+        return Response.merge(responses)
+
+    async def get_pdf(self, report_id: str) -> Optional[Download]:
+        """Get report as PDF."""
+        path = self._FILES_ENDPOINT
+        headers = {self._HEADER_ACCEPT: self._MIME_APPLICATION_OCTET_STREAM}
+        params = self._get_request_params(report_id=report_id)
+
+        response = await self.client.get(path, params=params, headers=headers)
+
+        status_code = response.status_code
+        if status_code == 200:
+            return Download.parse_http_response(response)
+        elif status_code == 404:
+            self.log.info("No report file for '%s'", report_id)
+            return None
+        else:
+            log_error_response(self.log, response)
+            raise CrowdStrikeException(
+                f"API call failed with status code {status_code}"
+            )
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike Intel API asynchronous rules module."""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+from crowdstrike_client.api.intel.rule_cache import AbcRuleCache
+from crowdstrike_client.api.intel.rules import Rules
+from crowdstrike_client.api.models.download import Download
+from crowdstrike_client.api.utils import check_200_response
+from crowdstrike_client.http.async_client import AsyncHTTPClient
+
+
+class AsyncRules:
+    """CrowdStrike Intel Rules asynchronous API.
+
+    Rule cache calls, which may block on file I/O, run in the default
+    executor.
+    """
+
+    _LATEST_FILES_ENDPOINT = Rules._LATEST_FILES_ENDPOINT
+
+    _PARAM_TYPE = Rules._PARAM_TYPE
+
+    _DEFAULT_SPOOL_THRESHOLD = Rules._DEFAULT_SPOOL_THRESHOLD
+
+    _get_request_headers = Rules._get_request_headers
+
+    def __init__(self, client: AsyncHTTPClient) -> None:
+        """Initialize CrowdStrike Intel Rules asynchronous API."""
+        self.log = logging.getLogger(__name__)
+
+        self.client = client
+
+    async def get_latest_file(
+        self,
+        rule_set_type: str,
+        e_tag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+        cache: Optional[AbcRuleCache] = None,
+        spool_threshold: Optional[int] = _DEFAULT_SPOOL_THRESHOLD,
+    ) -> Optional[Download]:
+        """Get the latest rule set as ZIP.
+
+        :param e_tag: ETag of a previous download, None is returned if the
+            rule set has not changed since.
+        :param last_modified: Last-Modified of a previous download, used like
+            e_tag.
+        :param cache: Rule set cache. The cached rule set is revalidated and
+            returned if it has not changed, and a changed one is cached, so
+            that polling only downloads new rule sets.
+        :param spool_threshold: Size in bytes above which the rule set is
+            spooled to a temporary file rather than held in memory, all of it
+            is held in memory if None.
+        """
+        loop = asyncio.get_running_loop()
+
+        cached: Optional[Download] = None
+        if cache is not None and e_tag is None and last_modified is None:
+            cached = await loop.run_in_executor(None, cache.get, rule_set_type)
+            if cached is not None:
+                e_tag = cached.e_tag
+                last_modified = cached.last_modified
+
+        path = self._LATEST_FILES_ENDPOINT
+        headers = self._get_request_headers(e_tag, last_modified)
+        params = {self._PARAM_TYPE: rule_set_type}
+
+        response = await self.client.get(path, params=params, headers=headers)
+        if response.status_code == 304:
+            self.log.debug("Rule set '%s' not modified", rule_set_type)
+            return cached
+
+        if cached is not None:
+            cached.close()
+
+        check_200_response(response)
+        download = Download.parse_http_response(response, spool_threshold)
+
+        if cache is not None:
+            await loop.run_in_executor(None, cache.set, rule_set_type, download)
+
+        return download
@@ -2,17 +2,24 @@
 """CrowdStrike Intel API indicators module."""
 
 import logging
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterator, List, Mapping, Optional, Sequence, Type, TypeVar
 
-from crowdstrike_client.api.models import Response
+from crowdstrike_client.api.models import ParseMode, Response
 from crowdstrike_client.api.models.indicator import Indicator
+from crowdstrike_client.api.models.response import parse_next_page_params
+from crowdstrike_client.api.models.stream import StreamingResponse
 from crowdstrike_client.api.utils import (
     check_200_response,
+    map_concurrently,
     remove_mapping_with_none_value,
+    split_into_chunks,
 )
 from crowdstrike_client.http.client import HTTPClient
 
 
+T = TypeVar("T")
+
+
 class Indicators:
     """CrowdStrike Intel Indicators API."""
 
@@ -22,11 +29,20 @@ class Indicators:
 
     _SORT_DEEP_PAGINATION = "_marker"
 
-    def __init__(self, client: HTTPClient) -> None:
-        """Initialize CrowdStrike Intel Indicators API."""
+    _DEFAULT_MAX_WORKERS = 4
+    _DEFAULT_ENTITIES_CHUNK_SIZE = 1000
+
+    def __init__(
+        self, client: HTTPClient, parse_mode: ParseMode = ParseMode.VALIDATED
+    ) -> None:
+        """Initialize CrowdStrike Intel Indicators API.
+
+        :param parse_mode: Default parse mode for the returned entities.
+        """
         self.log = logging.getLogger(__name__)
 
         self.client = client
+        self.parse_mode = parse_mode
 
     @staticmethod
     def _get_request_params(
@@ -92,6 +108,7 @@ class Indicators:
         q: Optional[str] = None,
         include_deleted: Optional[bool] = None,
         deep_pagination: bool = False,
+        parse_mode: Optional[ParseMode] = None,
     ) -> Response[Indicator]:
         """Query list of indicators that match provided FQL filters."""
         params = self._get_request_params(
@@ -101,13 +118,199 @@ class Indicators:
         path = self._COMBINED_ENDPOINT
         response = self.client.get(path, params=params)
         check_200_response(response)
-        return Response.parse_http_response(response, Indicator)
+        return Response.parse_http_response(
+            response, Indicator, parse_mode or self.parse_mode
+        )
+
+    def _get_streaming_response(
+        self,
+        path: str,
+        params: Optional[Mapping[str, Any]],
+        parse_mode: Optional[ParseMode] = None,
+    ) -> StreamingResponse[Indicator]:
+        response = self.client.get(path, params=params, stream=True)
+        check_200_response(response)
+        return StreamingResponse.parse_http_response(
+            response, Indicator, parse_mode or self.parse_mode
+        )
 
-    def get_entities(self, ids: List[str]) -> Response[Indicator]:
-        """Get list of specific indicators using their IDs."""
+    def stream_entities(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+        deep_pagination: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> StreamingResponse[Indicator]:
+        """Query list of indicators, decoding them as they are received."""
+        params = self._get_request_params(
+            offset, limit, sort, fql_filter, q, include_deleted, deep_pagination
+        )
+
+        return self._get_streaming_response(self._COMBINED_ENDPOINT, params, parse_mode)
+
+    def _get_entities_chunk(
+        self, ids: Sequence[str], parse_mode: Optional[ParseMode]
+    ) -> Response[Indicator]:
         path = self._ENTITIES_ENDPOINT
-        data = {"ids": ids}
+        data = {"ids": list(ids)}
 
-        response = self.client.post(path, json=data)
+        response = self.client.post(path, json=data, idempotent=True)
         check_200_response(response)
-        return Response.parse_http_response(response, Indicator)
+        return Response.parse_http_response(
+            response, Indicator, parse_mode or self.parse_mode
+        )
+
+    def get_entities(
+        self,
+        ids: List[str],
+        parse_mode: Optional[ParseMode] = None,
+        chunk_size: int = _DEFAULT_ENTITIES_CHUNK_SIZE,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[Indicator]:
+        """Get list of specific indicators using their IDs.
+
+        IDs are requested in chunks of at most chunk_size, with up to
+        max_workers requests in flight, and the responses are merged in the
+        order of the IDs.
+        """
+        chunks = split_into_chunks(ids, chunk_size)
+        if len(chunks) <= 1:
+            return self._get_entities_chunk(ids, parse_mode)
+
+        self.log.debug(
+            "Getting %d indicators in %d chunks with %d workers",
+            len(ids),
+            len(chunks),
+            max_workers,
+        )
+
+        responses = map_concurrently(
+            lambda chunk: self._get_entities_chunk(chunk, parse_mode),
+            chunks,
+            max_workers,
+        )
+        return Response.merge(responses)
+
+    def _iter_pages(
+        self,
+        path: str,
+        resource_type: Type[T],
+        params: Optional[Mapping[str, Any]],
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Iterator[Response[T]]:
+        while True:
+            response = self.client.get(path, params=params)
+            check_200_response(response)
+            page = Response.parse_http_response(
+                response, resource_type, parse_mode or self.parse_mode
+            )
+
+            yield page
+
+            next_page_params = page.get_next_page_params()
+            if next_page_params is None or not page.resources:
+                return
+
+            params = next_page_params
+
+    def iter_id_pages(
+        self,
+        limit: Optional[int] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+    ) -> Iterator[Response[str]]:
+        """Iterate over all pages of indicator IDs using deep pagination."""
+        params = self._get_request_params(
+            limit=limit,
+            fql_filter=fql_filter,
+            q=q,
+            include_deleted=include_deleted,
+            deep_pagination=True,
+        )
+        return self._iter_pages(self._QUERIES_ENDPOINT, str, params)
+
+    def iter_ids(
+        self,
+        limit: Optional[int] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+    ) -> Iterator[str]:
+        """Iterate over all indicator IDs using deep pagination."""
+        for page in self.iter_id_pages(limit, fql_filter, q, include_deleted):
+            yield from page.resources
+
+    def iter_entity_pages(
+        self,
+        limit: Optional[int] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+        parse_mode: Optional[ParseMode] = None,
+        next_page: Optional[str] = None,
+    ) -> Iterator[Response[Indicator]]:
+        """Iterate over all pages of indicators using deep pagination.
+
+        :param next_page: Next page value of an earlier page to resume from,
+            the query arguments are ignored if provided.
+        """
+        if next_page is not None:
+            params = parse_next_page_params(next_page)
+        else:
+            params = self._get_request_params(
+                limit=limit,
+                fql_filter=fql_filter,
+                q=q,
+                include_deleted=include_deleted,
+                deep_pagination=True,
+            )
+        return self._iter_pages(self._COMBINED_ENDPOINT, Indicator, params, parse_mode)
+
+    def iter_entities(
+        self,
+        limit: Optional[int] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        include_deleted: Optional[bool] = None,
+        stream: bool = False,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Iterator[Indicator]:
+        """Iterate over all indicators using deep pagination.
+
+        :param stream: Decode indicators as they are received instead of
+            decoding whole pages, bounding memory use to a single indicator.
+        """
+        if not stream:
+            for page in self.iter_entity_pages(
+                limit, fql_filter, q, include_deleted, parse_mode
+            ):
+                yield from page.resources
+            return
+
+        path = self._COMBINED_ENDPOINT
+        params = self._get_request_params(
+            limit=limit,
+            fql_filter=fql_filter,
+            q=q,
+            include_deleted=include_deleted,
+            deep_pagination=True,
+        )
+
+        while True:
+            streaming_page = self._get_streaming_response(path, params, parse_mode)
+
+            count = 0
+            for indicator in streaming_page:
+                count += 1
+                yield indicator
+
+            next_page_params = streaming_page.get_next_page_params()
+            if next_page_params is None or not count:
+                return
+
+            params = next_page_params
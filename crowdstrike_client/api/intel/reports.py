@@ -2,16 +2,25 @@
 """CrowdStrike Intel API reports module."""
 
 import logging
-from typing import Any, List, Mapping, Optional
+from datetime import datetime
+from typing import Any, BinaryIO, List, Mapping, Optional, Sequence, Union
 
 from crowdstrike_client.api.exceptions import CrowdStrikeException
-from crowdstrike_client.api.models import Response
-from crowdstrike_client.api.models.download import Download
+from crowdstrike_client.api.models import ParseMode, Response
+from crowdstrike_client.api.models.download import (
+    Download,
+    ProgressCallback,
+    StreamedDownload,
+)
 from crowdstrike_client.api.models.report import Report
 from crowdstrike_client.api.utils import (
     check_200_response,
+    get_conditional_request_headers,
     log_error_response,
+    map_concurrently,
+    query_all_offset_pages,
     remove_mapping_with_none_value,
+    split_query_values,
 )
 from crowdstrike_client.http.client import HTTPClient
 
@@ -28,11 +37,21 @@ class Reports:
 
     _MIME_APPLICATION_OCTET_STREAM = "application/octet-stream"
 
-    def __init__(self, client: HTTPClient) -> None:
-        """Initialize CrowdStrike Intel Reports API."""
+    _DEFAULT_MAX_WORKERS = 4
+    _DEFAULT_MAX_URL_BYTES = 8000
+    _DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self, client: HTTPClient, parse_mode: ParseMode = ParseMode.VALIDATED
+    ) -> None:
+        """Initialize CrowdStrike Intel Reports API.
+
+        :param parse_mode: Default parse mode for the returned entities.
+        """
         self.log = logging.getLogger(__name__)
 
         self.client = client
+        self.parse_mode = parse_mode
 
     @staticmethod
     def _get_request_params(
@@ -89,6 +108,7 @@ class Reports:
         fql_filter: Optional[str] = None,
         q: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        parse_mode: Optional[ParseMode] = None,
     ) -> Response[Report]:
         """Query list of reports that match provided FQL filters."""
         path = self._COMBINED_ENDPOINT
@@ -103,18 +123,119 @@ class Reports:
 
         response = self.client.get(path, params=params)
         check_200_response(response)
-        return Response.parse_http_response(response, Report)
+        return Response.parse_http_response(
+            response, Report, parse_mode or self.parse_mode
+        )
 
-    def get_entities(
-        self, ids: List[str], fields: Optional[List[str]] = None
+    def query_all_ids(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[str]:
+        """Query all report IDs that match provided FQL filters.
+
+        The pages after the first one are fetched concurrently.
+        """
+        return query_all_offset_pages(
+            lambda page_offset, page_limit: self.query_ids(
+                offset=page_offset,
+                limit=page_limit,
+                sort=sort,
+                fql_filter=fql_filter,
+                q=q,
+            ),
+            offset,
+            limit,
+            max_workers,
+        )
+
+    def query_all_entities(
+        self,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        fql_filter: Optional[str] = None,
+        q: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> Response[Report]:
+        """Query all reports that match provided FQL filters.
+
+        The pages after the first one are fetched concurrently.
+        """
+        return query_all_offset_pages(
+            lambda page_offset, page_limit: self.query_entities(
+                offset=page_offset,
+                limit=page_limit,
+                sort=sort,
+                fql_filter=fql_filter,
+                q=q,
+                fields=fields,
+                parse_mode=parse_mode,
+            ),
+            offset,
+            limit,
+            max_workers,
+        )
+
+    def _get_entities_chunk(
+        self,
+        ids: Sequence[str],
+        fields: Optional[List[str]],
+        parse_mode: Optional[ParseMode],
     ) -> Response[Report]:
-        """Get list of specific reports using their IDs."""
         path = self._ENTITIES_ENDPOINT
-        params = self._get_request_params(ids=ids, fields=fields)
+        params = self._get_request_params(ids=list(ids), fields=fields)
 
         response = self.client.get(path, params=params)
         check_200_response(response)
-        return Response.parse_http_response(response, Report)
+        return Response.parse_http_response(
+            response, Report, parse_mode or self.parse_mode
+        )
+
+    def get_entities(
+        self,
+        ids: List[str],
+        fields: Optional[List[str]] = None,
+        parse_mode: Optional[ParseMode] = None,
+        max_url_bytes: int = _DEFAULT_MAX_URL_BYTES,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> Response[Report]:
+        """Get list of specific reports using their IDs.
+
+        IDs are passed in the query string, so they are split into batches
+        whose request URL fits in max_url_bytes, with up to max_workers
+        requests in flight, and the responses are merged in the order of the
+        IDs.
+        """
+        chunks = split_query_values(
+            self.client.base_url + self._ENTITIES_ENDPOINT,
+            self._get_request_params(fields=fields),
+            "ids",
+            ids,
+            max_url_bytes,
+        )
+        if len(chunks) <= 1:
+            return self._get_entities_chunk(ids, fields, parse_mode)
+
+        self.log.debug(
+            "Getting %d reports in %d chunks with %d workers",
+            len(ids),
+            len(chunks),
+            max_workers,
+        )
+
+        responses = map_concurrently(
+            lambda chunk: self._get_entities_chunk(chunk, fields, parse_mode),
+            chunks,
+            max_workers,
+        )
+        return Response.merge(responses)
 
     def get_pdf(self, report_id: str) -> Optional[Download]:
         """Get report as PDF."""
@@ -135,3 +256,64 @@ class Reports:
             raise CrowdStrikeException(
                 f"API call failed with status code {status_code}"
             )
+
+    @classmethod
+    def _get_file_request_headers(
+        cls, e_tag: Optional[str] = None, last_modified: Optional[datetime] = None
+    ) -> Mapping[str, str]:
+        headers = {cls._HEADER_ACCEPT: cls._MIME_APPLICATION_OCTET_STREAM}
+        headers.update(get_conditional_request_headers(e_tag, last_modified))
+        return headers
+
+    def download_pdf(
+        self,
+        report_id: str,
+        destination: Union[str, BinaryIO],
+        sha256: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = _DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        e_tag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+    ) -> Optional[StreamedDownload]:
+        """Download report as PDF, streaming it to a path or file object.
+
+        The content is written chunk by chunk as it is received, so memory use
+        does not depend on the size of the report. Return None if the report
+        has no file.
+
+        :param destination: File path or binary file object to write to.
+        :param sha256: Compute the SHA-256 digest of the content.
+        :param progress: Called after every chunk with the number of bytes
+            written so far and the total size, None if unknown.
+        :param chunk_size: Size of the chunks read from the response.
+        :param e_tag: ETag of a previous download, nothing is written and a
+            download flagged as not modified is returned if it still matches.
+        :param last_modified: Last-Modified of a previous download, used like
+            e_tag.
+        """
+        path = self._FILES_ENDPOINT
+        headers = self._get_file_request_headers(e_tag, last_modified)
+        params = self._get_request_params(report_id=report_id)
+
+        response = self.client.get(path, params=params, headers=headers, stream=True)
+
+        status_code = response.status_code
+        if status_code == 200:
+            return StreamedDownload.write_http_response(
+                response, destination, chunk_size, sha256=sha256, progress=progress
+            )
+
+        try:
+            if status_code == 304:
+                self.log.debug("Report file for '%s' not modified", report_id)
+                return StreamedDownload.parse_not_modified_http_response(response)
+            elif status_code == 404:
+                self.log.info("No report file for '%s'", report_id)
+                return None
+            else:
+                log_error_response(self.log, response)
+                raise CrowdStrikeException(
+                    f"API call failed with status code {status_code}"
+                )
+        finally:
+            response.close()
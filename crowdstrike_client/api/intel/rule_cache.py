@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike Intel API rule set cache module."""
+
+import contextlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import BinaryIO, Iterator, Optional
+
+from crowdstrike_client.api.models.base import Base
+from crowdstrike_client.api.models.download import Download
+
+
+class AbcRuleCache(ABC):
+    """Abstract rule set cache interface."""
+
+    @abstractmethod
+    def get(self, rule_set_type: str) -> Optional[Download]:
+        """Get the cached rule set, None if there is none."""
+
+    @abstractmethod
+    def set(self, rule_set_type: str, download: Download) -> None:
+        """Cache a rule set."""
+
+    @abstractmethod
+    def delete(self, rule_set_type: str) -> None:
+        """Delete a cached rule set."""
+
+
+class _CachedRuleSet(Base):
+    filename: Optional[str] = None
+    e_tag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+
+
+class FileRuleCache(AbcRuleCache):
+    """File rule set cache.
+
+    Every rule set type is kept as a ZIP file and a JSON file with its
+    filename, ETag and Last-Modified. Both are replaced atomically, the ZIP
+    file first, so after a crash the metadata never describes a newer rule
+    set than the cached one.
+    """
+
+    _ZIP_SUFFIX = ".zip"
+    _METADATA_SUFFIX = ".json"
+
+    _REGEX_RULE_SET_TYPE = re.compile(r"^[\w.-]+$")
+
+    def __init__(self, directory: str) -> None:
+        """Initialize file rule set cache.
+
+        :param directory: Cache directory.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self._directory = directory
+
+    @property
+    def directory(self) -> str:
+        """Cache directory."""
+        return self._directory
+
+    def _get_path(self, rule_set_type: str, suffix: str) -> str:
+        if not self._REGEX_RULE_SET_TYPE.match(rule_set_type):
+            raise ValueError(f"Invalid rule set type: '{rule_set_type}'")
+        return os.path.join(self._directory, rule_set_type + suffix)
+
+    @contextlib.contextmanager
+    def _replace(self, path: str) -> Iterator[BinaryIO]:
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=".rules-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def get(self, rule_set_type: str) -> Optional[Download]:
+        """Get the cached rule set, None if there is none.
+
+        The rule set is read from the cache file, close it when done.
+        """
+        zip_path = self._get_path(rule_set_type, self._ZIP_SUFFIX)
+        metadata_path = self._get_path(rule_set_type, self._METADATA_SUFFIX)
+
+        try:
+            metadata = _CachedRuleSet.parse_file(metadata_path)
+            # The file stays readable after it is replaced by a newer rule set.
+            content = open(zip_path, "rb")
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            self.log.warning("Ignoring corrupt cached rule set '%s'", rule_set_type)
+            return None
+
+        return Download(
+            content=content,
+            filename=metadata.filename,
+            e_tag=metadata.e_tag,
+            last_modified=metadata.last_modified,
+        )
+
+    def set(self, rule_set_type: str, download: Download) -> None:
+        """Cache a rule set."""
+        zip_path = self._get_path(rule_set_type, self._ZIP_SUFFIX)
+        metadata_path = self._get_path(rule_set_type, self._METADATA_SUFFIX)
+
+        metadata = _CachedRuleSet(
+            filename=download.filename,
+            e_tag=download.e_tag,
+            last_modified=download.last_modified,
+        )
+
+        os.makedirs(self._directory, exist_ok=True)
+
+        content = download.content
+        position = content.tell()
+        try:
+            content.seek(0)
+            with self._replace(zip_path) as f:
+                shutil.copyfileobj(content, f)
+        finally:
+            content.seek(position)
+
+        with self._replace(metadata_path) as f:
+            f.write(metadata.json().encode("utf-8"))
+
+    def delete(self, rule_set_type: str) -> None:
+        """Delete a cached rule set."""
+        for suffix in (self._METADATA_SUFFIX, self._ZIP_SUFFIX):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._get_path(rule_set_type, suffix))
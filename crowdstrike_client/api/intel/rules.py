@@ -3,11 +3,14 @@
 
 import logging
 from datetime import datetime
-from email.utils import format_datetime
 from typing import Mapping, Optional
 
+from crowdstrike_client.api.intel.rule_cache import AbcRuleCache
 from crowdstrike_client.api.models.download import Download
-from crowdstrike_client.api.utils import check_200_response
+from crowdstrike_client.api.utils import (
+    check_200_response,
+    get_conditional_request_headers,
+)
 from crowdstrike_client.http.client import HTTPClient
 
 
@@ -17,13 +20,13 @@ class Rules:
     _LATEST_FILES_ENDPOINT = "/intel/entities/rules-latest-files/v1"
 
     _HEADER_ACCEPT = "Accept"
-    _HEADER_IF_NONE_MATCH = "If-None-Match"
-    _HEADER_IF_MODIFIED_SINCE = "If-Modified-Since"
 
     _MIME_APPLICATION_ZIP = "application/zip"
 
     _PARAM_TYPE = "type"
 
+    _DEFAULT_SPOOL_THRESHOLD = 8 * 1024 * 1024
+
     def __init__(self, client: HTTPClient) -> None:
         """Initialize CrowdStrike Intel Rules API."""
         self.log = logging.getLogger(__name__)
@@ -35,29 +38,56 @@ class Rules:
         cls, e_tag: Optional[str] = None, last_modified: Optional[datetime] = None
     ) -> Mapping[str, str]:
         headers = {cls._HEADER_ACCEPT: cls._MIME_APPLICATION_ZIP}
-
-        if e_tag is not None:
-            headers[cls._HEADER_IF_NONE_MATCH] = f'"{e_tag}"'
-
-        if last_modified is not None:
-            headers[cls._HEADER_IF_MODIFIED_SINCE] = format_datetime(
-                last_modified, usegmt=True
-            )
-
+        headers.update(get_conditional_request_headers(e_tag, last_modified))
         return headers
 
-    # TODO: ETag and Last-Modified not working correctly.
     def get_latest_file(
         self,
         rule_set_type: str,
         e_tag: Optional[str] = None,
         last_modified: Optional[datetime] = None,
-    ) -> Download:
-        """Get the latest rule set as ZIP."""
+        cache: Optional[AbcRuleCache] = None,
+        spool_threshold: Optional[int] = _DEFAULT_SPOOL_THRESHOLD,
+    ) -> Optional[Download]:
+        """Get the latest rule set as ZIP.
+
+        :param e_tag: ETag of a previous download, None is returned if the
+            rule set has not changed since.
+        :param last_modified: Last-Modified of a previous download, used like
+            e_tag.
+        :param cache: Rule set cache. The cached rule set is revalidated and
+            returned if it has not changed, and a changed one is cached, so
+            that polling only downloads new rule sets.
+        :param spool_threshold: Size in bytes above which the rule set is
+            spooled to a temporary file rather than held in memory, all of it
+            is held in memory if None.
+        """
+        cached: Optional[Download] = None
+        if cache is not None and e_tag is None and last_modified is None:
+            cached = cache.get(rule_set_type)
+            if cached is not None:
+                e_tag = cached.e_tag
+                last_modified = cached.last_modified
+
         path = self._LATEST_FILES_ENDPOINT
         headers = self._get_request_headers(e_tag, last_modified)
         params = {self._PARAM_TYPE: rule_set_type}
 
-        response = self.client.get(path, params=params, headers=headers)
+        response = self.client.get(
+            path, params=params, headers=headers, stream=spool_threshold is not None
+        )
+        if response.status_code == 304:
+            self.log.debug("Rule set '%s' not modified", rule_set_type)
+            response.close()
+            return cached
+
+        if cached is not None:
+            cached.close()
+
         check_200_response(response)
-        return Download.parse_http_response(response)
+        download = Download.parse_http_response(response, spool_threshold)
+
+        if cache is not None:
+            cache.set(rule_set_type, download)
+
+        return download
@@ -4,6 +4,20 @@
 from crowdstrike_client.api.models.indicator import Indicator
 from crowdstrike_client.api.models.indicator import Label
 from crowdstrike_client.api.models.indicator import Relation
+from crowdstrike_client.api.models.indicator_arrays import IndicatorArrays
+from crowdstrike_client.api.models.indicator_batch import IndicatorBatch
 from crowdstrike_client.api.models.response import Error, Meta, Pagination, Response
+from crowdstrike_client.api.models.response import ParseMode
 
-__all__ = ["Response", "Error", "Pagination", "Meta", "Indicator", "Label", "Relation"]
+__all__ = [
+    "Response",
+    "Error",
+    "Pagination",
+    "Meta",
+    "ParseMode",
+    "Indicator",
+    "Label",
+    "Relation",
+    "IndicatorBatch",
+    "IndicatorArrays",
+]
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """CrowdStrike API base model module."""
 
-from typing import Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+
+
+M = TypeVar("M", bound=BaseModel)
 
 
 class Base(BaseModel):
@@ -25,3 +29,56 @@ class Image(Base):
     url: str
     height: Optional[int] = None
     width: Optional[int] = None
+
+
+# Per model class: (field name, nested model, is list) for every field holding
+# a model or a list of models.
+_NestedFields = List[Tuple[str, Type[BaseModel], bool]]
+
+_nested_fields_cache: Dict[Type[BaseModel], _NestedFields] = {}
+
+
+def _get_nested_fields(model: Type[BaseModel]) -> _NestedFields:
+    nested_fields = _nested_fields_cache.get(model)
+    if nested_fields is not None:
+        return nested_fields
+
+    nested_fields = []
+    for name, field in model.__fields__.items():
+        field_type = field.type_
+        if not isinstance(field_type, type) or not issubclass(field_type, BaseModel):
+            continue
+
+        if field.shape == SHAPE_SINGLETON:
+            nested_fields.append((name, field_type, False))
+        elif field.shape == SHAPE_LIST:
+            nested_fields.append((name, field_type, True))
+
+    _nested_fields_cache[model] = nested_fields
+    return nested_fields
+
+
+def construct_model(model: Type[M], data: Mapping[str, Any]) -> M:
+    """Create a model from trusted data without validation.
+
+    Unlike BaseModel.construct, nested models are constructed recursively.
+    Values are not converted, so for example datetime fields hold the value
+    received from the API.
+    """
+    values = {
+        name: data[field.alias]
+        for name, field in model.__fields__.items()
+        if field.alias in data
+    }
+
+    for name, nested_model, is_list in _get_nested_fields(model):
+        value = values.get(name)
+        if value is None:
+            continue
+
+        if is_list:
+            values[name] = [construct_model(nested_model, v) for v in value]
+        else:
+            values[name] = construct_model(nested_model, value)
+
+    return model.construct(**values)
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 """CrowdStrike API download model module."""
 
+import contextlib
+import hashlib
+import mmap
+import os
 import re
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from io import BytesIO
-from typing import Mapping, Optional
+from io import BufferedReader, BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Callable, Iterator, Mapping, Optional, Union
 
 import requests
 
@@ -13,16 +18,25 @@ from crowdstrike_client.api.models.base import Base
 
 
 _HEADER_CONTENT_DISPOSITION = "Content-Disposition"
+_HEADER_CONTENT_ENCODING = "Content-Encoding"
+_HEADER_CONTENT_LENGTH = "Content-Length"
 _HEADER_E_TAG = "ETag"
 _HEADER_LAST_MODIFIED = "Last-Modified"
 
 _REGEX_CONTENT_DISPOSITION_FILENAME = re.compile("filename=(.+)")
 
+_SPOOL_CHUNK_SIZE = 1024 * 1024
+
 
 class Download(Base):
-    """CrowdStrike API download model."""
+    """CrowdStrike API download model.
+
+    The content is held in memory, in a temporary file spooled to disk above
+    a size threshold, or in a regular file. Use view for zero-copy access to
+    the bytes and close to release the file.
+    """
 
-    content: BytesIO
+    content: Union[BytesIO, SpooledTemporaryFile, BufferedReader]
     filename: Optional[str] = None
     e_tag: Optional[str] = None
     last_modified: Optional[datetime] = None
@@ -31,9 +45,21 @@ class Download(Base):
         arbitrary_types_allowed = True
 
     @classmethod
-    def parse_http_response(cls, response: requests.Response) -> "Download":
-        """Parse HTTP response."""
-        content = BytesIO(response.content)
+    def parse_http_response(
+        cls, response: requests.Response, spool_threshold: Optional[int] = None
+    ) -> "Download":
+        """Parse HTTP response.
+
+        :param spool_threshold: Size in bytes above which the content is
+            spooled to a temporary file rather than held in memory, a streamed
+            response is then read chunk by chunk. All content is held in
+            memory if not provided.
+        """
+        content: Union[BytesIO, SpooledTemporaryFile]
+        if spool_threshold is None:
+            content = BytesIO(response.content)
+        else:
+            content = _spool_http_response(response, spool_threshold)
 
         headers = response.headers
         filename = _extract_filename_from_headers(headers)
@@ -44,6 +70,165 @@ class Download(Base):
             content=content, filename=filename, e_tag=e_tag, last_modified=last_modified
         )
 
+    @contextlib.contextmanager
+    def view(self) -> Iterator[memoryview]:
+        """Zero-copy view of the content, valid until the context exits.
+
+        Content in a file is memory-mapped read-only, content in memory must
+        not be modified through the view.
+        """
+        content = self.content
+        if isinstance(content, SpooledTemporaryFile):
+            # Content that has not been spooled to disk yet lives in an
+            # in-memory buffer, fileno() would force it to disk.
+            content = content._file  # type: ignore
+
+        if isinstance(content, BytesIO):
+            view = content.getbuffer()
+            try:
+                yield view
+            finally:
+                view.release()
+            return
+
+        content.flush()
+        if os.fstat(content.fileno()).st_size == 0:
+            yield memoryview(b"")
+            return
+
+        mapped = mmap.mmap(content.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+        finally:
+            mapped.close()
+
+    def close(self) -> None:
+        """Close the content, removing a spooled temporary file."""
+        self.content.close()
+
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class StreamedDownload(Base):
+    """CrowdStrike API streamed download model.
+
+    The content has been written to a file as it was received, path is set
+    when it was written to a path rather than a file object. A download
+    flagged as not modified has no content, the previous download is current.
+    """
+
+    size: int
+    not_modified: bool = False
+    path: Optional[str] = None
+    sha256: Optional[str] = None
+    filename: Optional[str] = None
+    e_tag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def write_http_response(
+        cls,
+        response: requests.Response,
+        destination: Union[str, BinaryIO],
+        chunk_size: int,
+        sha256: bool = False,
+        progress: Optional[ProgressCallback] = None,
+    ) -> "StreamedDownload":
+        """Write streamed HTTP response content to a path or file object.
+
+        A partially written path is removed if writing fails.
+
+        :param sha256: Compute the SHA-256 digest of the content.
+        :param progress: Called after every chunk with the number of bytes
+            written so far and the total size, None if unknown.
+        """
+        headers = response.headers
+        total = _extract_content_length_from_headers(headers)
+
+        path: Optional[str] = None
+        if isinstance(destination, (str, os.PathLike)):
+            path = os.fspath(destination)
+
+        digest = hashlib.sha256() if sha256 else None
+        size = 0
+        try:
+            with contextlib.ExitStack() as stack:
+                if path is not None:
+                    f = stack.enter_context(open(path, "wb"))
+                else:
+                    f = destination  # type: ignore
+
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
+                    size += len(chunk)
+                    if progress is not None:
+                        progress(size, total)
+        except BaseException:
+            if path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(path)
+            raise
+        finally:
+            response.close()
+
+        return cls(
+            size=size,
+            path=path,
+            sha256=digest.hexdigest() if digest is not None else None,
+            filename=_extract_filename_from_headers(headers),
+            e_tag=_extract_e_tag_from_headers(headers),
+            last_modified=_extract_last_modified_from_headers(headers),
+        )
+
+    @classmethod
+    def parse_not_modified_http_response(
+        cls, response: requests.Response
+    ) -> "StreamedDownload":
+        """Parse HTTP 304 Not Modified response."""
+        headers = response.headers
+        return cls(
+            size=0,
+            not_modified=True,
+            e_tag=_extract_e_tag_from_headers(headers),
+            last_modified=_extract_last_modified_from_headers(headers),
+        )
+
+
+def _spool_http_response(
+    response: requests.Response, spool_threshold: int
+) -> SpooledTemporaryFile:
+    content = SpooledTemporaryFile(max_size=spool_threshold)
+    try:
+        for chunk in response.iter_content(chunk_size=_SPOOL_CHUNK_SIZE):
+            content.write(chunk)
+        content.seek(0)
+    except BaseException:
+        content.close()
+        raise
+    finally:
+        response.close()
+    return content
+
+
+def _extract_content_length_from_headers(headers: Mapping[str, str]) -> Optional[int]:
+    # The content is decoded as it is read, so the length of an encoded body
+    # is not the number of bytes written.
+    if headers.get(_HEADER_CONTENT_ENCODING) is not None:
+        return None
+
+    content_length = headers.get(_HEADER_CONTENT_LENGTH)
+    if content_length is None or not content_length.isdigit():
+        return None
+
+    return int(content_length)
+
 
 def _extract_filename_from_headers(headers: Mapping[str, str]) -> Optional[str]:
     content_disposition = headers.get(_HEADER_CONTENT_DISPOSITION)
@@ -63,6 +248,12 @@ def _extract_e_tag_from_headers(headers: Mapping[str, str]) -> Optional[str]:
     if e_tag is None:
         return None
 
+    # Weak ETags keep their W/ prefix and quotes, so that they can be sent
+    # back as they were received.
+    e_tag = e_tag.strip()
+    if e_tag.startswith("W/"):
+        return e_tag
+
     e_tag = e_tag.strip('"')
     return e_tag
 
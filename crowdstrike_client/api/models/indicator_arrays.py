@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike API indicator NumPy arrays module."""
+
+from array import array
+from typing import Any, Iterable, List, Union
+
+from crowdstrike_client.api.models.indicator_batch import IndicatorBatch, IndicatorLike
+from crowdstrike_client.api.models.response import Response
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+
+class IndicatorArrays:
+    """NumPy arrays of indicator columns for vectorized filtering and scoring.
+
+    records is a structured array with one row per indicator holding the
+    type and malicious_confidence codes, the deleted flag and the
+    published_date and last_updated timestamps as datetime64 (NaT if
+    missing). Codes index into the matching categories lists. threat_types is
+    a boolean matrix with one column per entry of threat_type_categories.
+    Row i corresponds to batch[i].
+    """
+
+    _TIMESTAMP_UNIT = "datetime64[s]"
+
+    def __init__(self, batch: IndicatorBatch) -> None:
+        """Initialize indicator arrays from an indicator batch."""
+        if numpy is None:
+            raise ImportError(
+                "numpy is required for indicator arrays, "
+                "install 'crowdstrike_client[numpy]'"
+            )
+
+        self.batch = batch
+
+        self.type_categories: List[str] = list(batch.type.categories)
+        self.malicious_confidence_categories: List[str] = list(
+            batch.malicious_confidence.categories
+        )
+        self.threat_type_categories: List[str] = list(
+            batch.threat_types.values.categories
+        )
+
+        self.records = self._create_records(batch)
+        self.threat_types = self._create_threat_types(batch)
+
+    @classmethod
+    def from_indicators(
+        cls, indicators: Union[Response[Any], Iterable[IndicatorLike]]
+    ) -> "IndicatorArrays":
+        """Create indicator arrays from a response or indicators."""
+        if isinstance(indicators, Response):
+            indicators = indicators.resources
+        return cls(IndicatorBatch(indicators))
+
+    @staticmethod
+    def _to_numpy(values: array, dtype: Any) -> "numpy.ndarray":
+        # Copy, as a view would lock the batch arrays against resizing.
+        return numpy.frombuffer(values, dtype=values.typecode).astype(dtype)
+
+    @classmethod
+    def _to_datetime64(cls, values: array) -> "numpy.ndarray":
+        timestamps = numpy.frombuffer(values, dtype=numpy.float64)
+        result = numpy.full(len(timestamps), "NaT", dtype=cls._TIMESTAMP_UNIT)
+
+        present = ~numpy.isnan(timestamps)
+        result[present] = timestamps[present].astype(numpy.int64)
+        return result
+
+    @classmethod
+    def _create_records(cls, batch: IndicatorBatch) -> "numpy.ndarray":
+        dtype = numpy.dtype(
+            [
+                ("type", numpy.uint32),
+                ("malicious_confidence", numpy.uint32),
+                ("deleted", numpy.bool_),
+                ("published_date", cls._TIMESTAMP_UNIT),
+                ("last_updated", cls._TIMESTAMP_UNIT),
+            ]
+        )
+
+        records = numpy.empty(len(batch), dtype=dtype)
+        records["type"] = cls._to_numpy(batch.type.codes, numpy.uint32)
+        records["malicious_confidence"] = cls._to_numpy(
+            batch.malicious_confidence.codes, numpy.uint32
+        )
+        records["deleted"] = cls._to_numpy(batch.deleted, numpy.bool_)
+        records["published_date"] = cls._to_datetime64(batch.published_date)
+        records["last_updated"] = cls._to_datetime64(batch.last_updated)
+        return records
+
+    @classmethod
+    def _create_threat_types(cls, batch: IndicatorBatch) -> "numpy.ndarray":
+        column = batch.threat_types
+        offsets = cls._to_numpy(column.offsets, numpy.int64)
+        codes = cls._to_numpy(column.values.codes, numpy.int64)
+
+        rows = numpy.repeat(numpy.arange(len(batch)), numpy.diff(offsets))
+
+        threat_types = numpy.zeros(
+            (len(batch), len(column.values.categories)), dtype=numpy.bool_
+        )
+        threat_types[rows, codes] = True
+        return threat_types
+
+    @staticmethod
+    def _get_code(categories: List[str], value: str) -> int:
+        try:
+            return categories.index(value)
+        except ValueError:
+            return -1
+
+    def type_code(self, value: str) -> int:
+        """Return the code of an indicator type, -1 if not present."""
+        return self._get_code(self.type_categories, value)
+
+    def malicious_confidence_code(self, value: str) -> int:
+        """Return the code of a malicious confidence, -1 if not present."""
+        return self._get_code(self.malicious_confidence_categories, value)
+
+    def has_type(self, value: str) -> "numpy.ndarray":
+        """Return a mask of the indicators of the given type."""
+        return self.records["type"] == self.type_code(value)
+
+    def has_malicious_confidence(self, value: str) -> "numpy.ndarray":
+        """Return a mask of the indicators with the given malicious confidence."""
+        code = self.malicious_confidence_code(value)
+        return self.records["malicious_confidence"] == code
+
+    def has_threat_type(self, value: str) -> "numpy.ndarray":
+        """Return a mask of the indicators with the given threat type."""
+        code = self._get_code(self.threat_type_categories, value)
+        if code < 0:
+            return numpy.zeros(len(self.records), dtype=numpy.bool_)
+        return self.threat_types[:, code]
+
+    def __len__(self) -> int:
+        return len(self.records)
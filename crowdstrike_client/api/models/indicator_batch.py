@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike API indicator batch module."""
+
+import math
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from crowdstrike_client.api.models.indicator import Indicator, Label, Relation
+from crowdstrike_client.api.models.response import Response
+
+
+IndicatorLike = Union[Indicator, Dict[str, Any]]
+
+
+def get_field(resource: Any, name: str) -> Any:
+    """Return a field of a resource given as a model or a dict."""
+    if isinstance(resource, dict):
+        return resource.get(name)
+    return getattr(resource, name, None)
+
+
+def to_timestamp(value: Any) -> float:
+    """Convert a datetime, epoch or ISO 8601 value to POSIX seconds.
+
+    Missing or unparsable values are returned as NaN.
+    """
+    if value is None:
+        return math.nan
+
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+
+        try:
+            return to_timestamp(datetime.fromisoformat(value.replace("Z", "+00:00")))
+        except ValueError:
+            return math.nan
+
+    return math.nan
+
+
+def from_timestamp(value: float) -> Optional[datetime]:
+    """Convert POSIX seconds to an aware UTC datetime, None for NaN."""
+    if math.isnan(value):
+        return None
+    return datetime.fromtimestamp(value, timezone.utc)
+
+
+class StringColumn:
+    """Column of strings stored as concatenated UTF-8 and an offsets array.
+
+    Empty strings are read back as None when the column is nullable.
+    """
+
+    def __init__(self, nullable: bool = False) -> None:
+        """Initialize empty string column."""
+        self.nullable = nullable
+        self.data = bytearray()
+        self.offsets = array("Q", [0])
+
+    def append(self, value: Optional[str]) -> None:
+        """Append a value."""
+        if value:
+            self.data += value.encode("utf-8")
+        self.offsets.append(len(self.data))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        start = self.offsets[index]
+        end = self.offsets[index + 1]
+        value = self.data[start:end].decode("utf-8")
+        if not value and self.nullable:
+            return None
+        return value
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory use in bytes."""
+        return sys.getsizeof(self.data) + sys.getsizeof(self.offsets)
+
+
+class CategoricalColumn:
+    """Column of dictionary-encoded strings.
+
+    Every distinct value is stored once in categories, rows hold its code.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty categorical column."""
+        self.categories: List[str] = []
+        self.codes = array("I")
+        self._index: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        """Return the code of a value, adding it to the categories if new."""
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.categories)
+            self._index[value] = code
+            self.categories.append(value)
+        return code
+
+    def append(self, value: str) -> None:
+        """Append a value."""
+        self.codes.append(self.encode(value))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str:
+        return self.categories[self.codes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        categories = self.categories
+        for code in self.codes:
+            yield categories[code]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory use in bytes."""
+        return (
+            sys.getsizeof(self.codes)
+            + sys.getsizeof(self.categories)
+            + sum(sys.getsizeof(category) for category in self.categories)
+            + sys.getsizeof(self._index)
+        )
+
+
+class RaggedColumn:
+    """Column of variable-length lists of dictionary-encoded strings.
+
+    Values of all rows are flattened into one categorical column, the values
+    of row i are at positions offsets[i] to offsets[i + 1].
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty ragged column."""
+        self.values = CategoricalColumn()
+        self.offsets = array("Q", [0])
+
+    def append(self, values: Optional[Iterable[str]]) -> None:
+        """Append a list of values."""
+        for value in values or ():
+            self.values.append(value)
+        self.offsets.append(len(self.values))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> List[str]:
+        values = self.values
+        return [values[i] for i in range(self.offsets[index], self.offsets[index + 1])]
+
+    def __iter__(self) -> Iterator[List[str]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory use in bytes."""
+        return self.values.nbytes + sys.getsizeof(self.offsets)
+
+
+class LabelColumn:
+    """Column of variable-length lists of labels."""
+
+    def __init__(self) -> None:
+        """Initialize empty label column."""
+        self.name = CategoricalColumn()
+        self.created_on = array("d")
+        self.last_valid_on = array("d")
+        self.offsets = array("Q", [0])
+
+    def append(self, labels: Optional[Iterable[Any]]) -> None:
+        """Append a list of labels, given as models or dicts."""
+        for label in labels or ():
+            self.name.append(get_field(label, "name"))
+            self.created_on.append(to_timestamp(get_field(label, "created_on")))
+            self.last_valid_on.append(to_timestamp(get_field(label, "last_valid_on")))
+        self.offsets.append(len(self.name))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> List[Label]:
+        return [
+            Label.construct(
+                name=self.name[i],
+                created_on=from_timestamp(self.created_on[i]),
+                last_valid_on=from_timestamp(self.last_valid_on[i]),
+            )
+            for i in range(self.offsets[index], self.offsets[index + 1])
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory use in bytes."""
+        return (
+            self.name.nbytes
+            + sys.getsizeof(self.created_on)
+            + sys.getsizeof(self.last_valid_on)
+            + sys.getsizeof(self.offsets)
+        )
+
+
+class RelationColumn:
+    """Column of variable-length lists of relations."""
+
+    def __init__(self) -> None:
+        """Initialize empty relation column."""
+        self.id = StringColumn(nullable=True)
+        self.indicator = StringColumn()
+        self.type = CategoricalColumn()
+        self.created_date = array("d")
+        self.last_valid_date = array("d")
+        self.offsets = array("Q", [0])
+
+    def append(self, relations: Optional[Iterable[Any]]) -> None:
+        """Append a list of relations, given as models or dicts."""
+        for relation in relations or ():
+            self.id.append(get_field(relation, "id"))
+            self.indicator.append(get_field(relation, "indicator"))
+            self.type.append(get_field(relation, "type"))
+            self.created_date.append(to_timestamp(get_field(relation, "created_date")))
+            self.last_valid_date.append(
+                to_timestamp(get_field(relation, "last_valid_date"))
+            )
+        self.offsets.append(len(self.type))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> List[Relation]:
+        return [
+            Relation.construct(
+                id=self.id[i],
+                indicator=self.indicator[i],
+                type=self.type[i],
+                created_date=from_timestamp(self.created_date[i]),
+                last_valid_date=from_timestamp(self.last_valid_date[i]),
+            )
+            for i in range(self.offsets[index], self.offsets[index + 1])
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory use in bytes."""
+        return (
+            self.id.nbytes
+            + self.indicator.nbytes
+            + self.type.nbytes
+            + sys.getsizeof(self.created_date)
+            + sys.getsizeof(self.last_valid_date)
+            + sys.getsizeof(self.offsets)
+        )
+
+
+class IndicatorBatch:
+    """Compact columnar container of indicators.
+
+    Indicators are stored column by column in arrays instead of as one model
+    per indicator: strings as concatenated UTF-8, low-cardinality strings
+    dictionary-encoded, timestamps as POSIX seconds and list fields as flat
+    columns with offsets. Rows are materialized as Indicator models only when
+    accessed.
+
+    Indicators parsed in any parse mode can be added, timestamps may be
+    datetimes, epoch seconds or ISO 8601 strings.
+    """
+
+    _STRING_LIST_FIELDS = (
+        "actors",
+        "domain_types",
+        "ip_address_types",
+        "kill_chains",
+        "malware_families",
+        "reports",
+        "targets",
+        "threat_types",
+        "vulnerabilities",
+    )
+
+    def __init__(self, indicators: Optional[Iterable[IndicatorLike]] = None) -> None:
+        """Initialize indicator batch, optionally with initial indicators."""
+        self.id = StringColumn()
+        self.indicator = StringColumn()
+        self.type = CategoricalColumn()
+        self.malicious_confidence = CategoricalColumn()
+        self.deleted = array("b")
+        self.published_date = array("d")
+        self.last_updated = array("d")
+
+        self.actors = RaggedColumn()
+        self.domain_types = RaggedColumn()
+        self.ip_address_types = RaggedColumn()
+        self.kill_chains = RaggedColumn()
+        self.malware_families = RaggedColumn()
+        self.reports = RaggedColumn()
+        self.targets = RaggedColumn()
+        self.threat_types = RaggedColumn()
+        self.vulnerabilities = RaggedColumn()
+
+        self.labels = LabelColumn()
+        self.relations = RelationColumn()
+
+        if indicators is not None:
+            self.extend(indicators)
+
+    @classmethod
+    def from_response(cls, response: Response[Any]) -> "IndicatorBatch":
+        """Create indicator batch from the resources of a response."""
+        return cls(response.resources)
+
+    def append(self, indicator: IndicatorLike) -> None:
+        """Append an indicator, given as a model or a dict."""
+        self.id.append(get_field(indicator, "id"))
+        self.indicator.append(get_field(indicator, "indicator"))
+        self.type.append(get_field(indicator, "type"))
+        self.malicious_confidence.append(get_field(indicator, "malicious_confidence"))
+        self.deleted.append(1 if get_field(indicator, "deleted") else 0)
+        self.published_date.append(to_timestamp(get_field(indicator, "published_date")))
+        self.last_updated.append(to_timestamp(get_field(indicator, "last_updated")))
+
+        for name in self._STRING_LIST_FIELDS:
+            getattr(self, name).append(get_field(indicator, name))
+
+        self.labels.append(get_field(indicator, "labels"))
+        self.relations.append(get_field(indicator, "relations"))
+
+    def extend(self, indicators: Iterable[IndicatorLike]) -> None:
+        """Append indicators, given as models or dicts."""
+        for indicator in indicators:
+            self.append(indicator)
+
+    def __len__(self) -> int:
+        return len(self.deleted)
+
+    def __getitem__(self, index: int) -> Indicator:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Indicator batch index out of range")
+
+        values = {name: getattr(self, name)[index] for name in self._STRING_LIST_FIELDS}
+
+        return Indicator.construct(
+            id=self.id[index],
+            indicator=self.indicator[index],
+            type=self.type[index],
+            malicious_confidence=self.malicious_confidence[index],
+            deleted=bool(self.deleted[index]),
+            published_date=from_timestamp(self.published_date[index]),
+            last_updated=from_timestamp(self.last_updated[index]),
+            labels=self.labels[index],
+            relations=self.relations[index],
+            **values,
+        )
+
+    def __iter__(self) -> Iterator[Indicator]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory use in bytes."""
+        columns = (
+            self.id,
+            self.indicator,
+            self.type,
+            self.malicious_confidence,
+            self.labels,
+            self.relations,
+        ) + tuple(getattr(self, name) for name in self._STRING_LIST_FIELDS)
+
+        return (
+            sum(column.nbytes for column in columns)
+            + sys.getsizeof(self.deleted)
+            + sys.getsizeof(self.published_date)
+            + sys.getsizeof(self.last_updated)
+        )
@@ -2,7 +2,18 @@
 """CrowdStrike API response model module."""
 
 import logging
-from typing import Any, Generic, List, Mapping, Optional, Type, TypeVar
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
 from urllib.parse import parse_qs, urlparse
 
 import requests
@@ -10,7 +21,10 @@ import requests
 from pydantic import BaseModel, parse_obj_as, validator
 from pydantic.generics import GenericModel
 
-from crowdstrike_client.api.models.base import Base
+from crowdstrike_client.api.models.actor import Actor
+from crowdstrike_client.api.models.base import Base, construct_model
+from crowdstrike_client.api.models.indicator import Indicator
+from crowdstrike_client.api.models.report import Report
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +33,19 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class ParseMode(str, Enum):
+    """CrowdStrike API response parse mode.
+
+    VALIDATED validates resources with pydantic, TRUSTED constructs resource
+    models recursively without validation or conversion, and RAW leaves
+    resources as decoded JSON. Meta and errors are always validated.
+    """
+
+    VALIDATED = "validated"
+    TRUSTED = "trusted"
+    RAW = "raw"
+
+
 class Pagination(Base):
     """CrowdStrike API pagination model."""
 
@@ -60,11 +87,17 @@ class Response(GenericModel, Generic[T]):
 
     @staticmethod
     def parse_http_response(
-        response: requests.Response, resource_type: Type[T]
+        response: requests.Response,
+        resource_type: Type[T],
+        parse_mode: ParseMode = ParseMode.VALIDATED,
     ) -> "Response[T]":
         """Parse response object to Response model."""
-        # TODO: Is the 'Response[resource_type]' type hint correct?
-        result = parse_obj_as(Response[resource_type], response.json())  # type: ignore
+        data = response.json()
+
+        if parse_mode == ParseMode.VALIDATED:
+            result = get_response_type(resource_type).parse_obj(data)
+        else:
+            result = Response._construct(data, resource_type, parse_mode)
 
         next_page = response.headers.get("next-page", None)
         if next_page is not None:
@@ -72,14 +105,103 @@ class Response(GenericModel, Generic[T]):
 
         return result
 
+    @staticmethod
+    def _construct(
+        data: Mapping[str, Any], resource_type: Type[T], parse_mode: ParseMode
+    ) -> "Response[T]":
+        resources = data.get("resources") or []
+        if parse_mode == ParseMode.TRUSTED:
+            resources = [
+                parse_resource(resource, resource_type, parse_mode)
+                for resource in resources
+            ]
+
+        return get_response_type(resource_type).construct(
+            meta=Meta.parse_obj(data["meta"]),
+            errors=parse_obj_as(List[Error], data.get("errors") or []),
+            resources=resources,
+        )
+
+    @staticmethod
+    def merge(responses: Sequence["Response[T]"]) -> "Response[T]":
+        """Merge responses for consecutive requests into one response."""
+        if not responses:
+            raise ValueError("No responses to merge")
+
+        resources: List[T] = []
+        errors: List[Error] = []
+        query_time = 0.0
+        for response in responses:
+            resources.extend(response.resources)
+            errors.extend(response.errors)
+            query_time += response.meta.query_time
+
+        first = responses[0]
+
+        meta_update: Dict[str, Any] = {"query_time": query_time}
+        pagination = first.meta.pagination
+        if pagination is not None:
+            meta_update["pagination"] = pagination.copy(
+                update={"limit": len(resources)}
+            )
+
+        return first.copy(
+            update={
+                "meta": first.meta.copy(update=meta_update),
+                "errors": errors,
+                "resources": resources,
+                "next_page": responses[-1].next_page,
+            }
+        )
+
     def get_next_page_params(self) -> Optional[Mapping[str, List[str]]]:
         """Return the request parameters for the next page"""
-        next_page = self.next_page
-        if next_page is None or not next_page:
-            return None
+        return parse_next_page_params(self.next_page)
+
+
+_response_types: Dict[Any, Type[Response]] = {}
+
+
+def get_response_type(resource_type: Type[T]) -> Type[Response[T]]:
+    """Return the Response model specialized for the resource type.
+
+    Specialized models are created once and reused, so that their validators
+    are not looked up again for every response.
+    """
+    response_type = _response_types.get(resource_type)
+    if response_type is None:
+        response_type = Response[resource_type]  # type: ignore
+        _response_types[resource_type] = response_type
+    return response_type
+
+
+for _resource_type in (str, Indicator, Report, Actor):
+    get_response_type(_resource_type)
+del _resource_type
+
+
+def parse_resource(resource: Any, resource_type: Type[T], parse_mode: ParseMode) -> T:
+    """Parse a single resource according to the parse mode."""
+    if parse_mode == ParseMode.VALIDATED:
+        return parse_obj_as(resource_type, resource)  # type: ignore
+
+    is_model = isinstance(resource_type, type) and issubclass(resource_type, BaseModel)
+
+    if parse_mode == ParseMode.TRUSTED and is_model:
+        return construct_model(resource_type, resource)  # type: ignore
+
+    return resource
+
+
+def parse_next_page_params(
+    next_page: Optional[str],
+) -> Optional[Mapping[str, List[str]]]:
+    """Return the request parameters from a next-page header value."""
+    if next_page is None or not next_page:
+        return None
 
-        enc_payload = urlparse(next_page).query
-        return parse_qs(enc_payload)
+    enc_payload = urlparse(next_page).query
+    return parse_qs(enc_payload)
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike API streaming response model module."""
+
+import codecs
+import json
+import logging
+from typing import Any, Generic, Iterator, List, Mapping, Optional, Type, TypeVar
+
+import requests
+
+from pydantic import parse_obj_as
+
+from crowdstrike_client.api.models.exceptions import ModelException
+from crowdstrike_client.api.models.response import (
+    Error,
+    Meta,
+    ParseMode,
+    parse_next_page_params,
+    parse_resource,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar("T")
+
+
+_JSON_META = "meta"
+_JSON_ERRORS = "errors"
+_JSON_RESOURCES = "resources"
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JSONStreamReader:
+    # Incremental reader over a stream of JSON text chunks. Values are decoded
+    # one at a time with raw_decode, reading more chunks while a value is
+    # incomplete, and consumed text is dropped so that the buffer only holds
+    # about one value and one chunk.
+
+    _COMPACT_THRESHOLD = 65536
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_chunk(self) -> bool:
+        if self._eof:
+            return False
+
+        pos = self._pos
+        if pos > self._COMPACT_THRESHOLD:
+            self._buffer = self._buffer[pos:]
+            self._pos = 0
+
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            self._buffer += self._decoder.decode(chunk)
+            return True
+
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, empty at end of stream."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+
+            if pos < length:
+                return buffer[pos]
+
+            if not self._read_chunk():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the given character."""
+        found = self.peek()
+        if found != char:
+            raise ModelException(f"Expected '{char}' in JSON stream, found '{found}'")
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._read_chunk():
+                    continue
+                raise ModelException(f"Invalid JSON stream: {e}") from e
+
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and self._read_chunk():
+                continue
+
+            self._pos = end
+            return value
+
+
+class StreamingResponse(Generic[T]):
+    """CrowdStrike API response model decoding resources from the response stream.
+
+    Iterating yields the resources one at a time as they are decoded, so only
+    one resource is held in memory at a time. The response can be iterated
+    only once. Meta and errors are set as soon as they are read, and always
+    once iteration is complete.
+    """
+
+    _HEADER_NEXT_PAGE = "next-page"
+
+    _CHUNK_SIZE = 65536
+
+    def __init__(
+        self,
+        response: requests.Response,
+        resource_type: Type[T],
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+    ) -> None:
+        """Initialize streaming response from a response opened with stream."""
+        self._response = response
+        self._resource_type = resource_type
+        self._parse_mode = parse_mode
+
+        self.meta: Optional[Meta] = None
+        self.errors: List[Error] = []
+        self.next_page: Optional[str] = response.headers.get(self._HEADER_NEXT_PAGE)
+
+        self._consumed = False
+
+    @classmethod
+    def parse_http_response(
+        cls,
+        response: requests.Response,
+        resource_type: Type[T],
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+    ) -> "StreamingResponse[T]":
+        """Wrap response object opened with stream to StreamingResponse model."""
+        return cls(response, resource_type, parse_mode)
+
+    def _parse_resource(self, resource: Any) -> T:
+        return parse_resource(resource, self._resource_type, self._parse_mode)
+
+    def _set_field(self, key: str, value: Any) -> None:
+        if key == _JSON_META:
+            self.meta = Meta.parse_obj(value)
+        elif key == _JSON_ERRORS:
+            self.errors = parse_obj_as(List[Error], value or [])
+
+    def _iter_resources(self, reader: _JSONStreamReader) -> Iterator[T]:
+        if reader.peek() == "n":
+            reader.read_value()
+            return
+
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.expect("]")
+            return
+
+        while True:
+            yield self._parse_resource(reader.read_value())
+
+            if reader.peek() == ",":
+                reader.expect(",")
+            else:
+                reader.expect("]")
+                return
+
+    def __iter__(self) -> Iterator[T]:
+        if self._consumed:
+            raise ModelException("Streaming response can only be iterated once")
+        self._consumed = True
+
+        response = self._response
+        try:
+            reader = _JSONStreamReader(
+                response.iter_content(chunk_size=self._CHUNK_SIZE)
+            )
+
+            reader.expect("{")
+            if reader.peek() == "}":
+                return
+
+            while True:
+                key = reader.read_value()
+                reader.expect(":")
+
+                if key == _JSON_RESOURCES:
+                    yield from self._iter_resources(reader)
+                else:
+                    self._set_field(key, reader.read_value())
+
+                if reader.peek() == ",":
+                    reader.expect(",")
+                else:
+                    reader.expect("}")
+                    return
+        finally:
+            response.close()
+
+    def close(self) -> None:
+        """Close the underlying response without reading the rest."""
+        self._consumed = True
+        self._response.close()
+
+    def get_next_page_params(self) -> Optional[Mapping[str, List[str]]]:
+        """Return the request parameters for the next page"""
+        return parse_next_page_params(self.next_page)
@@ -1,18 +1,42 @@
 # -*- coding: utf-8 -*-
 """CrowdStrike API utilities module."""
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from logging import Logger
-from typing import Any, Mapping
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import quote_plus, urlencode
 
 import requests
 
 from crowdstrike_client.api.exceptions import CrowdStrikeException
-from crowdstrike_client.api.models.response import ErrorResponse
+from crowdstrike_client.api.models.response import ErrorResponse, Response
 
 logger = logging.getLogger(__name__)
 
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+_HEADER_IF_NONE_MATCH = "If-None-Match"
+_HEADER_IF_MODIFIED_SINCE = "If-Modified-Since"
+
+
 def log_error_response(log: Logger, response: requests.Response) -> None:
     status_code = response.status_code
 
@@ -49,3 +73,180 @@ def check_response(response: requests.Response, expected_status_code: int) -> No
 
 def check_200_response(response: requests.Response) -> None:
     check_response(response, 200)
+
+
+def get_conditional_request_headers(
+    e_tag: Optional[str] = None, last_modified: Optional[datetime] = None
+) -> Dict[str, str]:
+    """Return If-None-Match and If-Modified-Since headers for the validators.
+
+    Strong ETags are parsed without quotes and quoted again here, weak ETags
+    are kept as received, with their W/ prefix and quotes.
+    """
+    headers = {}
+
+    if e_tag is not None:
+        if not e_tag.startswith(("W/", '"')):
+            e_tag = f'"{e_tag}"'
+        headers[_HEADER_IF_NONE_MATCH] = e_tag
+
+    if last_modified is not None:
+        # Naive datetimes are taken as UTC.
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        else:
+            last_modified = last_modified.astimezone(timezone.utc)
+        headers[_HEADER_IF_MODIFIED_SINCE] = format_datetime(last_modified, usegmt=True)
+
+    return headers
+
+
+def split_into_chunks(items: Sequence[T], chunk_size: int) -> List[Sequence[T]]:
+    """Split items into consecutive chunks of at most chunk_size items."""
+    chunk_size = max(chunk_size, 1)
+
+    chunks: List[Sequence[T]] = []
+    for start in range(0, len(items), chunk_size):
+        end = start + chunk_size
+        chunks.append(items[start:end])
+    return chunks
+
+
+def split_query_values(
+    url: str,
+    params: Optional[Mapping[str, Any]],
+    name: str,
+    values: Sequence[str],
+    max_url_bytes: int,
+) -> List[Sequence[str]]:
+    """Split values of a repeated query parameter to keep URLs within budget.
+
+    Every chunk of values, added to the URL and the other query parameters,
+    makes a URL of at most max_url_bytes bytes, except for chunks of a single
+    value that does not fit on its own.
+    """
+    budget = len(url) + 1
+    if params:
+        budget += len(urlencode(params, doseq=True)) + 1
+    budget = max_url_bytes - budget
+
+    chunks: List[Sequence[str]] = []
+    start = 0
+    size = 0
+    for i, value in enumerate(values):
+        # 'name=value&', as encoded by requests.
+        value_size = len(name) + len(quote_plus(str(value))) + 2
+        if i > start and size + value_size > budget:
+            chunks.append(values[start:i])
+            start = i
+            size = 0
+        size += value_size
+
+    if start < len(values) or not chunks:
+        chunks.append(values[start:])
+
+    return chunks
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Sequence[T], max_workers: int
+) -> List[R]:
+    """Apply function to items using a bounded thread pool, keeping the order."""
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+async def gather_concurrently(
+    func: Callable[[T], Awaitable[R]], items: Sequence[T], max_workers: int
+) -> List[R]:
+    """Await function on items with bounded concurrency, keeping the order."""
+    semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+def _get_remaining_offsets(
+    first: Response[T], first_offset: int, limit: Optional[int]
+) -> Tuple[List[int], int]:
+    pagination = first.meta.pagination
+    if pagination is None or not first.resources:
+        return [], 0
+
+    page_size = pagination.limit if limit is None else limit
+    if page_size <= 0:
+        return [], 0
+
+    offsets = list(range(first_offset + page_size, pagination.total, page_size))
+    return offsets, page_size
+
+
+def query_all_offset_pages(
+    query: Callable[[int, Optional[int]], Response[T]],
+    offset: Optional[int],
+    limit: Optional[int],
+    max_workers: int,
+) -> Response[T]:
+    """Query the first page, then the remaining pages concurrently.
+
+    The remaining offsets are computed from the pagination total and page
+    limit of the first page. The query is called with an offset and a limit.
+    """
+    first_offset = offset if offset is not None else 0
+
+    first = query(first_offset, limit)
+
+    offsets, page_size = _get_remaining_offsets(first, first_offset, limit)
+    if not offsets:
+        return first
+
+    logger.debug(
+        "Querying %d remaining pages of %d with %d workers",
+        len(offsets),
+        page_size,
+        max_workers,
+    )
+
+    rest = map_concurrently(
+        lambda page_offset: query(page_offset, page_size), offsets, max_workers
+    )
+
+    return Response.merge([first] + rest)
+
+
+async def query_all_offset_pages_async(
+    query: Callable[[int, Optional[int]], Awaitable[Response[T]]],
+    offset: Optional[int],
+    limit: Optional[int],
+    max_workers: int,
+) -> Response[T]:
+    """Query the first page, then the remaining pages concurrently.
+
+    Asynchronous variant of query_all_offset_pages.
+    """
+    first_offset = offset if offset is not None else 0
+
+    first = await query(first_offset, limit)
+
+    offsets, page_size = _get_remaining_offsets(first, first_offset, limit)
+    if not offsets:
+        return first
+
+    logger.debug(
+        "Querying %d remaining pages of %d with %d tasks",
+        len(offsets),
+        page_size,
+        max_workers,
+    )
+
+    rest = await gather_concurrently(
+        lambda page_offset: query(page_offset, page_size), offsets, max_workers
+    )
+
+    return Response.merge([first] + rest)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike asynchronous client module."""
+
+from types import TracebackType
+from typing import Optional, Type
+
+from crowdstrike_client.api.authenticator import AsyncOAuth2Authenticator
+from crowdstrike_client.api.intel import AsyncIntelAPI
+from crowdstrike_client.api.models import ParseMode
+from crowdstrike_client.http.async_client import (
+    AsyncAuthenticatedHTTPClient,
+    AsyncHTTPClient,
+    AsyncTransport,
+)
+from crowdstrike_client.http.rate_limiter import RateLimiter
+from crowdstrike_client.http.retry import RetryPolicy
+from crowdstrike_client.http.token_store import AbcTokenStore, FileTokenStore
+
+
+class AsyncCrowdStrikeClient:
+    """CrowdStrike asynchronous client."""
+
+    _intel_api: Optional[AsyncIntelAPI] = None
+
+    def __init__(
+        self,
+        base_url: str,
+        client_id: str,
+        client_secret: str,
+        transport: Optional[AsyncTransport] = None,
+        refresh_margin: Optional[float] = None,
+        token_store: Optional[AbcTokenStore] = None,
+        cache_token: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+    ) -> None:
+        """Initialize CrowdStrike asynchronous client.
+
+        Takes the same arguments as CrowdStrikeClient, with an asynchronous
+        transport.
+        """
+        self.parse_mode = parse_mode
+
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else AsyncTransport()
+
+        if not cache_token:
+            token_store = None
+        elif token_store is None:
+            token_store = FileTokenStore()
+
+        if rate_limiter is None:
+            rate_limiter = RateLimiter()
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+
+        self.http_client = self._create_http_client(
+            base_url,
+            client_id,
+            client_secret,
+            self.transport,
+            refresh_margin,
+            token_store,
+            rate_limiter,
+            retry_policy,
+        )
+
+    @staticmethod
+    def _create_http_client(
+        base_url: str,
+        client_id: str,
+        client_secret: str,
+        transport: AsyncTransport,
+        refresh_margin: Optional[float],
+        token_store: Optional[AbcTokenStore],
+        rate_limiter: RateLimiter,
+        retry_policy: RetryPolicy,
+    ) -> AsyncHTTPClient:
+        authenticator = AsyncOAuth2Authenticator(
+            AsyncHTTPClient(base_url, transport=transport, retry_policy=retry_policy),
+            client_id,
+            client_secret,
+            token_store=token_store,
+            refresh_margin=refresh_margin,
+        )
+        return AsyncAuthenticatedHTTPClient(
+            base_url,
+            authenticator,
+            transport=transport,
+            refresh_margin=refresh_margin,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+        )
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Rate limiter pacing API requests."""
+        return self.http_client.rate_limiter
+
+    @property
+    def intel_api(self) -> AsyncIntelAPI:
+        """CrowdStrike Intel asynchronous API."""
+        if self._intel_api is None:
+            self._intel_api = AsyncIntelAPI(self.http_client, self.parse_mode)
+        return self._intel_api
+
+    async def close(self) -> None:
+        """Close the client and release pooled connections."""
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncCrowdStrikeClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
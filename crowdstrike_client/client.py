@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 """CrowdStrike client module."""
 
-from typing import Optional
+from types import TracebackType
+from typing import Optional, Type
 
 from crowdstrike_client.api.authenticator import OAuth2Authenticator
 from crowdstrike_client.api.intel import IntelAPI
+from crowdstrike_client.api.models import ParseMode
 from crowdstrike_client.http.client import AuthenticatedHTTPClient, HTTPClient
+from crowdstrike_client.http.rate_limiter import RateLimiter
+from crowdstrike_client.http.retry import RetryPolicy
+from crowdstrike_client.http.token_store import AbcTokenStore, FileTokenStore
+from crowdstrike_client.http.transport import Transport
 
 
 class CrowdStrikeClient:
@@ -13,22 +19,111 @@ class CrowdStrikeClient:
 
     _intel_api: Optional[IntelAPI] = None
 
-    def __init__(self, base_url: str, client_id: str, client_secret: str) -> None:
-        """Initialize CrowdStrike client."""
-        self.http_client = self._create_http_client(base_url, client_id, client_secret)
+    def __init__(
+        self,
+        base_url: str,
+        client_id: str,
+        client_secret: str,
+        transport: Optional[Transport] = None,
+        refresh_margin: Optional[float] = None,
+        token_store: Optional[AbcTokenStore] = None,
+        cache_token: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        parse_mode: ParseMode = ParseMode.VALIDATED,
+    ) -> None:
+        """Initialize CrowdStrike client.
+
+        :param transport: Shared HTTP transport, created if not provided.
+        :param refresh_margin: Seconds before access token expiry at which the
+            token is refreshed, the client default is used if not provided.
+        :param token_store: Store used to share access tokens between clients
+            and processes, a file store is used if not provided.
+        :param cache_token: Share access tokens through the token store.
+        :param rate_limiter: Rate limiter pacing API requests, created if not
+            provided.
+        :param retry_policy: Policy for retrying failed requests, created if not
+            provided.
+        :param parse_mode: Default parse mode for the returned entities.
+        """
+        self.parse_mode = parse_mode
+
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else Transport()
+
+        if not cache_token:
+            token_store = None
+        elif token_store is None:
+            token_store = FileTokenStore()
+
+        if rate_limiter is None:
+            rate_limiter = RateLimiter()
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+
+        self.http_client = self._create_http_client(
+            base_url,
+            client_id,
+            client_secret,
+            self.transport,
+            refresh_margin,
+            token_store,
+            rate_limiter,
+            retry_policy,
+        )
 
     @staticmethod
     def _create_http_client(
-        base_url: str, client_id: str, client_secret: str
+        base_url: str,
+        client_id: str,
+        client_secret: str,
+        transport: Transport,
+        refresh_margin: Optional[float],
+        token_store: Optional[AbcTokenStore],
+        rate_limiter: RateLimiter,
+        retry_policy: RetryPolicy,
     ) -> HTTPClient:
         authenticator = OAuth2Authenticator(
-            HTTPClient(base_url), client_id, client_secret
+            HTTPClient(base_url, transport=transport, retry_policy=retry_policy),
+            client_id,
+            client_secret,
+            token_store=token_store,
+            refresh_margin=refresh_margin,
         )
-        return AuthenticatedHTTPClient(base_url, authenticator)
+        return AuthenticatedHTTPClient(
+            base_url,
+            authenticator,
+            transport=transport,
+            refresh_margin=refresh_margin,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+        )
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Rate limiter pacing API requests."""
+        return self.http_client.rate_limiter
 
     @property
     def intel_api(self) -> IntelAPI:
         """CrowdStrike Intel API."""
         if self._intel_api is None:
-            self._intel_api = IntelAPI(self.http_client)
+            self._intel_api = IntelAPI(self.http_client, self.parse_mode)
         return self._intel_api
+
+    def close(self) -> None:
+        """Close the client and release pooled connections."""
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> "CrowdStrikeClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
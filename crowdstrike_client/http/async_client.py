@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+"""HTTP asynchronous client module."""
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from crowdstrike_client.http.authenticator import AbcAsyncAuthenticator, Token
+from crowdstrike_client.http.exceptions import HTTPClientException
+from crowdstrike_client.http.rate_limiter import RateLimiter
+from crowdstrike_client.http.retry import RetryPolicy
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+
+class AsyncTransport:
+    """Pooled, keep-alive asynchronous HTTP transport backed by aiohttp.
+
+    Responses are read in full and returned as requests responses, so the
+    response parsing helpers are shared with the synchronous client.
+    """
+
+    _DEFAULT_POOL_MAXSIZE = 100
+    _DEFAULT_POOL_MAXSIZE_PER_HOST = 10
+    _DEFAULT_KEEP_ALIVE_TIMEOUT_SEC = 15.0
+
+    def __init__(
+        self,
+        pool_maxsize: int = _DEFAULT_POOL_MAXSIZE,
+        pool_maxsize_per_host: int = _DEFAULT_POOL_MAXSIZE_PER_HOST,
+        keep_alive: bool = True,
+        keep_alive_timeout: float = _DEFAULT_KEEP_ALIVE_TIMEOUT_SEC,
+    ) -> None:
+        """Initialize asynchronous HTTP transport.
+
+        :param pool_maxsize: Maximum number of connections, 0 for no limit.
+        :param pool_maxsize_per_host: Maximum number of connections per host,
+            0 for no limit.
+        :param keep_alive: Reuse connections between requests.
+        :param keep_alive_timeout: Seconds an idle connection is kept open.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for the asynchronous client, "
+                "install 'crowdstrike_client[async]'"
+            )
+
+        self.log = logging.getLogger(__name__)
+
+        self._pool_maxsize = pool_maxsize
+        self._pool_maxsize_per_host = pool_maxsize_per_host
+        self._keep_alive = keep_alive
+        self._keep_alive_timeout = keep_alive_timeout
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the transport has been closed."""
+        return self._closed
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._closed:
+            raise HTTPClientException("Transport is closed")
+
+        # The session is bound to the running event loop, so it is created on
+        # first use rather than in the constructor.
+        if self._session is None:
+            if self._keep_alive:
+                connector = aiohttp.TCPConnector(
+                    limit=self._pool_maxsize,
+                    limit_per_host=self._pool_maxsize_per_host,
+                    keepalive_timeout=self._keep_alive_timeout,
+                )
+            else:
+                connector = aiohttp.TCPConnector(
+                    limit=self._pool_maxsize,
+                    limit_per_host=self._pool_maxsize_per_host,
+                    force_close=True,
+                )
+
+            self._session = aiohttp.ClientSession(connector=connector)
+
+        return self._session
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send HTTP request."""
+        session = self._get_session()
+        async with session.request(method, url, **kwargs) as response:
+            content = await response.read()
+            return _to_requests_response(response, content)
+
+    async def close(self) -> None:
+        """Close the transport and all pooled connections."""
+        if self._closed:
+            return
+
+        self.log.debug("Closing transport")
+
+        self._closed = True
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+
+def _to_requests_response(
+    response: "aiohttp.ClientResponse", content: bytes
+) -> requests.Response:
+    result = requests.Response()
+    result.status_code = response.status
+    result.reason = response.reason or ""
+    result.url = str(response.url)
+    result.headers = CaseInsensitiveDict(response.headers)
+    result.encoding = response.charset
+    result._content = content
+    # The body has been read, so iter_content and close must not touch raw.
+    result._content_consumed = True
+    return result
+
+
+def _encode_params(
+    params: Optional[Mapping[str, Any]]
+) -> Optional[List[Tuple[str, str]]]:
+    # Encode query parameters the way requests does: sequences are repeated.
+    if params is None:
+        return None
+
+    encoded: List[Tuple[str, str]] = []
+    for key, value in params.items():
+        if value is None:
+            continue
+
+        if isinstance(value, (list, tuple)):
+            encoded.extend((key, str(v)) for v in value)
+        else:
+            encoded.append((key, str(value)))
+
+    return encoded
+
+
+class AsyncHTTPClient:
+    """Asynchronous HTTP client"""
+
+    _ARG_HEADERS = "headers"
+    _ARG_PARAMS = "params"
+    _ARG_TIMEOUT = "timeout"
+    _ARG_IDEMPOTENT = "idempotent"
+
+    _DEFAULT_TIMEOUT_CONNECT_SEC = 15
+    _DEFAULT_TIMEOUT_READ_SEC = 120
+
+    _DEFAULT_TIMEOUTS = (_DEFAULT_TIMEOUT_CONNECT_SEC, _DEFAULT_TIMEOUT_READ_SEC)
+
+    def __init__(
+        self,
+        base_url: str,
+        default_headers: Optional[Dict[str, str]] = None,
+        transport: Optional[AsyncTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """Initialize asynchronous HTTP client."""
+        self.log = logging.getLogger(__name__)
+
+        self._base_url = base_url if not base_url.endswith("/") else base_url[:-1]
+        self._default_headers = default_headers
+
+        self._owns_transport = transport is None
+        self._transport = transport if transport is not None else AsyncTransport()
+
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+
+    @property
+    def base_url(self) -> str:
+        """Base URL."""
+        return self._base_url
+
+    @property
+    def transport(self) -> AsyncTransport:
+        """Asynchronous HTTP transport."""
+        return self._transport
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Rate limiter pacing requests sent by this client."""
+        return self._rate_limiter
+
+    async def close(self) -> None:
+        """Close the HTTP client.
+
+        A transport passed in by the caller is shared and left open.
+        """
+        if self._owns_transport:
+            await self._transport.close()
+
+    def _get_url(self, path):
+        return self._base_url + path
+
+    def _get_request_headers(
+        self, headers: Optional[Mapping[str, str]]
+    ) -> Optional[Mapping[str, str]]:
+        if self._default_headers is None:
+            return headers
+
+        new_headers = self._default_headers.copy()
+        if headers is not None:
+            new_headers.update(headers)
+
+        return new_headers
+
+    async def _request(
+        self, method: str, path: str, **kwargs: Any
+    ) -> requests.Response:
+        self.log.debug(
+            "_request method: %s, path: %s, kwargs: %s", method, path, kwargs
+        )
+
+        url = self._get_url(path)
+
+        timeout = kwargs.pop(self._ARG_TIMEOUT, None)
+        if timeout is None:
+            timeout = self._DEFAULT_TIMEOUTS
+
+        if isinstance(timeout, (int, float)):
+            connect_timeout = read_timeout = timeout
+        else:
+            connect_timeout, read_timeout = timeout
+        client_timeout = aiohttp.ClientTimeout(
+            sock_connect=connect_timeout, sock_read=read_timeout
+        )
+
+        request_headers = kwargs.pop(self._ARG_HEADERS, None)
+        request_headers = self._get_request_headers(request_headers)
+
+        params = kwargs.pop(self._ARG_PARAMS, None)
+        if params is not None:
+            kwargs[self._ARG_PARAMS] = _encode_params(params)
+
+        idempotent = kwargs.pop(self._ARG_IDEMPOTENT, None)
+
+        retry_policy = self._retry_policy
+        if retry_policy is None or not retry_policy.is_retryable_request(
+            method, idempotent
+        ):
+            return await self._send(
+                method, url, request_headers, client_timeout, **kwargs
+            )
+
+        attempt = 1
+        while True:
+            try:
+                response = await self._send(
+                    method, url, request_headers, client_timeout, **kwargs
+                )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = retry_policy.get_retry_delay(attempt)
+                if delay is None:
+                    raise
+
+                self.log.warning(
+                    "Request to '%s' failed (%r), retrying in %.2f seconds...",
+                    url,
+                    e,
+                    delay,
+                )
+            else:
+                status_code = response.status_code
+                delay = retry_policy.get_retry_delay(
+                    attempt, status_code, response.headers
+                )
+                if delay is None:
+                    return response
+
+                self.log.warning(
+                    "Request to '%s' failed with HTTP %d, retrying in %.2f seconds...",
+                    url,
+                    status_code,
+                    delay,
+                )
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        timeout: "aiohttp.ClientTimeout",
+        **kwargs: Any,
+    ) -> requests.Response:
+        rate_limiter = self._rate_limiter
+        if rate_limiter is not None:
+            while True:
+                delay = rate_limiter.try_acquire()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+        response = await self._transport.request(
+            method, url, headers=headers, timeout=timeout, **kwargs
+        )
+
+        if rate_limiter is not None:
+            rate_limiter.update(response.headers, response.status_code)
+
+        self.log.debug(
+            "_request response status code: %s, response_headers: %s",
+            response.status_code,
+            response.headers,
+        )
+
+        return response
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        """Send HTTP GET request."""
+        return await self._request("GET", path, params=params, headers=headers)
+
+    async def post(
+        self,
+        path: str,
+        data: Optional[Mapping[str, str]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        idempotent: bool = False,
+    ) -> requests.Response:
+        """Send HTTP POST request.
+
+        :param idempotent: Whether the request is safe to retry.
+        """
+        return await self._request(
+            "POST", path, data=data, json=json, headers=headers, idempotent=idempotent
+        )
+
+
+class AsyncAuthenticatedHTTPClient(AsyncHTTPClient):
+    """Asynchronous authenticated HTTP client."""
+
+    _DEFAULT_REFRESH_MARGIN_SEC = 60.0
+
+    def __init__(
+        self,
+        base_url: str,
+        authenticator: AbcAsyncAuthenticator,
+        transport: Optional[AsyncTransport] = None,
+        refresh_margin: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """Initialize asynchronous authenticated HTTP client
+
+        :param refresh_margin: Seconds before token expiry at which the token
+            is refreshed ahead of the next request.
+        """
+        super().__init__(
+            base_url,
+            transport=transport,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+        )
+        self.log = logging.getLogger(__name__)
+
+        if refresh_margin is None:
+            refresh_margin = self._DEFAULT_REFRESH_MARGIN_SEC
+
+        self._authenticator = authenticator
+        self._refresh_margin = refresh_margin
+        self._token: Optional[Token] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+
+    async def _refresh_token(self, stale_token: Optional[Token]) -> Token:
+        # Created lazily so that the lock is bound to the running event loop.
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+
+        # Single-flight: tasks holding the same stale token queue up on the
+        # lock and reuse the token fetched by whichever task got there first.
+        async with self._token_lock:
+            token = self._token
+            if (
+                token is not None
+                and token is not stale_token
+                and not token.is_expired(self._refresh_margin)
+            ):
+                return token
+
+            token = await self._authenticator.authenticate()
+            self._token = token
+            return token
+
+    async def _check_authorization(self) -> Token:
+        token = self._token
+        if token is None:
+            return await self._refresh_token(None)
+
+        if token.is_expired(self._refresh_margin):
+            self.log.info("Access token about to expire, refreshing...")
+            return await self._refresh_token(token)
+
+        return token
+
+    async def _reauthenticate(self, rejected_token: Token) -> Token:
+        await self._authenticator.invalidate(rejected_token)
+        return await self._refresh_token(rejected_token)
+
+    @staticmethod
+    def _get_authorization_header(
+        token: Token, headers: Optional[Dict[str, str]]
+    ) -> Mapping[str, str]:
+        authorization = token.headers.copy()
+
+        if headers is None:
+            new_headers = authorization
+        else:
+            new_headers = headers.copy()
+            new_headers.update(authorization)
+
+        return new_headers
+
+    async def _call_super_request(
+        self,
+        method: str,
+        path: str,
+        token: Token,
+        headers: Optional[Dict[str, str]],
+        **kwargs: Any,
+    ) -> requests.Response:
+        request_headers = self._get_authorization_header(token, headers)
+        return await super()._request(method, path, headers=request_headers, **kwargs)
+
+    async def _request(
+        self, method: str, path: str, **kwargs: Any
+    ) -> requests.Response:
+        token = await self._check_authorization()
+
+        headers = kwargs.pop(self._ARG_HEADERS, None)
+
+        response = await self._call_super_request(
+            method, path, token, headers=headers, **kwargs
+        )
+
+        status_code = response.status_code
+        if status_code == 401 or status_code == 403:
+            self.log.info("Unauthenticated, trying to reauthenticate...")
+
+            token = await self._reauthenticate(token)
+
+            response = await self._call_super_request(
+                method, path, token, headers=headers, **kwargs
+            )
+
+        return response
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 """HTTP authenticator module."""
 
+import time
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Optional
 
 
 class AuthenticatorException(Exception):
@@ -11,9 +12,51 @@ class AuthenticatorException(Exception):
     pass
 
 
+class Token:
+    """Authentication token."""
+
+    def __init__(
+        self, headers: Dict[str, str], expires_at: Optional[float] = None
+    ) -> None:
+        """Initialize authentication token.
+
+        :param headers: Headers that authenticate a request.
+        :param expires_at: Expiry as a POSIX timestamp, None if it never expires.
+        """
+        self.headers = headers
+        self.expires_at = expires_at
+
+    def expires_in(self) -> Optional[float]:
+        """Return the number of seconds until the token expires."""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.time()
+
+    def is_expired(self, margin: float = 0.0) -> bool:
+        """Check whether the token expires within the given margin in seconds."""
+        expires_in = self.expires_in()
+        if expires_in is None:
+            return False
+        return expires_in <= margin
+
+
 class AbcAuthenticator(ABC):
     """Abstract authenticator interface."""
 
     @abstractmethod
-    def authenticate(self) -> Dict[str, str]:
+    def authenticate(self) -> Token:
         """Perform authentication."""
+
+    def invalidate(self, token: Token) -> None:
+        """Invalidate a token rejected by the server."""
+
+
+class AbcAsyncAuthenticator(ABC):
+    """Abstract asynchronous authenticator interface."""
+
+    @abstractmethod
+    async def authenticate(self) -> Token:
+        """Perform authentication."""
+
+    async def invalidate(self, token: Token) -> None:
+        """Invalidate a token rejected by the server."""
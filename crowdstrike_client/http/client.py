@@ -2,12 +2,16 @@
 """HTTP client module."""
 
 import logging
+import threading
+import time
 from typing import Any, Dict, Mapping, Optional
 
 import requests
 
-from crowdstrike_client.http.authenticator import AbcAuthenticator
-from crowdstrike_client.http.exceptions import HTTPClientException
+from crowdstrike_client.http.authenticator import AbcAuthenticator, Token
+from crowdstrike_client.http.rate_limiter import RateLimiter
+from crowdstrike_client.http.retry import RetryPolicy
+from crowdstrike_client.http.transport import Transport
 
 
 class HTTPClient:
@@ -15,6 +19,7 @@ class HTTPClient:
 
     _ARG_HEADERS = "headers"
     _ARG_TIMEOUT = "timeout"
+    _ARG_IDEMPOTENT = "idempotent"
 
     _DEFAULT_TIMEOUT_CONNECT_SEC = 15
     _DEFAULT_TIMEOUT_READ_SEC = 120
@@ -22,7 +27,12 @@ class HTTPClient:
     _DEFAULT_TIMEOUTS = (_DEFAULT_TIMEOUT_CONNECT_SEC, _DEFAULT_TIMEOUT_READ_SEC)
 
     def __init__(
-        self, base_url: str, default_headers: Optional[Dict[str, str]] = None
+        self,
+        base_url: str,
+        default_headers: Optional[Dict[str, str]] = None,
+        transport: Optional[Transport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> None:
         """Initialize HTTP client."""
         self.log = logging.getLogger(__name__)
@@ -30,6 +40,35 @@ class HTTPClient:
         self._base_url = base_url if not base_url.endswith("/") else base_url[:-1]
         self._default_headers = default_headers
 
+        self._owns_transport = transport is None
+        self._transport = transport if transport is not None else Transport()
+
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+
+    @property
+    def base_url(self) -> str:
+        """Base URL."""
+        return self._base_url
+
+    @property
+    def transport(self) -> Transport:
+        """HTTP transport."""
+        return self._transport
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Rate limiter pacing requests sent by this client."""
+        return self._rate_limiter
+
+    def close(self) -> None:
+        """Close the HTTP client.
+
+        A transport passed in by the caller is shared and left open.
+        """
+        if self._owns_transport:
+            self._transport.close()
+
     def _get_url(self, path):
         return self._base_url + path
 
@@ -69,10 +108,68 @@ class HTTPClient:
             kwargs,
         )
 
-        response = requests.request(
-            method, url, headers=request_headers, timeout=timeout, **kwargs
+        idempotent = kwargs.pop(self._ARG_IDEMPOTENT, None)
+
+        retry_policy = self._retry_policy
+        if retry_policy is None or not retry_policy.is_retryable_request(
+            method, idempotent
+        ):
+            return self._send(method, url, request_headers, timeout, **kwargs)
+
+        attempt = 1
+        while True:
+            try:
+                response = self._send(method, url, request_headers, timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = retry_policy.get_retry_delay(attempt)
+                if delay is None:
+                    raise
+
+                self.log.warning(
+                    "Request to '%s' failed (%s), retrying in %.2f seconds...",
+                    url,
+                    e,
+                    delay,
+                )
+            else:
+                status_code = response.status_code
+                delay = retry_policy.get_retry_delay(
+                    attempt, status_code, response.headers
+                )
+                if delay is None:
+                    return response
+
+                self.log.warning(
+                    "Request to '%s' failed with HTTP %d, retrying in %.2f seconds...",
+                    url,
+                    status_code,
+                    delay,
+                )
+
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        timeout: Any,
+        **kwargs: Any,
+    ) -> requests.Response:
+        rate_limiter = self._rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        response = self._transport.request(
+            method, url, headers=headers, timeout=timeout, **kwargs
         )
 
+        if rate_limiter is not None:
+            rate_limiter.update(response.headers, response.status_code)
+
         self.log.debug(
             "_request response status code: %s, response_headers: %s",
             response.status_code,
@@ -86,9 +183,13 @@ class HTTPClient:
         path: str,
         params: Optional[Mapping[str, str]] = None,
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> requests.Response:
-        """Send HTTP GET request."""
-        return self._request("GET", path, params=params, headers=headers)
+        """Send HTTP GET request.
+
+        :param stream: Defer reading the response body until it is accessed.
+        """
+        return self._request("GET", path, params=params, headers=headers, stream=stream)
 
     def post(
         self,
@@ -96,37 +197,88 @@ class HTTPClient:
         data: Optional[Mapping[str, str]] = None,
         json: Optional[Any] = None,
         headers: Optional[Mapping[str, str]] = None,
+        idempotent: bool = False,
     ) -> requests.Response:
-        """Send HTTP POST request."""
-        return self._request("POST", path, data=data, json=json, headers=headers)
+        """Send HTTP POST request.
+
+        :param idempotent: Whether the request is safe to retry.
+        """
+        return self._request(
+            "POST", path, data=data, json=json, headers=headers, idempotent=idempotent
+        )
 
 
 class AuthenticatedHTTPClient(HTTPClient):
     """Authenticated HTTP client."""
 
-    def __init__(self, base_url: str, authenticator: AbcAuthenticator) -> None:
-        """Initialize authenticated HTTP client"""
-        super().__init__(base_url)
-        self.log = logging.getLogger(__name__)
-
-        self._authenticator = authenticator
-        self._authorization: Optional[Dict[str, str]] = None
+    _DEFAULT_REFRESH_MARGIN_SEC = 60.0
 
-    def _check_authorization(self) -> None:
-        if self._authorization is None:
-            self._authorization = self._authenticator.authenticate()
+    def __init__(
+        self,
+        base_url: str,
+        authenticator: AbcAuthenticator,
+        transport: Optional[Transport] = None,
+        refresh_margin: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """Initialize authenticated HTTP client
+
+        :param refresh_margin: Seconds before token expiry at which the token
+            is refreshed ahead of the next request.
+        """
+        super().__init__(
+            base_url,
+            transport=transport,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+        )
+        self.log = logging.getLogger(__name__)
 
-    def _reauthenticate(self):
-        self._authorization = None
-        self._check_authorization()
+        if refresh_margin is None:
+            refresh_margin = self._DEFAULT_REFRESH_MARGIN_SEC
 
+        self._authenticator = authenticator
+        self._refresh_margin = refresh_margin
+        self._token: Optional[Token] = None
+        self._token_lock = threading.Lock()
+
+    def _refresh_token(self, stale_token: Optional[Token]) -> Token:
+        # Single-flight: callers holding the same stale token queue up on the
+        # lock and reuse the token fetched by whichever caller got there first.
+        with self._token_lock:
+            token = self._token
+            if (
+                token is not None
+                and token is not stale_token
+                and not token.is_expired(self._refresh_margin)
+            ):
+                return token
+
+            token = self._authenticator.authenticate()
+            self._token = token
+            return token
+
+    def _check_authorization(self) -> Token:
+        token = self._token
+        if token is None:
+            return self._refresh_token(None)
+
+        if token.is_expired(self._refresh_margin):
+            self.log.info("Access token about to expire, refreshing...")
+            return self._refresh_token(token)
+
+        return token
+
+    def _reauthenticate(self, rejected_token: Token) -> Token:
+        self._authenticator.invalidate(rejected_token)
+        return self._refresh_token(rejected_token)
+
+    @staticmethod
     def _get_authorization_header(
-        self, headers: Optional[Dict[str, str]]
+        token: Token, headers: Optional[Dict[str, str]]
     ) -> Mapping[str, str]:
-        if self._authorization is None:
-            raise HTTPClientException("_authorization cannot be None")
-
-        authorization = self._authorization.copy()
+        authorization = token.headers.copy()
 
         if headers is None:
             new_headers = authorization
@@ -137,24 +289,36 @@ class AuthenticatedHTTPClient(HTTPClient):
         return new_headers
 
     def _call_super_request(
-        self, method: str, path: str, headers: Optional[Dict[str, str]], **kwargs: Any
+        self,
+        method: str,
+        path: str,
+        token: Token,
+        headers: Optional[Dict[str, str]],
+        **kwargs: Any,
     ) -> requests.Response:
-        request_headers = self._get_authorization_header(headers)
+        request_headers = self._get_authorization_header(token, headers)
         return super()._request(method, path, headers=request_headers, **kwargs)
 
     def _request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
-        self._check_authorization()
+        token = self._check_authorization()
 
         headers = kwargs.pop(self._ARG_HEADERS, None)
 
-        response = self._call_super_request(method, path, headers=headers, **kwargs)
+        response = self._call_super_request(
+            method, path, token, headers=headers, **kwargs
+        )
 
         status_code = response.status_code
         if status_code == 401 or status_code == 403:
             self.log.info("Unauthenticated, trying to reauthenticate...")
 
-            self._reauthenticate()
+            # Release the connection of a streamed response before retrying.
+            response.close()
+
+            token = self._reauthenticate(token)
 
-            response = self._call_super_request(method, path, headers=headers, **kwargs)
+            response = self._call_super_request(
+                method, path, token, headers=headers, **kwargs
+            )
 
         return response
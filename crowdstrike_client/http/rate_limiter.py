@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""HTTP rate limiter module."""
+
+import logging
+import threading
+import time
+from typing import Mapping, Optional
+
+
+_HEADER_RATE_LIMIT_LIMIT = "X-RateLimit-Limit"
+_HEADER_RATE_LIMIT_REMAINING = "X-RateLimit-Remaining"
+_HEADER_RATE_LIMIT_RETRY_AFTER = "X-RateLimit-RetryAfter"
+
+# Values below this are treated as a delay in seconds, above it as a POSIX
+# timestamp (the CrowdStrike API sends the latter).
+_RETRY_AFTER_TIMESTAMP_THRESHOLD = 1000000000
+
+
+class RateLimiter:
+    """Token bucket rate limiter fed by X-RateLimit response headers.
+
+    The bucket size and refill rate follow the X-RateLimit-Limit header, the
+    bucket level is capped by X-RateLimit-Remaining, and all callers are held
+    back until X-RateLimit-RetryAfter once the limit is hit. Until the first
+    response with rate limit headers is seen, requests are not throttled.
+    """
+
+    _DEFAULT_PERIOD_SEC = 60.0
+
+    def __init__(self, period: float = _DEFAULT_PERIOD_SEC, reserve: int = 0) -> None:
+        """Initialize rate limiter.
+
+        :param period: Period in seconds over which the rate limit applies.
+        :param reserve: Number of requests of the budget left unused, as
+            headroom for other clients sharing the same API credentials.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self._period = period
+        self._reserve = reserve
+
+        self._lock = threading.Lock()
+        self._limit: Optional[int] = None
+        self._tokens = 0.0
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    @property
+    def limit(self) -> Optional[int]:
+        """Number of requests allowed per period, None if not yet known."""
+        return self._limit
+
+    @property
+    def budget(self) -> Optional[float]:
+        """Number of requests that can currently be sent without waiting."""
+        with self._lock:
+            if self._limit is None:
+                return None
+
+            now = time.monotonic()
+            self._refill(now)
+
+            if now < self._blocked_until:
+                return 0.0
+
+            return max(self._tokens - self._reserve, 0.0)
+
+    def _refill(self, now: float) -> None:
+        limit = self._limit
+        if limit is None:
+            return
+
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            rate = limit / self._period
+            self._tokens = min(self._tokens + elapsed * rate, float(limit))
+
+        self._updated_at = now
+
+    def try_acquire(self) -> float:
+        """Take a request from the budget.
+
+        Return 0 if a request may be sent, otherwise the number of seconds to
+        wait before trying again.
+        """
+        with self._lock:
+            limit = self._limit
+            if limit is None:
+                return 0.0
+
+            now = time.monotonic()
+            self._refill(now)
+
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            needed = min(1.0 + self._reserve, float(limit))
+            if self._tokens >= needed:
+                self._tokens -= 1.0
+                return 0.0
+
+            rate = limit / self._period
+            return (needed - self._tokens) / rate
+
+    def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            delay = self.try_acquire()
+            if delay <= 0:
+                return
+
+            self.log.debug("Rate limit budget exhausted, waiting %.3f seconds", delay)
+            time.sleep(delay)
+
+    def update(
+        self, headers: Mapping[str, str], status_code: Optional[int] = None
+    ) -> None:
+        """Update rate limit state from response headers.
+
+        :param status_code: Response status code, X-RateLimit-RetryAfter only
+            holds callers back on a 429 response or with no requests remaining.
+        """
+        limit = _parse_int_header(headers, _HEADER_RATE_LIMIT_LIMIT)
+        remaining = _parse_int_header(headers, _HEADER_RATE_LIMIT_REMAINING)
+        retry_after = parse_rate_limit_retry_after(headers)
+
+        if limit is None and remaining is None and retry_after is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+
+            if limit is not None and limit > 0:
+                if self._limit is None:
+                    self._tokens = float(limit)
+                self._limit = limit
+
+            self._refill(now)
+
+            if remaining is not None:
+                # Responses arrive out of order across threads, so the server
+                # count only ever lowers the local estimate.
+                self._tokens = min(self._tokens, float(remaining))
+
+            if (
+                retry_after is not None
+                and retry_after > 0
+                and (status_code == 429 or remaining == 0)
+            ):
+                self._tokens = 0.0
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+            tokens = self._tokens
+
+        self.log.debug(
+            "Rate limit: limit %s, remaining %s, budget %.1f", limit, remaining, tokens
+        )
+
+
+def _parse_int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def parse_rate_limit_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Return the X-RateLimit-RetryAfter delay in seconds, if present."""
+    value = headers.get(_HEADER_RATE_LIMIT_RETRY_AFTER)
+    if value is None:
+        return None
+
+    try:
+        retry_after = float(value)
+    except ValueError:
+        return None
+
+    if retry_after >= _RETRY_AFTER_TIMESTAMP_THRESHOLD:
+        retry_after -= time.time()
+
+    return max(retry_after, 0.0)
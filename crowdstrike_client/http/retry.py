@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""HTTP retry module."""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import AbstractSet, Iterable, Mapping, Optional
+
+from crowdstrike_client.http.rate_limiter import parse_rate_limit_retry_after
+
+
+_HEADER_RETRY_AFTER = "Retry-After"
+
+
+class RetryPolicy:
+    """Retry policy with exponential backoff and full jitter.
+
+    Only idempotent requests are retried. GET, HEAD, OPTIONS, PUT and DELETE
+    requests are idempotent, other requests only when flagged as such by the
+    caller. Server-provided Retry-After and X-RateLimit-RetryAfter delays take
+    precedence over the computed backoff, up to the maximum backoff.
+    """
+
+    _DEFAULT_MAX_ATTEMPTS = 5
+    _DEFAULT_BACKOFF_FACTOR_SEC = 0.5
+    _DEFAULT_MAX_BACKOFF_SEC = 60.0
+
+    _DEFAULT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    _IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        max_attempts: int = _DEFAULT_MAX_ATTEMPTS,
+        backoff_factor: float = _DEFAULT_BACKOFF_FACTOR_SEC,
+        max_backoff: float = _DEFAULT_MAX_BACKOFF_SEC,
+        status_codes: Optional[Iterable[int]] = None,
+        retry_connection_errors: bool = True,
+    ) -> None:
+        """Initialize retry policy.
+
+        :param max_attempts: Maximum number of attempts, including the first.
+        :param backoff_factor: Base delay in seconds, doubled on every attempt.
+        :param max_backoff: Maximum delay in seconds between two attempts.
+        :param status_codes: HTTP status codes to retry on.
+        :param retry_connection_errors: Retry on connection errors and timeouts.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_codes: AbstractSet[int] = (
+            frozenset(status_codes)
+            if status_codes is not None
+            else self._DEFAULT_STATUS_CODES
+        )
+        self.retry_connection_errors = retry_connection_errors
+
+    def is_retryable_request(self, method: str, idempotent: Optional[bool]) -> bool:
+        """Check whether a request may be retried."""
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self._IDEMPOTENT_METHODS
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """Check whether a response status code should be retried."""
+        return status_code in self.status_codes
+
+    def get_backoff(self, attempt: int) -> float:
+        """Return the jittered backoff in seconds after the given attempt."""
+        backoff = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        return random.uniform(0, backoff)
+
+    def get_delay(
+        self, attempt: int, headers: Optional[Mapping[str, str]] = None
+    ) -> float:
+        """Return the delay in seconds before the next attempt."""
+        if headers is not None:
+            retry_after = _parse_retry_after(headers)
+            if retry_after is None:
+                retry_after = parse_rate_limit_retry_after(headers)
+
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        return self.get_backoff(attempt)
+
+    def get_retry_delay(
+        self,
+        attempt: int,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """Return the delay in seconds before retrying a failed attempt.
+
+        :param attempt: Number of the failed attempt, starting at 1.
+        :param status_code: Response status code, None if the attempt failed
+            with a connection error or timeout.
+        :param headers: Response headers.
+        :return: None if the attempt should not be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if status_code is None:
+            if not self.retry_connection_errors:
+                return None
+        elif not self.is_retryable_status(status_code):
+            return None
+
+        return self.get_delay(attempt, headers)
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    value = headers.get(_HEADER_RETRY_AFTER)
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(retry_at.timestamp() - time.time(), 0.0)
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""HTTP token store module."""
+
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from crowdstrike_client.http.authenticator import Token
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+
+class AbcTokenStore(ABC):
+    """Abstract token store interface."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Token]:
+        """Get a stored token, None if there is no live token for the key."""
+
+    @abstractmethod
+    def set(self, key: str, token: Token) -> None:
+        """Store a token."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete a stored token."""
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the store lock while checking for and fetching a token."""
+        yield
+
+
+class FileTokenStore(AbcTokenStore):
+    """File token store shared between processes.
+
+    Tokens are kept in a single JSON file only readable by the current user.
+    Writers serialize on an exclusive lock on a sidecar lock file and replace
+    the token file atomically, so readers never see a partial write.
+
+    If the file cannot be read or written, for example in a read-only home
+    directory, a warning is logged and tokens are not cached.
+    """
+
+    _JSON_HEADERS = "headers"
+    _JSON_EXPIRES_AT = "expires_at"
+
+    _DEFAULT_FILENAME = "tokens.json"
+    _LOCK_FILE_SUFFIX = ".lock"
+
+    _DIR_MODE = 0o700
+    _FILE_MODE = 0o600
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize file token store.
+
+        :param path: Token file path, defaults to a file in the user cache
+            directory.
+        """
+        self.log = logging.getLogger(__name__)
+
+        if path is None:
+            path = os.path.join(_get_default_cache_dir(), self._DEFAULT_FILENAME)
+
+        self._path = path
+        self._lock_path = path + self._LOCK_FILE_SUFFIX
+
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file: Optional[Any] = None
+
+    @property
+    def path(self) -> str:
+        """Token file path."""
+        return self._path
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold the store lock while checking for and fetching a token."""
+        with self._thread_lock:
+            if self._lock_depth == 0:
+                self._acquire_file_lock()
+
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    self._release_file_lock()
+
+    def _acquire_file_lock(self) -> None:
+        try:
+            directory = os.path.dirname(self._lock_path)
+            if directory:
+                os.makedirs(directory, mode=self._DIR_MODE, exist_ok=True)
+
+            fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, self._FILE_MODE)
+        except OSError as e:
+            self.log.warning(
+                "Failed to open token lock file '%s': %s", self._lock_path, e
+            )
+            return
+
+        lock_file = os.fdopen(fd, "r+")
+
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            except OSError as e:
+                self.log.warning(
+                    "Failed to lock token lock file '%s': %s", self._lock_path, e
+                )
+                lock_file.close()
+                return
+
+        self._lock_file = lock_file
+
+    def _release_file_lock(self) -> None:
+        lock_file = self._lock_file
+        if lock_file is None:
+            return
+
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+        lock_file.close()
+        self._lock_file = None
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            self.log.warning("Ignoring corrupt token file '%s'", self._path)
+            return {}
+        except OSError as e:
+            self.log.warning("Failed to read token file '%s': %s", self._path, e)
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+
+        return data
+
+    def _write(self, data: Mapping[str, Any]) -> None:
+        try:
+            self._replace(data)
+        except OSError as e:
+            self.log.warning("Failed to write token file '%s': %s", self._path, e)
+
+    def _replace(self, data: Mapping[str, Any]) -> None:
+        directory = os.path.dirname(self._path) or "."
+        os.makedirs(directory, mode=self._DIR_MODE, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+        try:
+            os.chmod(tmp_path, self._FILE_MODE)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def _prune_expired(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        now = time.time()
+        live = {}
+        for k, v in data.items():
+            if not isinstance(v, dict):
+                continue
+
+            expires_at = v.get(self._JSON_EXPIRES_AT)
+            if expires_at is None or (
+                isinstance(expires_at, (int, float)) and expires_at > now
+            ):
+                live[k] = v
+        return live
+
+    def get(self, key: str) -> Optional[Token]:
+        """Get a stored token, None if there is no live token for the key."""
+        entry = self._read().get(key)
+        if not isinstance(entry, dict):
+            return None
+
+        try:
+            token = Token(entry[self._JSON_HEADERS], entry[self._JSON_EXPIRES_AT])
+            if token.is_expired():
+                return None
+        except (KeyError, TypeError):
+            return None
+
+        return token
+
+    def set(self, key: str, token: Token) -> None:
+        """Store a token."""
+        with self.lock():
+            data = self._prune_expired(self._read())
+            data[key] = {
+                self._JSON_HEADERS: token.headers,
+                self._JSON_EXPIRES_AT: token.expires_at,
+            }
+            self._write(data)
+
+    def delete(self, key: str) -> None:
+        """Delete a stored token."""
+        with self.lock():
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(self._prune_expired(data))
+
+
+def _get_default_cache_dir() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        cache_home = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "crowdstrike_client")
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""HTTP transport module."""
+
+import logging
+from types import TracebackType
+from typing import Any, Optional, Type
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class Transport:
+    """Pooled, keep-alive HTTP transport backed by a requests session."""
+
+    _HEADER_CONNECTION = "Connection"
+
+    _CONNECTION_CLOSE = "close"
+
+    _DEFAULT_POOL_CONNECTIONS = 10
+    _DEFAULT_POOL_MAXSIZE = 10
+
+    def __init__(
+        self,
+        pool_connections: int = _DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = _DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ) -> None:
+        """Initialize HTTP transport.
+
+        :param pool_connections: Number of per-host connection pools to cache.
+        :param pool_maxsize: Maximum number of connections kept per host.
+        :param pool_block: Block when all connections to a host are in use
+            instead of opening an extra, non-pooled connection.
+        :param keep_alive: Reuse connections between requests.
+        """
+        self.log = logging.getLogger(__name__)
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if not keep_alive:
+            session.headers[self._HEADER_CONNECTION] = self._CONNECTION_CLOSE
+
+        self._session = session
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the transport has been closed."""
+        return self._closed
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send HTTP request."""
+        return self._session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """Close the transport and all pooled connections."""
+        if self._closed:
+            return
+
+        self.log.debug("Closing transport")
+
+        self._session.close()
+        self._closed = True
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
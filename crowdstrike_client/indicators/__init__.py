@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike indicator sync and local lookup module."""
+
+from crowdstrike_client.indicators.checkpoint import AbcCheckpointStore, Checkpoint
+from crowdstrike_client.indicators.checkpoint import FileCheckpointStore
+from crowdstrike_client.indicators.checkpoint import MemoryCheckpointStore
+from crowdstrike_client.indicators.index import CIDRIndex, DomainIndex
+from crowdstrike_client.indicators.matcher import BloomFilter, IndicatorMatcher
+from crowdstrike_client.indicators.store import IndicatorStore
+from crowdstrike_client.indicators.sync import IndicatorSync, SyncPage, SyncResult
+
+__all__ = [
+    "AbcCheckpointStore",
+    "Checkpoint",
+    "FileCheckpointStore",
+    "MemoryCheckpointStore",
+    "CIDRIndex",
+    "DomainIndex",
+    "BloomFilter",
+    "IndicatorMatcher",
+    "IndicatorStore",
+    "IndicatorSync",
+    "SyncPage",
+    "SyncResult",
+]
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Indicator sync checkpoint module."""
+
+import contextlib
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from crowdstrike_client.api.models.base import Base
+
+
+class Checkpoint(Base):
+    """Indicator sync checkpoint.
+
+    last_updated is the high-water mark of the indicators synced so far, as
+    POSIX seconds. While a run is in progress, since holds the high-water
+    mark the run started from and next_page the next page value of the last
+    committed page, from which an interrupted run resumes.
+    """
+
+    last_updated: Optional[float] = None
+    since: Optional[float] = None
+    next_page: Optional[str] = None
+
+
+class AbcCheckpointStore(ABC):
+    """Abstract checkpoint store interface."""
+
+    @abstractmethod
+    def load(self) -> Optional[Checkpoint]:
+        """Load the checkpoint, None if there is none."""
+
+    @abstractmethod
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Save the checkpoint."""
+
+
+class MemoryCheckpointStore(AbcCheckpointStore):
+    """Checkpoint store keeping the checkpoint in memory."""
+
+    def __init__(self, checkpoint: Optional[Checkpoint] = None) -> None:
+        """Initialize memory checkpoint store."""
+        self._checkpoint = checkpoint
+
+    def load(self) -> Optional[Checkpoint]:
+        """Load the checkpoint, None if there is none."""
+        return self._checkpoint
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Save the checkpoint."""
+        self._checkpoint = checkpoint
+
+
+class FileCheckpointStore(AbcCheckpointStore):
+    """File checkpoint store.
+
+    The checkpoint file is replaced atomically, so after a crash it holds
+    either the previous or the new checkpoint, never a partial write.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize file checkpoint store.
+
+        :param path: Checkpoint file path.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        """Checkpoint file path."""
+        return self._path
+
+    def load(self) -> Optional[Checkpoint]:
+        """Load the checkpoint, None if there is none."""
+        try:
+            return Checkpoint.parse_file(self._path)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            self.log.warning("Ignoring corrupt checkpoint file '%s'", self._path)
+            return None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        """Save the checkpoint."""
+        directory = os.path.dirname(self._path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".checkpoint-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(checkpoint.json())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Structured indicator index module."""
+
+import ipaddress
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from crowdstrike_client.api.models.indicator_batch import get_field
+
+
+def _get_indexable(
+    indicators: Iterable[Any], types: Sequence[str]
+) -> Iterable[Tuple[str, str]]:
+    for indicator in indicators:
+        if get_field(indicator, "deleted"):
+            continue
+        if get_field(indicator, "type") not in types:
+            continue
+        yield get_field(indicator, "indicator"), get_field(indicator, "id")
+
+
+class CIDRIndex:
+    """Index of IPv4 and IPv6 addresses and networks for containment lookups.
+
+    Networks are held in one hash table per IP version and prefix length,
+    keyed by the network address. A lookup masks the address once for every
+    prefix length in use, so its cost is bounded by the number of distinct
+    prefix lengths rather than the number of networks.
+    """
+
+    _DEFAULT_TYPES = ("ip_address", "ip_address_block")
+
+    def __init__(self) -> None:
+        """Initialize empty CIDR index."""
+        self.log = logging.getLogger(__name__)
+
+        # IP version -> prefix length -> network address -> indicator IDs
+        self._networks: Dict[int, Dict[int, Dict[int, List[str]]]] = {4: {}, 6: {}}
+        self._prefix_lengths: Dict[int, List[int]] = {4: [], 6: []}
+        self._size = 0
+
+    @classmethod
+    def from_indicators(
+        cls, indicators: Iterable[Any], types: Sequence[str] = _DEFAULT_TYPES
+    ) -> "CIDRIndex":
+        """Create CIDR index from indicators, as models or dicts.
+
+        Indicators flagged as deleted and values that are not addresses or
+        networks are left out.
+        """
+        index = cls()
+        for value, indicator_id in _get_indexable(indicators, types):
+            try:
+                index.add(value, indicator_id)
+            except ValueError:
+                index.log.debug("Skipping invalid network '%s'", value)
+        return index
+
+    def add(self, network: str, indicator_id: str) -> None:
+        """Add an address or network in CIDR notation."""
+        parsed = ipaddress.ip_network(network.strip(), strict=False)
+        version = parsed.version
+        prefix_length = parsed.prefixlen
+
+        by_prefix_length = self._networks[version]
+        if prefix_length not in by_prefix_length:
+            by_prefix_length[prefix_length] = {}
+            # Most specific networks first.
+            self._prefix_lengths[version] = sorted(by_prefix_length, reverse=True)
+
+        by_address = by_prefix_length[prefix_length]
+        by_address.setdefault(int(parsed.network_address), []).append(indicator_id)
+        self._size += 1
+
+    def lookup(self, address: str) -> List[str]:
+        """Return the IDs of the indicators containing an address.
+
+        IDs are ordered from the most to the least specific network. Invalid
+        addresses match nothing.
+        """
+        try:
+            parsed = ipaddress.ip_address(address.strip())
+        except ValueError:
+            return []
+
+        version = parsed.version
+        value = int(parsed)
+        max_prefix_length = parsed.max_prefixlen
+        by_prefix_length = self._networks[version]
+
+        result: List[str] = []
+        for prefix_length in self._prefix_lengths[version]:
+            network_address = value >> (max_prefix_length - prefix_length)
+            network_address <<= max_prefix_length - prefix_length
+
+            ids = by_prefix_length[prefix_length].get(network_address)
+            if ids is not None:
+                result.extend(ids)
+        return result
+
+    def lookup_many(self, addresses: Iterable[str]) -> List[List[str]]:
+        """Return the IDs of the indicators containing each address."""
+        return [self.lookup(address) for address in addresses]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class DomainIndex:
+    """Index of domains for domain and subdomain lookups.
+
+    Domains are held in a trie of their labels in reverse order, so a lookup
+    walks one node per label of the queried domain and finds the indicators
+    for the domain itself and all of its parent domains.
+    """
+
+    _DEFAULT_TYPES = ("domain",)
+
+    # Key of the indicator IDs in a trie node, never a valid label.
+    _IDS = ""
+
+    def __init__(self) -> None:
+        """Initialize empty domain index."""
+        self.log = logging.getLogger(__name__)
+
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+
+    @classmethod
+    def from_indicators(
+        cls, indicators: Iterable[Any], types: Sequence[str] = _DEFAULT_TYPES
+    ) -> "DomainIndex":
+        """Create domain index from indicators, as models or dicts.
+
+        Indicators flagged as deleted are left out.
+        """
+        index = cls()
+        for value, indicator_id in _get_indexable(indicators, types):
+            index.add(value, indicator_id)
+        return index
+
+    @staticmethod
+    def _get_labels(domain: str) -> Optional[List[str]]:
+        labels = domain.strip().rstrip(".").lower().split(".")
+        if not all(labels):
+            return None
+        labels.reverse()
+        return labels
+
+    def add(self, domain: str, indicator_id: str) -> None:
+        """Add a domain."""
+        labels = self._get_labels(domain)
+        if labels is None:
+            self.log.debug("Skipping invalid domain '%s'", domain)
+            return
+
+        node = self._root
+        for label in labels:
+            node = node.setdefault(label, {})
+        node.setdefault(self._IDS, []).append(indicator_id)
+        self._size += 1
+
+    def lookup(self, domain: str) -> List[str]:
+        """Return the IDs of the indicators for a domain or its parents.
+
+        IDs are ordered from the least to the most specific domain.
+        """
+        labels = self._get_labels(domain)
+        if labels is None:
+            return []
+
+        result: List[str] = []
+        node = self._root
+        for label in labels:
+            child = node.get(label)
+            if child is None:
+                break
+            node = child
+
+            ids = node.get(self._IDS)
+            if ids is not None:
+                result.extend(ids)
+        return result
+
+    def lookup_many(self, domains: Iterable[str]) -> List[List[str]]:
+        """Return the IDs of the indicators for each domain or its parents."""
+        return [self.lookup(domain) for domain in domains]
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""Probabilistic indicator matcher module."""
+
+import json
+import logging
+import math
+import mmap
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from zlib import crc32
+
+from crowdstrike_client.api.models.indicator_batch import get_field
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+
+_Buffer = Union[bytearray, memoryview]
+
+
+def _hash(data: bytes) -> Tuple[int, int]:
+    # Two 32-bit hashes for double hashing, the second one odd so that the
+    # probes never collapse onto the same bit.
+    return crc32(data), crc32(data[::-1]) | 1
+
+
+class BloomFilter:
+    """Bloom filter over strings.
+
+    Membership checks never miss an added value and report values that were
+    not added with about the configured error rate. Filters loaded from a
+    file are read-only.
+    """
+
+    def __init__(
+        self, num_bits: int, num_hashes: int, data: Optional[_Buffer] = None
+    ) -> None:
+        """Initialize Bloom filter.
+
+        :param num_bits: Number of bits of the filter.
+        :param num_hashes: Number of bits set per value.
+        :param data: Filter bits, a new empty filter is created if not provided.
+        """
+        if data is None:
+            data = bytearray((num_bits + 7) // 8)
+
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.data = data
+
+    @classmethod
+    def create(cls, capacity: int, error_rate: float) -> "BloomFilter":
+        """Create a Bloom filter sized for the capacity and error rate."""
+        capacity = max(capacity, 1)
+        num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        num_hashes = max(round(num_bits / capacity * math.log(2)), 1)
+        return cls(num_bits, num_hashes)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the filter bits in bytes."""
+        return len(self.data)
+
+    def add(self, value: str) -> None:
+        """Add a value."""
+        data = self.data
+        num_bits = self.num_bits
+
+        h1, h2 = _hash(value.encode("utf-8"))
+        for i in range(self.num_hashes):
+            bit = (h1 + i * h2) % num_bits
+            data[bit >> 3] |= 1 << (bit & 7)
+
+    def add_many(self, values: Iterable[str]) -> None:
+        """Add values."""
+        for value in values:
+            self.add(value)
+
+    def __contains__(self, value: str) -> bool:
+        data = self.data
+        num_bits = self.num_bits
+
+        h1, h2 = _hash(value.encode("utf-8"))
+        for i in range(self.num_hashes):
+            bit = (h1 + i * h2) % num_bits
+            if not data[bit >> 3] >> (bit & 7) & 1:
+                return False
+        return True
+
+    def contains_many(self, values: Sequence[str]) -> List[bool]:
+        """Check the membership of values."""
+        if numpy is not None and values:
+            return self._probe(*_hash_many(values)).tolist()
+
+        return [value in self for value in values]
+
+    def _probe(self, h1: "numpy.ndarray", h2: "numpy.ndarray") -> "numpy.ndarray":
+        data = numpy.frombuffer(self.data, dtype=numpy.uint8)
+        num_bits = numpy.uint64(self.num_bits)
+
+        # Hashes are below 2**32 and the number of hashes small, so the probe
+        # arithmetic cannot overflow 64 bits and matches the scalar path.
+        result = numpy.ones(len(h1), dtype=numpy.bool_)
+        for i in range(self.num_hashes):
+            bits = (h1 + numpy.uint64(i) * h2) % num_bits
+            shifts = (bits & numpy.uint64(7)).astype(numpy.uint8)
+            result &= (data[bits >> numpy.uint64(3)] >> shifts) & 1 == 1
+        return result
+
+
+def _hash_many(values: Sequence[str]) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+    encoded = [value.encode("utf-8") for value in values]
+    count = len(encoded)
+
+    h1 = numpy.fromiter((crc32(d) for d in encoded), numpy.uint64, count)
+    h2 = numpy.fromiter((crc32(d[::-1]) for d in encoded), numpy.uint64, count)
+    h2 |= numpy.uint64(1)
+    return h1, h2
+
+
+class IndicatorMatcher:
+    """Probabilistic in-memory indicator matcher for screening log streams.
+
+    Indicator values are held in one Bloom filter per indicator type. A match
+    means the value is probably a known indicator and should be confirmed
+    against an exact store, no match means it definitely is not one.
+
+    A matcher can be saved to a file and loaded memory-mapped, so that many
+    worker processes share a single copy of the filters in the page cache.
+    """
+
+    _DEFAULT_ERROR_RATE = 0.001
+
+    _FILE_MAGIC = b"CSIMBF01"
+    _FILE_HEADER = struct.Struct("<8sI")
+    _FILE_ALIGNMENT = 8
+
+    _JSON_FILTERS = "filters"
+    _JSON_OFFSET = "offset"
+    _JSON_NUM_BITS = "num_bits"
+    _JSON_NUM_HASHES = "num_hashes"
+
+    def __init__(self, filters: Optional[Dict[str, BloomFilter]] = None) -> None:
+        """Initialize indicator matcher with Bloom filters by indicator type."""
+        self.log = logging.getLogger(__name__)
+
+        self.filters: Dict[str, BloomFilter] = filters if filters is not None else {}
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+
+    @classmethod
+    def from_indicators(
+        cls, indicators: Iterable[Any], error_rate: float = _DEFAULT_ERROR_RATE
+    ) -> "IndicatorMatcher":
+        """Create indicator matcher from indicators, as models or dicts.
+
+        Indicators flagged as deleted are left out.
+        """
+        values_by_type: Dict[str, List[str]] = {}
+        for indicator in indicators:
+            if get_field(indicator, "deleted"):
+                continue
+
+            indicator_type = get_field(indicator, "type")
+            values_by_type.setdefault(indicator_type, []).append(
+                get_field(indicator, "indicator")
+            )
+
+        filters = {}
+        for indicator_type, values in values_by_type.items():
+            bloom_filter = BloomFilter.create(len(values), error_rate)
+            bloom_filter.add_many(values)
+            filters[indicator_type] = bloom_filter
+
+        return cls(filters)
+
+    @property
+    def types(self) -> List[str]:
+        """Indicator types with a filter."""
+        return list(self.filters)
+
+    def _get_filters(self, indicator_type: Optional[str]) -> List[BloomFilter]:
+        if indicator_type is None:
+            return list(self.filters.values())
+
+        bloom_filter = self.filters.get(indicator_type)
+        if bloom_filter is None:
+            return []
+        return [bloom_filter]
+
+    def contains(self, value: str, indicator_type: Optional[str] = None) -> bool:
+        """Check whether a value probably is an indicator.
+
+        :param indicator_type: Indicator type to check, all types if not
+            provided.
+        """
+        return any(value in f for f in self._get_filters(indicator_type))
+
+    def contains_many(
+        self, values: Sequence[str], indicator_type: Optional[str] = None
+    ) -> List[bool]:
+        """Check whether values probably are indicators.
+
+        :param indicator_type: Indicator type to check, all types if not
+            provided.
+        """
+        filters = self._get_filters(indicator_type)
+
+        if numpy is not None and values:
+            hashes = _hash_many(values)
+            matches = numpy.zeros(len(values), dtype=numpy.bool_)
+            for bloom_filter in filters:
+                matches |= bloom_filter._probe(*hashes)
+            return matches.tolist()
+
+        return [any(value in f for f in filters) for value in values]
+
+    def save(self, path: str) -> None:
+        """Save the matcher to a file that can be loaded memory-mapped."""
+        header: Dict[str, Any] = {}
+        offset = 0
+        for indicator_type, bloom_filter in self.filters.items():
+            header[indicator_type] = {
+                self._JSON_OFFSET: offset,
+                self._JSON_NUM_BITS: bloom_filter.num_bits,
+                self._JSON_NUM_HASHES: bloom_filter.num_hashes,
+            }
+            offset += self._align(bloom_filter.nbytes)
+
+        header_data = json.dumps({self._JSON_FILTERS: header}).encode("utf-8")
+        header_size = self._align(self._FILE_HEADER.size + len(header_data))
+
+        with open(path, "wb") as f:
+            f.write(self._FILE_HEADER.pack(self._FILE_MAGIC, len(header_data)))
+            f.write(header_data)
+            f.write(bytes(header_size - f.tell()))
+
+            for bloom_filter in self.filters.values():
+                f.write(bloom_filter.data)
+                f.write(bytes(self._align(bloom_filter.nbytes) - bloom_filter.nbytes))
+
+    @classmethod
+    def load(cls, path: str) -> "IndicatorMatcher":
+        """Load a saved matcher, memory-mapping its filters read-only."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # The mmap cannot be closed while views of it are alive, so they are
+        # released first if the file turns out to be invalid.
+        views: List[memoryview] = []
+        try:
+            magic, header_length = cls._FILE_HEADER.unpack_from(mapped)
+            if magic != cls._FILE_MAGIC:
+                raise ValueError(f"Not an indicator matcher file: '{path}'")
+
+            header_start = cls._FILE_HEADER.size
+            header_end = header_start + header_length
+            header = json.loads(mapped[header_start:header_end])
+            data_start = cls._align(header_end)
+
+            view = memoryview(mapped)
+            views.append(view)
+
+            filters = {}
+            for indicator_type, entry in header[cls._JSON_FILTERS].items():
+                num_bits = entry[cls._JSON_NUM_BITS]
+                num_hashes = entry[cls._JSON_NUM_HASHES]
+                start = data_start + entry[cls._JSON_OFFSET]
+                end = start + (num_bits + 7) // 8
+
+                data = view[start:end]
+                views.append(data)
+
+                filters[indicator_type] = BloomFilter(num_bits, num_hashes, data)
+        except BaseException:
+            for v in reversed(views):
+                v.release()
+            mapped.close()
+            raise
+
+        matcher = cls(filters)
+        matcher._mmap = mapped
+        matcher._view = view
+        return matcher
+
+    @classmethod
+    def _align(cls, size: int) -> int:
+        alignment = cls._FILE_ALIGNMENT
+        return (size + alignment - 1) // alignment * alignment
+
+    def close(self) -> None:
+        """Release the memory-mapped file of a loaded matcher."""
+        if self._mmap is None:
+            return
+
+        for bloom_filter in self.filters.values():
+            if isinstance(bloom_filter.data, memoryview):
+                bloom_filter.data.release()
+        self.filters = {}
+
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+
+        self._mmap.close()
+        self._mmap = None
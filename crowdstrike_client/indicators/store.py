@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""Local indicator store module."""
+
+import itertools
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from crowdstrike_client.api.models.base import construct_model
+from crowdstrike_client.api.models.indicator import Indicator
+from crowdstrike_client.api.models.indicator_batch import get_field, to_timestamp
+from crowdstrike_client.api.models.response import Response
+from crowdstrike_client.indicators.sync import SyncPage
+
+
+class IndicatorStore:
+    """Local SQLite indicator store for offline lookups.
+
+    Indicators are indexed on indicator value, type, malicious confidence,
+    actors and malware families. Upserting an indicator flagged as deleted
+    removes it from the store. The store can be shared between threads.
+
+    Indicators are validated once when upserted, invalid ones are skipped,
+    and constructed without validation when read, as with ParseMode.TRUSTED,
+    except that their datetimes are parsed back from the stored ISO 8601
+    strings. Read indicators are therefore equal to validated ones.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS indicators (
+            id TEXT PRIMARY KEY,
+            indicator TEXT NOT NULL,
+            type TEXT,
+            malicious_confidence TEXT,
+            published_date REAL,
+            last_updated REAL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS indicators_indicator
+            ON indicators (indicator);
+        CREATE INDEX IF NOT EXISTS indicators_type
+            ON indicators (type);
+        CREATE INDEX IF NOT EXISTS indicators_malicious_confidence
+            ON indicators (malicious_confidence);
+
+        CREATE TABLE IF NOT EXISTS indicator_actors (
+            actor TEXT NOT NULL,
+            indicator_id TEXT NOT NULL,
+            PRIMARY KEY (actor, indicator_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS indicator_actors_indicator_id
+            ON indicator_actors (indicator_id);
+
+        CREATE TABLE IF NOT EXISTS indicator_malware_families (
+            malware_family TEXT NOT NULL,
+            indicator_id TEXT NOT NULL,
+            PRIMARY KEY (malware_family, indicator_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS indicator_malware_families_indicator_id
+            ON indicator_malware_families (indicator_id);
+    """
+
+    _SQL_INSERT = (
+        "INSERT INTO indicators (id, indicator, type, "
+        "malicious_confidence, published_date, last_updated, data) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+    _SQL_INSERT_ACTOR = (
+        "INSERT OR IGNORE INTO indicator_actors (actor, indicator_id) VALUES (?, ?)"
+    )
+    _SQL_INSERT_MALWARE_FAMILY = (
+        "INSERT OR IGNORE INTO indicator_malware_families "
+        "(malware_family, indicator_id) VALUES (?, ?)"
+    )
+
+    _SQL_DELETE = "DELETE FROM indicators WHERE id = ?"
+    _SQL_DELETE_ACTORS = "DELETE FROM indicator_actors WHERE indicator_id = ?"
+    _SQL_DELETE_MALWARE_FAMILIES = (
+        "DELETE FROM indicator_malware_families WHERE indicator_id = ?"
+    )
+
+    _SQL_CONTAINS = "SELECT 1 FROM indicators WHERE indicator = ? LIMIT 1"
+    _SQL_LOOKUP = "SELECT data FROM indicators WHERE indicator = ?"
+    _SQL_GET = "SELECT data FROM indicators WHERE id = ?"
+    _SQL_COUNT = "SELECT COUNT(*) FROM indicators"
+
+    _JSON_LABELS = "labels"
+    _JSON_RELATIONS = "relations"
+
+    _DATETIME_FIELDS = ("published_date", "last_updated")
+    _LABEL_DATETIME_FIELDS = ("created_on", "last_valid_on")
+    _RELATION_DATETIME_FIELDS = ("created_date", "last_valid_date")
+
+    _CHUNK_SIZE = 10000
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """Initialize indicator store.
+
+        :param path: SQLite database path, in memory by default.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self._path = path
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self._SCHEMA)
+
+    @property
+    def path(self) -> str:
+        """SQLite database path."""
+        return self._path
+
+    @staticmethod
+    def _validate(indicator: Any) -> Indicator:
+        if isinstance(indicator, BaseModel):
+            # Trusted models are constructed without validation.
+            indicator = indicator.dict(by_alias=True)
+        return Indicator.parse_obj(indicator)
+
+    @staticmethod
+    def _parse_datetimes(values: Any, names: Tuple[str, ...]) -> None:
+        for name in names:
+            value = values.get(name)
+            if isinstance(value, str):
+                values[name] = datetime.fromisoformat(value)
+
+    @classmethod
+    def _from_json(cls, data: str) -> Indicator:
+        values = json.loads(data)
+
+        cls._parse_datetimes(values, cls._DATETIME_FIELDS)
+        for label in values.get(cls._JSON_LABELS) or ():
+            cls._parse_datetimes(label, cls._LABEL_DATETIME_FIELDS)
+        for relation in values.get(cls._JSON_RELATIONS) or ():
+            cls._parse_datetimes(relation, cls._RELATION_DATETIME_FIELDS)
+
+        return construct_model(Indicator, values)
+
+    def _delete(self, cursor: sqlite3.Cursor, ids: List[str]) -> None:
+        params = [(indicator_id,) for indicator_id in ids]
+        cursor.executemany(self._SQL_DELETE, params)
+        cursor.executemany(self._SQL_DELETE_ACTORS, params)
+        cursor.executemany(self._SQL_DELETE_MALWARE_FAMILIES, params)
+
+    def _upsert(self, cursor: sqlite3.Cursor, indicators: Iterable[Any]) -> int:
+        # Later versions of an indicator in the same chunk replace earlier ones.
+        by_id = {get_field(indicator, "id"): indicator for indicator in indicators}
+        self._delete(cursor, list(by_id))
+
+        rows = []
+        actors = []
+        malware_families = []
+        for indicator_id, indicator in by_id.items():
+            if get_field(indicator, "deleted"):
+                continue
+
+            try:
+                model = self._validate(indicator)
+            except ValueError as e:
+                self.log.warning("Skipping invalid indicator '%s': %s", indicator_id, e)
+                continue
+
+            rows.append(
+                (
+                    model.id,
+                    model.indicator,
+                    model.type,
+                    model.malicious_confidence,
+                    to_timestamp(model.published_date),
+                    to_timestamp(model.last_updated),
+                    model.json(),
+                )
+            )
+            for actor in model.actors:
+                actors.append((actor, indicator_id))
+            for malware_family in model.malware_families:
+                malware_families.append((malware_family, indicator_id))
+
+        cursor.executemany(self._SQL_INSERT, rows)
+        cursor.executemany(self._SQL_INSERT_ACTOR, actors)
+        cursor.executemany(self._SQL_INSERT_MALWARE_FAMILY, malware_families)
+
+        return len(rows)
+
+    def upsert(self, indicators: Iterable[Any]) -> int:
+        """Insert or update indicators in one transaction.
+
+        Indicators may be models or dicts in any parse mode. Indicators
+        flagged as deleted are removed and invalid indicators are skipped.
+        Return the number of indicators written.
+        """
+        count = 0
+        iterator = iter(indicators)
+        with self._lock, self._connection:
+            cursor = self._connection.cursor()
+            while True:
+                chunk = list(itertools.islice(iterator, self._CHUNK_SIZE))
+                if not chunk:
+                    break
+                count += self._upsert(cursor, chunk)
+        return count
+
+    def upsert_pages(self, pages: Iterable[Response[Any]]) -> int:
+        """Upsert pages of indicators, one transaction per page.
+
+        Return the number of indicators written.
+        """
+        return sum(self.upsert(page.resources) for page in pages)
+
+    def apply(self, page: SyncPage) -> None:
+        """Apply the changes of an indicator sync page."""
+        self.upsert(page.added + page.updated + page.deleted)
+
+    def delete(self, ids: Iterable[str]) -> None:
+        """Delete indicators by ID."""
+        with self._lock, self._connection:
+            self._delete(self._connection.cursor(), list(ids))
+
+    def contains(self, indicator: str) -> bool:
+        """Check whether an indicator value is known."""
+        with self._lock:
+            cursor = self._connection.execute(self._SQL_CONTAINS, (indicator,))
+            return cursor.fetchone() is not None
+
+    def lookup(self, indicator: str) -> List[Indicator]:
+        """Return the indicators with the given value."""
+        with self._lock:
+            rows = self._connection.execute(self._SQL_LOOKUP, (indicator,)).fetchall()
+        return [self._from_json(row[0]) for row in rows]
+
+    def get(self, indicator_id: str) -> Optional[Indicator]:
+        """Return the indicator with the given ID, None if not present."""
+        with self._lock:
+            row = self._connection.execute(self._SQL_GET, (indicator_id,)).fetchone()
+        if row is None:
+            return None
+        return self._from_json(row[0])
+
+    def find(
+        self,
+        indicator_type: Optional[str] = None,
+        malicious_confidence: Optional[str] = None,
+        actor: Optional[str] = None,
+        malware_family: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Indicator]:
+        """Iterate over the indicators matching all of the given criteria."""
+        sql = "SELECT i.data FROM indicators i"
+        conditions: List[str] = []
+        params: List[Any] = []
+
+        if actor is not None:
+            sql += " JOIN indicator_actors a ON a.indicator_id = i.id"
+            conditions.append("a.actor = ?")
+            params.append(actor)
+
+        if malware_family is not None:
+            sql += " JOIN indicator_malware_families m ON m.indicator_id = i.id"
+            conditions.append("m.malware_family = ?")
+            params.append(malware_family)
+
+        if indicator_type is not None:
+            conditions.append("i.type = ?")
+            params.append(indicator_type)
+
+        if malicious_confidence is not None:
+            conditions.append("i.malicious_confidence = ?")
+            params.append(malicious_confidence)
+
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows: List[Tuple[str]] = self._connection.execute(sql, params).fetchall()
+
+        for row in rows:
+            yield self._from_json(row[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(self._SQL_COUNT).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
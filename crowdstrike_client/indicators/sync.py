@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""Indicator sync module."""
+
+import logging
+import math
+from typing import Any, Callable, Iterator, List, Optional
+
+from crowdstrike_client.api.intel.indicators import Indicators
+from crowdstrike_client.api.models import ParseMode
+from crowdstrike_client.api.models.indicator_batch import get_field, to_timestamp
+from crowdstrike_client.indicators.checkpoint import AbcCheckpointStore, Checkpoint
+
+
+class SyncPage:
+    """Changes from one page of an indicator sync.
+
+    Indicators are classified as deleted if flagged as such, as added if
+    published after the high-water mark of the previous sync and as updated
+    otherwise.
+    """
+
+    def __init__(
+        self,
+        added: List[Any],
+        updated: List[Any],
+        deleted: List[Any],
+        checkpoint: Checkpoint,
+    ) -> None:
+        """Initialize sync page."""
+        self.added = added
+        self.updated = updated
+        self.deleted = deleted
+        self.checkpoint = checkpoint
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.updated) + len(self.deleted)
+
+
+class SyncResult:
+    """Totals of an indicator sync run."""
+
+    def __init__(self) -> None:
+        """Initialize sync result."""
+        self.pages = 0
+        self.added = 0
+        self.updated = 0
+        self.deleted = 0
+
+    def add_page(self, page: SyncPage) -> None:
+        """Add the changes of a page to the totals."""
+        self.pages += 1
+        self.added += len(page.added)
+        self.updated += len(page.updated)
+        self.deleted += len(page.deleted)
+
+
+class IndicatorSync:
+    """Incremental indicator sync with persisted checkpoints.
+
+    Every run fetches the indicators updated since the high-water mark of the
+    previous run, including deleted ones, using deep pagination. The
+    checkpoint is committed after each page has been handled, so an
+    interrupted run resumes from the last committed page. Changes are
+    delivered at least once: a page that was being handled when the run was
+    interrupted is delivered again, and indicators updated in the same second
+    as the high-water mark are fetched again by the next run.
+    """
+
+    _FILTER_LAST_UPDATED = "last_updated:>={}"
+
+    def __init__(
+        self,
+        indicators: Indicators,
+        checkpoint_store: AbcCheckpointStore,
+        fql_filter: Optional[str] = None,
+        limit: Optional[int] = None,
+        parse_mode: Optional[ParseMode] = None,
+    ) -> None:
+        """Initialize indicator sync.
+
+        :param indicators: Intel Indicators API.
+        :param checkpoint_store: Store persisting the sync checkpoint.
+        :param fql_filter: FQL filter restricting the synced indicators.
+        :param limit: Number of indicators per page.
+        :param parse_mode: Parse mode for the synced indicators.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self.indicators = indicators
+        self.checkpoint_store = checkpoint_store
+        self.fql_filter = fql_filter
+        self.limit = limit
+        self.parse_mode = parse_mode
+
+    def _get_fql_filter(self, since: Optional[float]) -> Optional[str]:
+        if since is None:
+            return self.fql_filter
+
+        last_updated_filter = self._FILTER_LAST_UPDATED.format(int(since))
+        if self.fql_filter is None:
+            return last_updated_filter
+
+        return f"({self.fql_filter})+{last_updated_filter}"
+
+    @staticmethod
+    def _classify(
+        resources: List[Any], since: Optional[float], checkpoint: Checkpoint
+    ) -> SyncPage:
+        added: List[Any] = []
+        updated: List[Any] = []
+        deleted: List[Any] = []
+
+        last_updated = checkpoint.last_updated
+        for resource in resources:
+            published_at = to_timestamp(get_field(resource, "published_date"))
+
+            if get_field(resource, "deleted"):
+                deleted.append(resource)
+            elif since is None or published_at > since:
+                added.append(resource)
+            else:
+                updated.append(resource)
+
+            updated_at = to_timestamp(get_field(resource, "last_updated"))
+            if not math.isnan(updated_at) and (
+                last_updated is None or updated_at > last_updated
+            ):
+                last_updated = updated_at
+
+        return SyncPage(
+            added,
+            updated,
+            deleted,
+            checkpoint.copy(update={"last_updated": last_updated}),
+        )
+
+    def sync(self) -> Iterator[SyncPage]:
+        """Fetch the changes since the last run, page by page.
+
+        The checkpoint of a page is committed when the next page is
+        requested, and the run is completed once the iterator is exhausted.
+        """
+        checkpoint = self.checkpoint_store.load() or Checkpoint()
+
+        if checkpoint.next_page is not None:
+            since = checkpoint.since
+            self.log.info("Resuming indicator sync from %s", checkpoint.next_page)
+        else:
+            since = checkpoint.last_updated
+            checkpoint = checkpoint.copy(update={"since": since})
+            self.log.info("Starting indicator sync from %s", since)
+
+        pages = self.indicators.iter_entity_pages(
+            limit=self.limit,
+            fql_filter=self._get_fql_filter(since),
+            include_deleted=True,
+            parse_mode=self.parse_mode,
+            next_page=checkpoint.next_page,
+        )
+
+        for page in pages:
+            sync_page = self._classify(page.resources, since, checkpoint)
+
+            if page.resources:
+                yield sync_page
+
+            checkpoint = sync_page.checkpoint.copy(update={"next_page": page.next_page})
+            self.checkpoint_store.save(checkpoint)
+
+        checkpoint = checkpoint.copy(update={"since": None, "next_page": None})
+        self.checkpoint_store.save(checkpoint)
+
+        self.log.info("Indicator sync completed at %s", checkpoint.last_updated)
+
+    def run(self, handler: Callable[[SyncPage], None]) -> SyncResult:
+        """Sync the changes since the last run, passing each page to handler."""
+        result = SyncResult()
+        for page in self.sync():
+            handler(page)
+            result.add_page(page)
+        return result
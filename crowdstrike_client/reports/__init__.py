@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike report archive module."""
+
+from crowdstrike_client.reports.archiver import ArchiveEntry, ArchiveResult
+from crowdstrike_client.reports.archiver import ArchiveStatus, ReportArchiver
+
+__all__ = [
+    "ArchiveEntry",
+    "ArchiveResult",
+    "ArchiveStatus",
+    "ReportArchiver",
+]
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""Report PDF archiver module."""
+
+import contextlib
+import glob
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Iterable, List, Optional
+
+from crowdstrike_client.api.exceptions import CrowdStrikeException
+from crowdstrike_client.api.intel.reports import Reports
+from crowdstrike_client.api.models.base import Base
+from crowdstrike_client.api.models.download import StreamedDownload
+from crowdstrike_client.api.utils import map_concurrently
+from crowdstrike_client.http.exceptions import HTTPClientException
+
+
+class ArchiveStatus(str, Enum):
+    """Report archive entry status.
+
+    DOWNLOADED reports have a file in the archive, MISSING reports had no
+    file when they were last requested.
+    """
+
+    DOWNLOADED = "downloaded"
+    MISSING = "missing"
+
+
+class ArchiveEntry(Base):
+    """Report archive manifest entry."""
+
+    report_id: str
+    status: ArchiveStatus
+    filename: Optional[str] = None
+    size: Optional[int] = None
+    sha256: Optional[str] = None
+    e_tag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+
+
+class ArchiveResult:
+    """Totals of a report archive run, with the IDs of the failed reports."""
+
+    DOWNLOADED = "downloaded"
+    UNCHANGED = "unchanged"
+    MISSING = "missing"
+    FAILED = "failed"
+
+    def __init__(self) -> None:
+        """Initialize archive result."""
+        self.downloaded = 0
+        self.unchanged = 0
+        self.missing = 0
+        self.failed: List[str] = []
+
+    def add(self, report_id: str, outcome: str) -> None:
+        """Add the outcome of a report to the totals."""
+        if outcome == self.FAILED:
+            self.failed.append(report_id)
+        else:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+
+class ReportArchiver:
+    """Concurrent report PDF archiver.
+
+    Report PDFs are downloaded to a directory with bounded concurrency, as
+    <report ID>.pdf. A manifest in the directory records the ETag and
+    Last-Modified of every downloaded file, which are sent back as
+    conditional headers so that unchanged files are not downloaded again,
+    and the reports without a file, which are not requested again unless
+    asked for.
+
+    Files are written to a temporary .part file and renamed when complete,
+    and the manifest is an append-only journal written as each report
+    finishes, so an interrupted run leaves no partial files behind and the
+    next run picks up where it stopped.
+    """
+
+    _DEFAULT_MAX_WORKERS = 4
+
+    _MANIFEST_FILENAME = "manifest.jsonl"
+    _FILE_SUFFIX = ".pdf"
+    _PART_SUFFIX = ".part"
+
+    def __init__(
+        self,
+        reports: Reports,
+        directory: str,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+        revalidate: bool = True,
+        retry_missing: bool = False,
+    ) -> None:
+        """Initialize report archiver.
+
+        :param reports: Intel Reports API.
+        :param directory: Archive directory.
+        :param max_workers: Maximum number of concurrent downloads.
+        :param revalidate: Check archived files for changes with a conditional
+            request, otherwise they are skipped without a request.
+        :param retry_missing: Request again the reports recorded as having no
+            file.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self.reports = reports
+        self.directory = directory
+        self.max_workers = max_workers
+        self.revalidate = revalidate
+        self.retry_missing = retry_missing
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ArchiveEntry] = {}
+
+    @property
+    def manifest_path(self) -> str:
+        """Manifest file path."""
+        return os.path.join(self.directory, self._MANIFEST_FILENAME)
+
+    @property
+    def entries(self) -> Dict[str, ArchiveEntry]:
+        """Manifest entries by report ID, as of the last run."""
+        return dict(self._entries)
+
+    def _get_file_path(self, report_id: str) -> str:
+        filename = os.path.basename(str(report_id)) + self._FILE_SUFFIX
+        return os.path.join(self.directory, filename)
+
+    def _load_manifest(self) -> Dict[str, ArchiveEntry]:
+        entries: Dict[str, ArchiveEntry] = {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = ArchiveEntry.parse_raw(line)
+                    except ValueError:
+                        # A line cut short by an interruption.
+                        self.log.warning("Ignoring corrupt manifest entry")
+                        continue
+                    entries[entry.report_id] = entry
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _save_manifest(self) -> None:
+        # Compact the journal to one entry per report.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".manifest-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for entry in self._entries.values():
+                    f.write(entry.json() + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.manifest_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def _record(self, entry: ArchiveEntry) -> None:
+        with self._lock:
+            self._entries[entry.report_id] = entry
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write(entry.json() + "\n")
+
+    def _remove_part_files(self) -> None:
+        pattern = os.path.join(self.directory, "*" + self._PART_SUFFIX)
+        for part_path in glob.glob(pattern):
+            self.log.debug("Removing partial file '%s'", part_path)
+            with contextlib.suppress(OSError):
+                os.unlink(part_path)
+
+    def _update_validators(
+        self, entry: ArchiveEntry, download: StreamedDownload
+    ) -> None:
+        # A 304 response may carry new validators for the unchanged file.
+        e_tag = download.e_tag or entry.e_tag
+        last_modified = download.last_modified or entry.last_modified
+        if e_tag == entry.e_tag and last_modified == entry.last_modified:
+            return
+
+        self._record(
+            entry.copy(update={"e_tag": e_tag, "last_modified": last_modified})
+        )
+
+    def _archive(self, report_id: str) -> str:
+        entry = self._entries.get(report_id)
+        file_path = self._get_file_path(report_id)
+
+        e_tag: Optional[str] = None
+        last_modified: Optional[datetime] = None
+        if entry is not None:
+            if entry.status == ArchiveStatus.MISSING:
+                if not self.retry_missing:
+                    return ArchiveResult.MISSING
+            elif os.path.exists(file_path):
+                if not self.revalidate:
+                    return ArchiveResult.UNCHANGED
+                e_tag = entry.e_tag
+                last_modified = entry.last_modified
+
+        part_path = file_path + self._PART_SUFFIX
+        try:
+            download = self.reports.download_pdf(
+                report_id,
+                part_path,
+                sha256=True,
+                e_tag=e_tag,
+                last_modified=last_modified,
+            )
+            if download is not None and not download.not_modified:
+                os.replace(part_path, file_path)
+        except (CrowdStrikeException, HTTPClientException, OSError) as e:
+            self.log.error("Failed to archive report '%s': %s", report_id, e)
+            with contextlib.suppress(OSError):
+                os.unlink(part_path)
+            return ArchiveResult.FAILED
+
+        if download is None:
+            entry = ArchiveEntry(report_id=report_id, status=ArchiveStatus.MISSING)
+            self._record(entry)
+            return ArchiveResult.MISSING
+
+        if download.not_modified:
+            if entry is not None:
+                self._update_validators(entry, download)
+            return ArchiveResult.UNCHANGED
+
+        entry = ArchiveEntry(
+            report_id=report_id,
+            status=ArchiveStatus.DOWNLOADED,
+            filename=download.filename,
+            size=download.size,
+            sha256=download.sha256,
+            e_tag=download.e_tag,
+            last_modified=download.last_modified,
+        )
+        self._record(entry)
+        return ArchiveResult.DOWNLOADED
+
+    def archive(
+        self,
+        report_ids: Optional[Iterable[str]] = None,
+        fql_filter: Optional[str] = None,
+    ) -> ArchiveResult:
+        """Archive the PDFs of the given reports.
+
+        :param report_ids: IDs of the reports to archive, all reports matching
+            fql_filter if not provided.
+        :param fql_filter: FQL filter selecting the reports to archive.
+        """
+        if report_ids is None:
+            report_ids = self.reports.query_all_ids(
+                fql_filter=fql_filter, max_workers=self.max_workers
+            ).resources
+        report_ids = list(dict.fromkeys(report_ids))
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._remove_part_files()
+        self._entries = self._load_manifest()
+        self._save_manifest()
+
+        self.log.info(
+            "Archiving %d reports with %d workers", len(report_ids), self.max_workers
+        )
+
+        outcomes = map_concurrently(self._archive, report_ids, self.max_workers)
+
+        result = ArchiveResult()
+        for report_id, outcome in zip(report_ids, outcomes):
+            result.add(report_id, outcome)
+
+        self._save_manifest()
+
+        self.log.info(
+            "Archived reports: %d downloaded, %d unchanged, %d missing, %d failed",
+            result.downloaded,
+            result.unchanged,
+            result.missing,
+            len(result.failed),
+        )
+
+        return result
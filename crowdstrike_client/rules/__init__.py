@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""CrowdStrike rule bundle module."""
+
+from crowdstrike_client.rules.index import Rule, RuleBundle, RuleDiff
+from crowdstrike_client.rules.index import RuleIndex, RuleIndexEntry, RuleType
+
+__all__ = [
+    "Rule",
+    "RuleBundle",
+    "RuleDiff",
+    "RuleIndex",
+    "RuleIndexEntry",
+    "RuleType",
+]
@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+"""Rule bundle index module."""
+
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import posixpath
+import re
+import tempfile
+import zipfile
+from enum import Enum
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+)
+
+from crowdstrike_client.api.models.download import Download
+
+
+class RuleType(str, Enum):
+    """Rule type."""
+
+    YARA = "yara"
+    SNORT = "snort"
+
+
+class RuleIndexEntry:
+    """Rule index entry, identifying a rule by type and name.
+
+    The name of a Snort or Suricata rule is its signature ID. YARA rule names
+    are only unique within a file, so YARA rules are also identified by their
+    bundle member file. Entries are plain objects rather than models, as
+    bundles hold hundreds of thousands of rules.
+    """
+
+    __slots__ = ("type", "name", "file", "sha256")
+
+    _JSON_TYPE = "type"
+    _JSON_NAME = "name"
+    _JSON_FILE = "file"
+    _JSON_SHA256 = "sha256"
+
+    def __init__(self, type: RuleType, name: str, file: str, sha256: str) -> None:
+        """Initialize rule index entry."""
+        self.type = type
+        self.name = name
+        self.file = file
+        self.sha256 = sha256
+
+    @staticmethod
+    def get_key(type: RuleType, name: str, file: Optional[str] = None) -> str:
+        """Return the key of a rule in an index.
+
+        :param file: Bundle member file, required for YARA rules.
+        """
+        if type == RuleType.YARA:
+            if file is None:
+                raise ValueError("YARA rules are identified by name and file")
+            return f"{type.value}:{file}:{name}"
+        return f"{type.value}:{name}"
+
+    @property
+    def key(self) -> str:
+        """Key of the rule in an index."""
+        return self.get_key(self.type, self.name, self.file)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Return the entry as a JSON serializable dict."""
+        return {
+            self._JSON_TYPE: self.type.value,
+            self._JSON_NAME: self.name,
+            self._JSON_FILE: self.file,
+            self._JSON_SHA256: self.sha256,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, str]) -> "RuleIndexEntry":
+        """Create an entry from a dict returned by to_dict."""
+        return cls(
+            RuleType(data[cls._JSON_TYPE]),
+            data[cls._JSON_NAME],
+            data[cls._JSON_FILE],
+            data[cls._JSON_SHA256],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RuleIndexEntry):
+            return NotImplemented
+        return (self.type, self.name, self.file, self.sha256) == (
+            other.type,
+            other.name,
+            other.file,
+            other.sha256,
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.key!r}, sha256={self.sha256!r})"
+
+
+class Rule(RuleIndexEntry):
+    """Rule read from a rule bundle, with its text."""
+
+    __slots__ = ("text",)
+
+    def __init__(
+        self, type: RuleType, name: str, file: str, sha256: str, text: str
+    ) -> None:
+        """Initialize rule."""
+        super().__init__(type, name, file, sha256)
+        self.text = text
+
+
+class RuleDiff:
+    """Changes between two rule bundles.
+
+    Added and changed rules come with their text, removed rules are the
+    entries of the previous index.
+    """
+
+    def __init__(
+        self,
+        added: List[Rule],
+        changed: List[Rule],
+        removed: List[RuleIndexEntry],
+        index: "RuleIndex",
+    ) -> None:
+        """Initialize rule diff."""
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.index = index
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+
+class RuleIndex:
+    """Index of the rules of a rule bundle by type and name."""
+
+    def __init__(self, entries: Optional[Iterable[RuleIndexEntry]] = None) -> None:
+        """Initialize rule index."""
+        self.entries: Dict[str, RuleIndexEntry] = {}
+        for entry in entries or ():
+            self.add(entry)
+
+    def add(self, entry: RuleIndexEntry) -> None:
+        """Add a rule, replacing a rule with the same key."""
+        if type(entry) is not RuleIndexEntry:
+            # Do not keep the text of rules.
+            entry = RuleIndexEntry(entry.type, entry.name, entry.file, entry.sha256)
+        self.entries[entry.key] = entry
+
+    def get(
+        self, rule_type: RuleType, name: str, file: Optional[str] = None
+    ) -> Optional[RuleIndexEntry]:
+        """Return the rule with the given type and name, None if not present.
+
+        :param file: Bundle member file, required for YARA rules.
+        """
+        return self.entries.get(RuleIndexEntry.get_key(rule_type, name, file))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __iter__(self) -> Iterator[RuleIndexEntry]:
+        return iter(self.entries.values())
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def save(self, path: str) -> None:
+        """Save the index to a JSON lines file, replacing it atomically."""
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".rule-index-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for entry in self.entries.values():
+                    f.write(json.dumps(entry.to_dict()) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Optional["RuleIndex"]:
+        """Load a saved index, None if there is none."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(RuleIndexEntry.from_dict(json.loads(line)) for line in f)
+        except FileNotFoundError:
+            return None
+
+
+class RuleBundle:
+    """Streaming reader of a rule bundle ZIP.
+
+    Members are read one at a time and line by line, so memory use does not
+    depend on the size of the bundle. YARA rules are read from .yar and .yara
+    files and Snort and Suricata rules, identified by signature ID, from
+    .rules files. Commented out Snort rules are left out.
+    """
+
+    _YARA_EXTENSIONS = (".yar", ".yara")
+    _SNORT_EXTENSIONS = (".rules",)
+
+    _REGEX_YARA_RULE = re.compile(
+        r"^\s*(?:(?:private|global)\s+)*rule\s+([A-Za-z_][A-Za-z0-9_]*)"
+    )
+    _REGEX_SNORT_SID = re.compile(r"[(;]\s*sid\s*:\s*(\d+)\s*;")
+
+    def __init__(self, download: Download) -> None:
+        """Initialize rule bundle reader.
+
+        :param download: Rule bundle ZIP, as returned by Rules.get_latest_file.
+        """
+        self.log = logging.getLogger(__name__)
+
+        self.download = download
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _get_rule_type(self, filename: str) -> Optional[RuleType]:
+        extension = posixpath.splitext(filename)[1].lower()
+        if extension in self._YARA_EXTENSIONS:
+            return RuleType.YARA
+        if extension in self._SNORT_EXTENSIONS:
+            return RuleType.SNORT
+        return None
+
+    def __iter__(self) -> Iterator[Rule]:
+        content = self.download.content
+        content.seek(0)
+
+        with zipfile.ZipFile(content) as bundle:
+            for info in bundle.infolist():
+                if info.is_dir():
+                    continue
+
+                rule_type = self._get_rule_type(info.filename)
+                if rule_type is None:
+                    self.log.debug("Skipping bundle member '%s'", info.filename)
+                    continue
+
+                with bundle.open(info) as member:
+                    lines = io.TextIOWrapper(member, encoding="utf-8", errors="replace")
+                    if rule_type == RuleType.YARA:
+                        rules = self._read_yara_rules(lines)
+                    else:
+                        rules = self._read_snort_rules(lines)
+
+                    for name, text in rules:
+                        yield Rule(
+                            rule_type, name, info.filename, self._hash(text), text
+                        )
+
+    def _read_yara_rules(self, lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        name: Optional[str] = None
+        rule_lines: List[str] = []
+        scanner = _YaraScanner()
+
+        for line in lines:
+            line = line.rstrip()
+
+            # A line may end a rule and start the next ones.
+            while True:
+                if name is None:
+                    if scanner.in_comment:
+                        scanner.scan(line)
+                        break
+
+                    match = self._REGEX_YARA_RULE.match(line)
+                    if match is None:
+                        scanner.scan(line)
+                        break
+
+                    name = match.group(1)
+                    rule_lines = []
+                    scanner = _YaraScanner()
+
+                end = scanner.scan(line)
+                if end is None:
+                    rule_lines.append(line)
+                    break
+
+                rule_lines.append(line[:end])
+                yield name, "\n".join(rule_lines)
+
+                name = None
+                scanner = _YaraScanner()
+                line = line[end:].lstrip()
+                if not line:
+                    break
+
+        if name is not None:
+            self.log.warning("Skipping unterminated YARA rule '%s'", name)
+
+    def _read_snort_rules(self, lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        rule_lines: List[str] = []
+
+        for line in lines:
+            line = line.strip()
+
+            if line.endswith("\\"):
+                rule_lines.append(line[:-1].rstrip())
+                continue
+
+            if rule_lines:
+                rule_lines.append(line)
+                text = " ".join(part for part in rule_lines if part)
+                rule_lines = []
+            else:
+                text = line
+
+            if not text or text.startswith("#"):
+                continue
+
+            match = self._REGEX_SNORT_SID.search(text)
+            if match is None:
+                self.log.debug("Skipping Snort rule without signature ID")
+                continue
+
+            yield match.group(1), text
+
+    def index(self) -> RuleIndex:
+        """Build the index of the rules of the bundle."""
+        return RuleIndex(self)
+
+    def diff(self, previous: Optional[RuleIndex]) -> RuleDiff:
+        """Compare the rules of the bundle with the index of a previous one.
+
+        :param previous: Index of the previous bundle, all rules are added if
+            not provided.
+        """
+        if previous is None:
+            previous = RuleIndex()
+
+        added: List[Rule] = []
+        changed: List[Rule] = []
+        index = RuleIndex()
+
+        for rule in self:
+            key = rule.key
+            if key in index:
+                self.log.warning("Duplicate rule '%s' in '%s'", key, rule.file)
+
+            index.add(rule)
+
+            previous_entry = previous.entries.get(key)
+            if previous_entry is None:
+                added.append(rule)
+            elif previous_entry.sha256 != rule.sha256:
+                changed.append(rule)
+
+        removed = [entry for key, entry in previous.entries.items() if key not in index]
+
+        return RuleDiff(added, changed, removed, index)
+
+
+class _YaraScanner:
+    # Tracks the brace depth of a YARA rule line by line, ignoring braces in
+    # text strings, regular expressions and comments, to find where the rule
+    # ends.
+
+    _REGEX_TOKEN = re.compile(r'["{}]|/[/*]?')
+    _REGEX_STRING_END = re.compile(r'(?:[^"\\]|\\.)*"')
+    _REGEX_REGEX_END = re.compile(r"(?:[^/\\]|\\.)*/")
+    # A regular expression follows a string definition or "matches".
+    _REGEX_REGEX_START = re.compile(r"(?:=|\bmatches)\s*$")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.opened = False
+        self.in_comment = False
+
+    def scan(self, line: str) -> Optional[int]:
+        # Return the position after the brace closing the rule, None if the
+        # rule does not end on the line.
+        if (
+            not self.in_comment
+            and '"' not in line
+            and "/" not in line
+            and "}" not in line
+        ):
+            opening = line.count("{")
+            if opening:
+                self.opened = True
+                self.depth += opening
+            return None
+
+        pos = 0
+        while True:
+            if self.in_comment:
+                end = line.find("*/", pos)
+                if end < 0:
+                    return None
+                self.in_comment = False
+                pos = end + 2
+
+            match = self._REGEX_TOKEN.search(line, pos)
+            if match is None:
+                return None
+
+            token = match.group()
+            pos = match.end()
+            if token == "{":
+                self.opened = True
+                self.depth += 1
+            elif token == "}":
+                self.depth -= 1
+                if self.opened and self.depth <= 0:
+                    return pos
+            elif token == '"':
+                pos = self._skip(self._REGEX_STRING_END, line, pos)
+            elif token == "//":
+                return None
+            elif token == "/*":
+                self.in_comment = True
+            elif self._REGEX_REGEX_START.search(line, 0, match.start()):
+                pos = self._skip(self._REGEX_REGEX_END, line, pos)
+
+    @staticmethod
+    def _skip(regex: Pattern[str], line: str, pos: int) -> int:
+        # Return the position after the closing delimiter, the end of the
+        # line if there is none.
+        match = regex.match(line, pos)
+        if match is None:
+            return len(line)
+        return match.end()
@@ -30,7 +30,8 @@ REQUIRES_PYTHON = ">=3.7"
 REQUIRED = ["requests", "pydantic"]
 
 EXTRAS = {
-    # 'fancy feature': ['fancy'],
+    "async": ["aiohttp"],
+    "numpy": ["numpy"],
 }
 
 # this directory
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""Shared test fixtures."""
+
+from typing import Iterator
+
+import pytest
+
+from tests.fake_server import FakeServer
+
+
+@pytest.fixture
+def server() -> Iterator[FakeServer]:
+    fake_server = FakeServer()
+    fake_server.start()
+    yield fake_server
+    fake_server.stop()
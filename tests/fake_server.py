@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Fake HTTP server for tests."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+_Reply = Tuple[int, Any, Dict[str, str]]
+_Handler = Callable[[str, Mapping[str, str]], _Reply]
+
+
+class _Server(ThreadingHTTPServer):
+    # Accept bursts of concurrent connections without the client retrying.
+    request_queue_size = 128
+
+
+class FakeServer:
+    """Local HTTP server replying with scripted JSON responses.
+
+    Replies are taken in order, the last one is repeated once the script runs
+    out, unless a handler is routed for the request path. Every request is
+    recorded as a (method, path) tuple.
+    """
+
+    def __init__(self) -> None:
+        self.replies: List[_Reply] = []
+        self.handlers: Dict[str, _Handler] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+        self._server = _Server(("127.0.0.1", 0), self._create_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,))
+        self._thread.daemon = True
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def reply(
+        self,
+        status_code: int,
+        body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.replies.append((status_code, body, headers or {}))
+
+    def route(self, path: str, handler: _Handler) -> None:
+        """Reply to requests for a path, ignoring the query, with a handler.
+
+        The handler is called with the request method and headers, outside
+        of the server lock, so concurrent requests are handled concurrently.
+        """
+        self.handlers[path] = handler
+
+    def count(self, method: str, path: str) -> int:
+        """Return the number of requests for a path, ignoring the query."""
+        with self._lock:
+            return sum(
+                1
+                for request_method, request_path in self.requests
+                if request_method == method and request_path.split("?")[0] == path
+            )
+
+    def _next_reply(self, method: str, path: str, headers: Mapping[str, str]) -> _Reply:
+        handler = self.handlers.get(path.split("?")[0])
+
+        with self._lock:
+            self.requests.append((method, path))
+            if handler is None:
+                return self._next_scripted_reply()
+
+        return handler(method, headers)
+
+    def _next_scripted_reply(self) -> _Reply:
+        if len(self.replies) > 1:
+            return self.replies.pop(0)
+        if self.replies:
+            return self.replies[0]
+        return 200, {}, {}
+
+    def _create_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+
+                status_code, body, headers = server._next_reply(
+                    self.command, self.path, dict(self.headers.items())
+                )
+                if status_code in (204, 304):
+                    data = b""
+                else:
+                    data = json.dumps(body).encode("utf-8")
+
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _handle
+            do_POST = _handle
+
+        return Handler
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
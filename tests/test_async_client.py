@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""HTTP asynchronous client tests."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, TypeVar
+
+import pytest
+
+from crowdstrike_client.api.authenticator import AsyncOAuth2Authenticator
+from crowdstrike_client.api.intel.async_rules import AsyncRules
+from crowdstrike_client.api.intel.rule_cache import AbcRuleCache
+from crowdstrike_client.api.models.download import Download
+from crowdstrike_client.http.async_client import (
+    AsyncAuthenticatedHTTPClient,
+    AsyncHTTPClient,
+    AsyncTransport,
+)
+from crowdstrike_client.http.authenticator import Token
+from crowdstrike_client.http.retry import RetryPolicy
+from crowdstrike_client.http.token_store import AbcTokenStore
+
+from tests.fake_server import FakeServer
+
+pytest.importorskip("aiohttp")
+
+T = TypeVar("T")
+
+
+def _run(function: Callable[[AsyncTransport], Awaitable[T]]) -> T:
+    async def run() -> T:
+        async with AsyncTransport() as transport:
+            return await function(transport)
+
+    return asyncio.run(run())
+
+
+class _ThreadRecordingTokenStore(AbcTokenStore):
+    def __init__(self) -> None:
+        self.tokens: Dict[str, Token] = {}
+        self.threads: Set[int] = set()
+
+    def get(self, key: str) -> Optional[Token]:
+        self.threads.add(threading.get_ident())
+        return self.tokens.get(key)
+
+    def set(self, key: str, token: Token) -> None:
+        self.threads.add(threading.get_ident())
+        self.tokens[key] = token
+
+    def delete(self, key: str) -> None:
+        self.threads.add(threading.get_ident())
+        self.tokens.pop(key, None)
+
+
+class _ThreadRecordingRuleCache(AbcRuleCache):
+    def __init__(self) -> None:
+        self.downloads: Dict[str, Download] = {}
+        self.threads: Set[int] = set()
+
+    def get(self, rule_set_type: str) -> Optional[Download]:
+        self.threads.add(threading.get_ident())
+        return self.downloads.get(rule_set_type)
+
+    def set(self, rule_set_type: str, download: Download) -> None:
+        self.threads.add(threading.get_ident())
+        self.downloads[rule_set_type] = download
+
+    def delete(self, rule_set_type: str) -> None:
+        self.threads.add(threading.get_ident())
+        self.downloads.pop(rule_set_type, None)
+
+
+def test_scalar_timeout(server: FakeServer) -> None:
+    server.reply(200, {"ok": True})
+
+    async def request(transport: AsyncTransport) -> Any:
+        client = AsyncHTTPClient(server.url, transport=transport)
+        response = await client._request("GET", "/path", timeout=5)
+        return response.json()
+
+    assert _run(request) == {"ok": True}
+
+
+def test_response_content_can_be_iterated_and_closed(server: FakeServer) -> None:
+    server.reply(200, {"ok": True})
+
+    async def request(transport: AsyncTransport) -> Any:
+        client = AsyncHTTPClient(server.url, transport=transport)
+        response = await client.get("/path")
+        chunks = list(response.iter_content(chunk_size=4))
+        response.close()
+        return chunks
+
+    assert b"".join(_run(request)) == b'{"ok": true}'
+
+
+def test_retries_server_errors_until_success(server: FakeServer, monkeypatch) -> None:
+    async def no_sleep(delay: float) -> None:
+        pass
+
+    monkeypatch.setattr("asyncio.sleep", no_sleep)
+    server.reply(503)
+    server.reply(429, headers={"Retry-After": "1"})
+    server.reply(200, {"ok": True})
+
+    async def request(transport: AsyncTransport) -> Any:
+        client = AsyncHTTPClient(
+            server.url, transport=transport, retry_policy=RetryPolicy()
+        )
+        response = await client.get("/path")
+        return response.json()
+
+    assert _run(request) == {"ok": True}
+    assert len(server.requests) == 3
+
+
+def test_token_store_runs_off_the_event_loop(server: FakeServer) -> None:
+    server.reply(
+        201, {"access_token": "token", "token_type": "bearer", "expires_in": 1800}
+    )
+    token_store = _ThreadRecordingTokenStore()
+    loop_threads: Set[int] = set()
+
+    async def request(transport: AsyncTransport) -> None:
+        loop_threads.add(threading.get_ident())
+
+        authenticator = AsyncOAuth2Authenticator(
+            AsyncHTTPClient(server.url, transport=transport),
+            "client_id",
+            "client_secret",
+            token_store=token_store,
+        )
+        client = AsyncAuthenticatedHTTPClient(
+            server.url, authenticator, transport=transport
+        )
+
+        token = await client._check_authorization()
+        await client._reauthenticate(token)
+
+    _run(request)
+
+    assert len(token_store.tokens) == 1
+    assert token_store.threads
+    assert not token_store.threads & loop_threads
+
+
+def test_rule_cache_runs_off_the_event_loop(server: FakeServer) -> None:
+    server.reply(200, "rules", headers={"ETag": '"v1"'})
+    server.reply(304)
+    rule_cache = _ThreadRecordingRuleCache()
+    loop_threads: Set[int] = set()
+
+    async def request(transport: AsyncTransport) -> Any:
+        loop_threads.add(threading.get_ident())
+
+        rules = AsyncRules(AsyncHTTPClient(server.url, transport=transport))
+        download = await rules.get_latest_file(
+            "snort-suricata-master", cache=rule_cache
+        )
+        cached = await rules.get_latest_file("snort-suricata-master", cache=rule_cache)
+        return download, cached
+
+    download, cached = _run(request)
+
+    assert cached is download
+    assert download.e_tag == "v1"
+    assert rule_cache.threads
+    assert not rule_cache.threads & loop_threads
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""HTTP client tests."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Mapping, Set
+
+import requests
+
+from crowdstrike_client.api.authenticator import OAuth2Authenticator
+from crowdstrike_client.http.client import AuthenticatedHTTPClient, HTTPClient
+from crowdstrike_client.http.transport import Transport
+
+from tests.fake_server import FakeServer, _Reply
+
+_THREADS = 32
+
+_TOKEN_PATH = "/oauth2/token"
+_API_PATH = "/api"
+
+
+class _TokenEndpoint:
+    """Issue numbered tokens, the first one expiring after `first_expires_in`."""
+
+    def __init__(self, first_expires_in: int = 1800, delay: float = 0.05) -> None:
+        self.first_expires_in = first_expires_in
+        self.delay = delay
+        self.issued = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, method: str, headers: Mapping[str, str]) -> _Reply:
+        with self._lock:
+            self.issued += 1
+            issued = self.issued
+        # Widen the window in which concurrent callers could also refresh.
+        time.sleep(self.delay)
+        expires_in = self.first_expires_in if issued == 1 else 1800
+        body = {
+            "access_token": f"token-{issued}",
+            "token_type": "bearer",
+            "expires_in": expires_in,
+        }
+        return 201, body, {}
+
+
+class _ApiEndpoint:
+    """Answer 401 to revoked tokens and 200 to any other token."""
+
+    def __init__(self) -> None:
+        self.revoked: Set[str] = set()
+
+    def __call__(self, method: str, headers: Mapping[str, str]) -> _Reply:
+        if headers.get("Authorization") in self.revoked:
+            return 401, {"errors": [{"code": 401, "message": "access denied"}]}, {}
+        return 200, {"resources": []}, {}
+
+
+def _client(
+    server: FakeServer, token_endpoint: _TokenEndpoint
+) -> AuthenticatedHTTPClient:
+    server.route(_TOKEN_PATH, token_endpoint)
+    authenticator = OAuth2Authenticator(HTTPClient(server.url), "id", "secret")
+    return AuthenticatedHTTPClient(server.url, authenticator, refresh_margin=60.0)
+
+
+def _get_concurrently(client: AuthenticatedHTTPClient) -> List[int]:
+    barrier = threading.Barrier(_THREADS)
+
+    def get(_: int) -> int:
+        barrier.wait()
+        response = client.get(_API_PATH)
+        response.close()
+        return response.status_code
+
+    with ThreadPoolExecutor(max_workers=_THREADS) as executor:
+        return list(executor.map(get, range(_THREADS)))
+
+
+def test_initial_token_fetch_is_single_flight(server: FakeServer) -> None:
+    server.route(_API_PATH, _ApiEndpoint())
+    client = _client(server, _TokenEndpoint())
+
+    status_codes = _get_concurrently(client)
+
+    assert status_codes == [200] * _THREADS
+    assert server.count("POST", _TOKEN_PATH) == 1
+    assert server.count("GET", _API_PATH) == _THREADS
+
+
+def test_expiring_token_refresh_is_single_flight(server: FakeServer) -> None:
+    server.route(_API_PATH, _ApiEndpoint())
+    # The first token expires within the refresh margin, so the next
+    # requests all find it expiring.
+    client = _client(server, _TokenEndpoint(first_expires_in=30))
+    client.get(_API_PATH).close()
+    assert server.count("POST", _TOKEN_PATH) == 1
+
+    status_codes = _get_concurrently(client)
+
+    assert status_codes == [200] * _THREADS
+    assert server.count("POST", _TOKEN_PATH) == 2
+
+    _get_concurrently(client)
+
+    assert server.count("POST", _TOKEN_PATH) == 2
+
+
+def test_rejected_token_reauthentication_is_single_flight(server: FakeServer) -> None:
+    api_endpoint = _ApiEndpoint()
+    server.route(_API_PATH, api_endpoint)
+    client = _client(server, _TokenEndpoint())
+    client.get(_API_PATH).close()
+    assert server.count("POST", _TOKEN_PATH) == 1
+
+    api_endpoint.revoked.add("bearer token-1")
+    status_codes = _get_concurrently(client)
+
+    assert status_codes == [200] * _THREADS
+    assert server.count("POST", _TOKEN_PATH) == 2
+
+    api_endpoint.revoked.add("bearer token-2")
+    status_codes = _get_concurrently(client)
+
+    assert status_codes == [200] * _THREADS
+    assert server.count("POST", _TOKEN_PATH) == 3
+
+
+class _RecordingTransport(Transport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.responses: List[requests.Response] = []
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        response = super().request(method, url, **kwargs)
+        self.responses.append(response)
+        return response
+
+
+def test_streamed_response_closed_before_reauthentication(server: FakeServer) -> None:
+    server.route(_TOKEN_PATH, _TokenEndpoint(delay=0.0))
+    server.reply(401, {"errors": []})
+    server.reply(200, {"resources": []})
+    transport = _RecordingTransport()
+    authenticator = OAuth2Authenticator(HTTPClient(server.url), "id", "secret")
+    client = AuthenticatedHTTPClient(server.url, authenticator, transport=transport)
+
+    with transport:
+        response = client.get("/path", stream=True)
+
+        assert response.status_code == 200
+        assert len(transport.responses) == 2
+        assert transport.responses[0].raw.closed
+        assert not response.raw.closed
+        response.close()
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Indicator index tests."""
+
+from crowdstrike_client.indicators import CIDRIndex, DomainIndex
+
+
+def test_domain_index_matches_parent_domains() -> None:
+    index = DomainIndex()
+    index.add("example.com", "1")
+    index.add("evil.example.com.", "2")
+    index.add("EVIL.example.org", "3")
+
+    assert index.lookup("cdn.evil.example.com") == ["1", "2"]
+    assert index.lookup("example.com") == ["1"]
+    assert index.lookup("evil.example.org") == ["3"]
+    assert index.lookup("example.net") == []
+    assert index.lookup("com") == []
+    assert index.lookup("bad..example.com") == []
+    assert len(index) == 3
+
+
+def test_cidr_index_matches_containing_networks() -> None:
+    index = CIDRIndex()
+    index.add("192.0.2.0/24", "1")
+    index.add("192.0.2.10", "2")
+    index.add("2001:db8::/32", "3")
+
+    assert sorted(index.lookup("192.0.2.10")) == ["1", "2"]
+    assert index.lookup("192.0.2.11") == ["1"]
+    assert index.lookup("2001:db8::1") == ["3"]
+    assert index.lookup("198.51.100.1") == []
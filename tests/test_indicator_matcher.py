@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Indicator matcher tests."""
+
+import json
+import struct
+from typing import Any, Dict, List
+
+import pytest
+
+from crowdstrike_client.indicators import IndicatorMatcher
+
+
+def _indicators() -> List[Dict[str, Any]]:
+    return [
+        {"indicator": "evil.example.com", "type": "domain", "deleted": False},
+        {"indicator": "192.0.2.1", "type": "ip_address", "deleted": False},
+        {"indicator": "gone.example.com", "type": "domain", "deleted": True},
+    ]
+
+
+def test_save_and_load(tmp_path) -> None:
+    path = str(tmp_path / "indicators.bloom")
+    IndicatorMatcher.from_indicators(_indicators()).save(path)
+
+    matcher = IndicatorMatcher.load(path)
+    try:
+        assert sorted(matcher.types) == ["domain", "ip_address"]
+        assert matcher.contains("evil.example.com", "domain")
+        assert matcher.contains("192.0.2.1")
+        assert not matcher.contains("192.0.2.1", "domain")
+    finally:
+        matcher.close()
+
+
+def test_load_invalid_header_raises_original_error(tmp_path) -> None:
+    # The second filter entry is missing its number of hashes, so loading
+    # fails after views of the first filter were taken.
+    header = {
+        "filters": {
+            "domain": {"offset": 0, "num_bits": 64, "num_hashes": 3},
+            "ip_address": {"offset": 8, "num_bits": 64},
+        }
+    }
+    header_data = json.dumps(header).encode("utf-8")
+    path = tmp_path / "indicators.bloom"
+    path.write_bytes(
+        struct.pack("<8sI", b"CSIMBF01", len(header_data)) + header_data + bytes(64)
+    )
+
+    with pytest.raises(KeyError):
+        IndicatorMatcher.load(str(path))
+
+
+def test_load_wrong_magic(tmp_path) -> None:
+    path = tmp_path / "indicators.bloom"
+    path.write_bytes(b"NOTBLOOM" + bytes(64))
+
+    with pytest.raises(ValueError):
+        IndicatorMatcher.load(str(path))
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Indicator store tests."""
+
+from datetime import datetime
+from typing import Any, Dict, Set
+
+from crowdstrike_client.api.models import ParseMode
+from crowdstrike_client.api.models.indicator import Indicator
+from crowdstrike_client.api.models.response import parse_resource
+from crowdstrike_client.indicators import IndicatorStore
+
+
+def _indicator(indicator_id: str, indicator: str, **kwargs: Any) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "id": indicator_id,
+        "indicator": indicator,
+        "type": "domain",
+        "deleted": False,
+        "published_date": 1600000000,
+        "last_updated": 1600000100,
+        "malicious_confidence": "high",
+        "actors": ["FANCYBEAR"],
+        "malware_families": [],
+        "domain_types": [],
+        "ip_address_types": [],
+        "kill_chains": [],
+        "labels": [
+            {"name": "a", "created_on": 1600000000, "last_valid_on": 1600000000}
+        ],
+        "relations": [],
+        "reports": [],
+        "targets": [],
+        "threat_types": [],
+        "vulnerabilities": [],
+    }
+    data.update(kwargs)
+    return data
+
+
+def test_upsert_all_parse_modes() -> None:
+    store = IndicatorStore()
+    raw = _indicator("1", "raw.example.com")
+
+    count = store.upsert(
+        [
+            raw,
+            parse_resource(
+                _indicator("2", "trusted.example.com"), Indicator, ParseMode.TRUSTED
+            ),
+            parse_resource(
+                _indicator("3", "validated.example.com"), Indicator, ParseMode.VALIDATED
+            ),
+        ]
+    )
+
+    assert count == 3
+    assert len(store) == 3
+    for indicator in (
+        "raw.example.com",
+        "trusted.example.com",
+        "validated.example.com",
+    ):
+        assert store.contains(indicator)
+        [found] = store.lookup(indicator)
+        assert isinstance(found, Indicator)
+        assert found.actors == ["FANCYBEAR"]
+        assert found.labels[0].name == "a"
+
+
+def test_read_indicators_equal_validated_ones() -> None:
+    store = IndicatorStore()
+    data = _indicator(
+        "1",
+        "evil.example.com",
+        relations=[
+            {
+                "id": "2",
+                "indicator": "192.0.2.1",
+                "type": "ip_address",
+                "created_date": 1600000000,
+                "last_valid_date": "2020-09-14T00:00:00Z",
+            }
+        ],
+    )
+    store.upsert([data])
+
+    found = store.get("1")
+
+    assert found == Indicator.parse_obj(data)
+    assert found is not None
+    assert isinstance(found.published_date, datetime)
+    assert isinstance(found.labels[0].created_on, datetime)
+    assert isinstance(found.relations[0].last_valid_date, datetime)
+    assert list(store.find()) == [found]
+
+
+def test_invalid_indicators_are_skipped() -> None:
+    store = IndicatorStore()
+    invalid = _indicator("2", "invalid.example.com", published_date="not a date")
+
+    count = store.upsert([_indicator("1", "valid.example.com"), invalid])
+
+    assert count == 1
+
+    assert store.contains("valid.example.com")
+    assert not store.contains("invalid.example.com")
+    assert store.get("2") is None
+
+
+def test_deleted_indicators_are_removed() -> None:
+    store = IndicatorStore()
+    store.upsert([_indicator("1", "evil.example.com")])
+
+    count = store.upsert([_indicator("1", "evil.example.com", deleted=True)])
+
+    assert count == 0
+    assert not store.contains("evil.example.com")
+    assert len(store) == 0
+
+
+def test_find() -> None:
+    store = IndicatorStore()
+    store.upsert(
+        [
+            _indicator("1", "evil.example.com"),
+            _indicator("2", "192.0.2.1", type="ip_address", actors=[]),
+            _indicator("3", "bad.example.com", malicious_confidence="low"),
+        ]
+    )
+
+    def ids(**kwargs: Any) -> Set[str]:
+        return {indicator.id for indicator in store.find(**kwargs)}
+
+    assert ids() == {"1", "2", "3"}
+    assert ids(indicator_type="domain") == {"1", "3"}
+    assert ids(indicator_type="domain", malicious_confidence="high") == {"1"}
+    assert ids(actor="FANCYBEAR") == {"1", "3"}
+    assert len(ids(limit=2)) == 2
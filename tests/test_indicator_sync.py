@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""Indicator sync tests."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from crowdstrike_client.indicators import (
+    Checkpoint,
+    FileCheckpointStore,
+    IndicatorSync,
+    MemoryCheckpointStore,
+    SyncPage,
+)
+
+
+class _Page:
+    def __init__(self, resources: List[Dict[str, Any]], next_page: Optional[str]):
+        self.resources = resources
+        self.next_page = next_page
+
+
+class _FakeIndicators:
+    # Serves pages keyed by the next page value leading to them, None for the
+    # first page.
+
+    def __init__(
+        self, pages: Dict[Optional[str], Tuple[List[Dict[str, Any]], Optional[str]]]
+    ) -> None:
+        self.pages = pages
+        self.requests: List[Dict[str, Any]] = []
+
+    def iter_entity_pages(self, **kwargs: Any) -> Any:
+        self.requests.append(kwargs)
+
+        next_page = kwargs["next_page"]
+        while True:
+            resources, next_page_value = self.pages[next_page]
+            yield _Page(resources, next_page_value)
+            if next_page_value is None:
+                return
+            next_page = next_page_value
+
+
+class _RecordingCheckpointStore(MemoryCheckpointStore):
+    def __init__(self, checkpoint: Optional[Checkpoint] = None) -> None:
+        super().__init__(checkpoint)
+        self.saved: List[Checkpoint] = []
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        super().save(checkpoint)
+        self.saved.append(checkpoint)
+
+
+def _indicator(
+    indicator_id: str, published: int, updated: int, deleted: bool = False
+) -> Dict[str, Any]:
+    return {
+        "id": indicator_id,
+        "published_date": published,
+        "last_updated": updated,
+        "deleted": deleted,
+    }
+
+
+def _ids(resources: List[Dict[str, Any]]) -> List[str]:
+    return [resource["id"] for resource in resources]
+
+
+def _three_pages() -> _FakeIndicators:
+    return _FakeIndicators(
+        {
+            None: ([_indicator("a", 100, 110)], "p2"),
+            "p2": ([_indicator("b", 100, 120)], "p3"),
+            "p3": ([_indicator("c", 100, 130)], None),
+        }
+    )
+
+
+def test_checkpoint_saved_after_each_page() -> None:
+    store = _RecordingCheckpointStore()
+    sync = IndicatorSync(_three_pages(), store)  # type: ignore
+
+    result = sync.run(lambda page: None)
+
+    assert (result.pages, result.added) == (3, 3)
+    assert [checkpoint.next_page for checkpoint in store.saved] == [
+        "p2",
+        "p3",
+        None,
+        None,
+    ]
+    assert [checkpoint.last_updated for checkpoint in store.saved] == [
+        110,
+        120,
+        130,
+        130,
+    ]
+    assert store.saved[-1].since is None
+
+
+def test_interrupted_sync_resumes_from_last_committed_page() -> None:
+    indicators = _three_pages()
+    store = MemoryCheckpointStore(Checkpoint(last_updated=50))
+    handled: List[SyncPage] = []
+
+    def interrupt_on_second_page(page: SyncPage) -> None:
+        if len(handled) == 1:
+            raise KeyboardInterrupt
+        handled.append(page)
+
+    with pytest.raises(KeyboardInterrupt):
+        IndicatorSync(indicators, store).run(interrupt_on_second_page)  # type: ignore
+    assert [_ids(page.added) for page in handled] == [["a"]]
+
+    checkpoint = store.load()
+    assert checkpoint is not None
+    assert (checkpoint.next_page, checkpoint.since) == ("p2", 50)
+    assert checkpoint.last_updated == 110
+
+    handled.clear()
+    IndicatorSync(indicators, store).run(handled.append)  # type: ignore
+
+    assert indicators.requests[-1]["next_page"] == "p2"
+    assert [_ids(page.added) for page in handled] == [["b"], ["c"]]
+    assert store.load() == Checkpoint(last_updated=130)
+
+
+def test_incremental_sync_filters_and_classifies_changes() -> None:
+    indicators = _FakeIndicators(
+        {
+            None: (
+                [
+                    _indicator("new", 1600000200, 1600000200),
+                    _indicator("changed", 1500000000, 1600000300),
+                    _indicator("gone", 1500000000, 1600000250, deleted=True),
+                ],
+                None,
+            )
+        }
+    )
+    store = MemoryCheckpointStore(Checkpoint(last_updated=1600000100.5))
+    sync = IndicatorSync(
+        indicators, store, fql_filter="type:'domain'", limit=100  # type: ignore
+    )
+
+    pages = list(sync.sync())
+
+    request = indicators.requests[0]
+    assert request["fql_filter"] == "(type:'domain')+last_updated:>=1600000100"
+    assert request["include_deleted"] is True
+    assert request["limit"] == 100
+    assert request["next_page"] is None
+
+    assert len(pages) == 1
+    assert _ids(pages[0].added) == ["new"]
+    assert _ids(pages[0].updated) == ["changed"]
+    assert _ids(pages[0].deleted) == ["gone"]
+    assert store.load() == Checkpoint(last_updated=1600000300)
+
+
+def test_first_sync_adds_everything_without_filter() -> None:
+    indicators = _FakeIndicators({None: ([_indicator("a", 100, 110)], None)})
+    sync = IndicatorSync(indicators, MemoryCheckpointStore())  # type: ignore
+
+    pages = list(sync.sync())
+
+    assert indicators.requests[0]["fql_filter"] is None
+    assert _ids(pages[0].added) == ["a"]
+
+
+def test_file_checkpoint_store_round_trip(tmp_path) -> None:
+    store = FileCheckpointStore(str(tmp_path / "sync" / "checkpoint.json"))
+    assert store.load() is None
+
+    checkpoint = Checkpoint(last_updated=1600000000.5, since=1500000000, next_page="p")
+    store.save(checkpoint)
+
+    assert store.load() == checkpoint
+    assert FileCheckpointStore(store.path).load() == checkpoint
+    assert [path.name for path in (tmp_path / "sync").iterdir()] == ["checkpoint.json"]
+
+    with open(store.path, "w") as f:
+        f.write("{")
+    assert store.load() is None
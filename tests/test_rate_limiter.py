@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""HTTP rate limiter tests."""
+
+from crowdstrike_client.http.rate_limiter import RateLimiter
+
+
+def test_not_throttled_without_headers() -> None:
+    rate_limiter = RateLimiter()
+
+    assert rate_limiter.limit is None
+    assert rate_limiter.try_acquire() == 0.0
+
+
+def test_budget_follows_remaining() -> None:
+    rate_limiter = RateLimiter()
+
+    rate_limiter.update({"X-RateLimit-Limit": "6000", "X-RateLimit-Remaining": "10"})
+
+    assert rate_limiter.limit == 6000
+    assert rate_limiter.budget is not None
+    assert 10.0 <= rate_limiter.budget < 11.0
+
+
+def test_retry_after_ignored_on_successful_response() -> None:
+    rate_limiter = RateLimiter()
+
+    rate_limiter.update(
+        {
+            "X-RateLimit-Limit": "6000",
+            "X-RateLimit-Remaining": "5000",
+            "X-RateLimit-RetryAfter": "30",
+        },
+        200,
+    )
+
+    assert rate_limiter.try_acquire() == 0.0
+
+
+def test_retry_after_blocks_on_429() -> None:
+    rate_limiter = RateLimiter()
+
+    rate_limiter.update(
+        {
+            "X-RateLimit-Limit": "6000",
+            "X-RateLimit-Remaining": "5000",
+            "X-RateLimit-RetryAfter": "30",
+        },
+        429,
+    )
+
+    assert 29.0 < rate_limiter.try_acquire() <= 30.0
+
+
+def test_retry_after_blocks_with_no_requests_remaining() -> None:
+    rate_limiter = RateLimiter()
+
+    rate_limiter.update(
+        {
+            "X-RateLimit-Limit": "6000",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-RetryAfter": "30",
+        },
+        200,
+    )
+
+    assert 29.0 < rate_limiter.try_acquire() <= 30.0
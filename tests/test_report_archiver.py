@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Report archiver tests."""
+
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from crowdstrike_client.api.models.download import StreamedDownload
+from crowdstrike_client.reports import ArchiveStatus, ReportArchiver
+
+
+class _IdsResponse:
+    def __init__(self, resources: List[str]) -> None:
+        self.resources = resources
+
+
+class _FakeReports:
+    # Serves report PDFs by ID, None for reports without a file, and a 304
+    # when the ETag sent matches the current one.
+
+    def __init__(self, files: Dict[str, Optional[Tuple[bytes, str]]]) -> None:
+        self.files = files
+        self.ids = list(files)
+        self.queries: List[Dict[str, Any]] = []
+        self.requests: List[Tuple[str, Optional[str]]] = []
+
+    def query_all_ids(self, **kwargs: Any) -> Any:
+        self.queries.append(kwargs)
+        return _IdsResponse(self.ids)
+
+    def download_pdf(
+        self,
+        report_id: str,
+        destination: str,
+        sha256: bool = False,
+        e_tag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+    ) -> Optional[StreamedDownload]:
+        self.requests.append((report_id, e_tag))
+
+        file = self.files[report_id]
+        if file is None:
+            return None
+
+        content, current_e_tag = file
+        if e_tag == current_e_tag:
+            return StreamedDownload(
+                size=0,
+                not_modified=True,
+                e_tag=current_e_tag,
+                last_modified=datetime(2020, 1, 2, tzinfo=timezone.utc),
+            )
+
+        with open(destination, "wb") as f:
+            f.write(content)
+
+        return StreamedDownload(
+            size=len(content),
+            path=destination,
+            e_tag=current_e_tag,
+            last_modified=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        )
+
+
+def _archiver(reports: _FakeReports, directory: str) -> ReportArchiver:
+    return ReportArchiver(reports, directory, max_workers=2)  # type: ignore
+
+
+def test_archive(tmp_path) -> None:
+    reports = _FakeReports({"1": (b"%PDF-1", "a"), "2": None})
+
+    result = _archiver(reports, str(tmp_path)).archive(["1", "2"])
+
+    assert (result.downloaded, result.unchanged, result.missing) == (1, 0, 1)
+    assert result.failed == []
+    assert (tmp_path / "1.pdf").read_bytes() == b"%PDF-1"
+    assert not (tmp_path / "2.pdf").exists()
+
+
+def test_archive_queried_reports(tmp_path) -> None:
+    reports = _FakeReports({"1": (b"%PDF-1", "a"), "2": (b"%PDF-2", "b")})
+    reports.ids = ["2", "1", "2"]
+
+    result = _archiver(reports, str(tmp_path)).archive(fql_filter="type:'CSIT'")
+
+    assert reports.queries == [{"fql_filter": "type:'CSIT'", "max_workers": 2}]
+    assert result.downloaded == 2
+    assert sorted(report_id for report_id, _ in reports.requests) == ["1", "2"]
+    assert (tmp_path / "1.pdf").read_bytes() == b"%PDF-1"
+    assert (tmp_path / "2.pdf").read_bytes() == b"%PDF-2"
+
+
+def test_unchanged_reports_are_revalidated(tmp_path) -> None:
+    reports = _FakeReports({"1": (b"%PDF-1", "a"), "2": (b"%PDF-2", "b")})
+    _archiver(reports, str(tmp_path)).archive(["1", "2"])
+    reports.files["2"] = (b"%PDF-2 updated", "c")
+    reports.requests = []
+
+    result = _archiver(reports, str(tmp_path)).archive(["1", "2"])
+
+    assert (result.downloaded, result.unchanged) == (1, 1)
+    assert sorted(reports.requests) == [("1", "a"), ("2", "b")]
+    assert (tmp_path / "2.pdf").read_bytes() == b"%PDF-2 updated"
+
+
+def test_not_modified_updates_validators(tmp_path) -> None:
+    reports = _FakeReports({"1": (b"%PDF-1", "a")})
+    _archiver(reports, str(tmp_path)).archive(["1"])
+
+    archiver = _archiver(reports, str(tmp_path))
+    result = archiver.archive(["1"])
+
+    assert result.unchanged == 1
+    entry = archiver.entries["1"]
+    assert entry.status == ArchiveStatus.DOWNLOADED
+    assert entry.e_tag == "a"
+    assert entry.last_modified == datetime(2020, 1, 2, tzinfo=timezone.utc)
+    assert _archiver(reports, str(tmp_path))._load_manifest()["1"] == entry
+
+
+def test_failed_rename_fails_only_that_report(tmp_path) -> None:
+    reports = _FakeReports({"1": (b"%PDF-1", "a"), "2": (b"%PDF-2", "b")})
+    # A directory in the way of the file makes the rename fail.
+    os.mkdir(tmp_path / "1.pdf")
+
+    result = _archiver(reports, str(tmp_path)).archive(["1", "2"])
+
+    assert result.failed == ["1"]
+    assert result.downloaded == 1
+    assert (tmp_path / "2.pdf").read_bytes() == b"%PDF-2"
+    assert not (tmp_path / "1.pdf.part").exists()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Response model tests."""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+import requests
+
+from crowdstrike_client.api.models import ParseMode
+from crowdstrike_client.api.models.indicator import Indicator, Label, Relation
+from crowdstrike_client.api.models.response import Response, get_response_type
+
+
+def _indicator(indicator_id: str, indicator: str) -> Dict[str, Any]:
+    return {
+        "id": indicator_id,
+        "indicator": indicator,
+        "type": "domain",
+        "deleted": False,
+        "published_date": 1600000000,
+        "last_updated": 1600000100,
+        "malicious_confidence": "high",
+        "actors": ["FANCYBEAR"],
+        "malware_families": ["X-Agent"],
+        "domain_types": [],
+        "ip_address_types": [],
+        "kill_chains": ["C2"],
+        "labels": [
+            {"name": "a", "created_on": 1600000000, "last_valid_on": 1600000050}
+        ],
+        "relations": [
+            {
+                "id": "ip_address_192.0.2.1",
+                "indicator": "192.0.2.1",
+                "type": "ip_address",
+                "created_date": 1600000000,
+                "last_valid_date": 1600000050,
+            }
+        ],
+        "reports": ["CSIT-1"],
+        "targets": ["Government"],
+        "threat_types": ["Targeted"],
+        "vulnerabilities": [],
+    }
+
+
+def _page(count: int) -> Dict[str, Any]:
+    return {
+        "meta": {
+            "trace_id": "t",
+            "query_time": 0.5,
+            "pagination": {"limit": count, "offset": 0, "total": 1000},
+        },
+        "errors": [],
+        "resources": [
+            _indicator(f"domain_{i}.example.com", f"{i}.example.com")
+            for i in range(count)
+        ],
+    }
+
+
+def _http_response(data: Dict[str, Any]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["next-page"] = "https://localhost/path?after=x"
+    response._content = json.dumps(data).encode("utf-8")
+    return response
+
+
+def _normalize(value: Any) -> Any:
+    # TRUSTED keeps datetimes as received, epoch seconds here.
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _parse(data: Dict[str, Any], parse_mode: ParseMode) -> Response[Any]:
+    return Response.parse_http_response(_http_response(data), Indicator, parse_mode)
+
+
+def test_trusted_and_validated_indicator_pages_are_equal() -> None:
+    data = _page(50)
+
+    validated = _parse(data, ParseMode.VALIDATED)
+    trusted = _parse(data, ParseMode.TRUSTED)
+
+    assert trusted.meta == validated.meta
+    assert trusted.errors == validated.errors
+    assert trusted.next_page == validated.next_page
+    assert len(trusted.resources) == len(validated.resources) == 50
+    for trusted_resource, validated_resource in zip(
+        trusted.resources, validated.resources
+    ):
+        assert isinstance(trusted_resource, Indicator)
+        assert isinstance(trusted_resource.labels[0], Label)
+        assert isinstance(trusted_resource.relations[0], Relation)
+        assert _normalize(trusted_resource.dict()) == _normalize(
+            validated_resource.dict()
+        )
+
+
+def test_raw_page_keeps_decoded_json() -> None:
+    data = _page(3)
+
+    raw = _parse(data, ParseMode.RAW)
+
+    assert raw.resources == data["resources"]
+    assert raw.meta == _parse(data, ParseMode.VALIDATED).meta
+
+
+@pytest.mark.parametrize("parse_mode", list(ParseMode))
+def test_empty_page(parse_mode: ParseMode) -> None:
+    data = _page(0)
+    data["resources"] = None
+
+    assert _parse(data, parse_mode).resources == []
+
+
+def test_response_types_are_cached() -> None:
+    assert get_response_type(Indicator) is get_response_type(Indicator)
+    assert get_response_type(List[int]) is get_response_type(List[int])
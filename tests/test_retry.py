@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""HTTP retry tests."""
+
+from typing import Iterator, List
+
+import pytest
+import requests
+
+from crowdstrike_client.http.client import HTTPClient
+from crowdstrike_client.http.retry import RetryPolicy
+
+from tests.fake_server import FakeServer
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch) -> Iterator[None]:
+    monkeypatch.setattr("time.sleep", lambda delay: None)
+    yield
+
+
+def _client(server: FakeServer, **kwargs) -> HTTPClient:
+    retry_policy = RetryPolicy(backoff_factor=0.01, **kwargs)
+    return HTTPClient(server.url, retry_policy=retry_policy)
+
+
+def test_retries_server_errors_until_success(server: FakeServer) -> None:
+    server.reply(503)
+    server.reply(500)
+    server.reply(200, {"ok": True})
+
+    response = _client(server).get("/path")
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert len(server.requests) == 3
+
+
+def test_gives_up_after_max_attempts(server: FakeServer) -> None:
+    server.reply(503)
+
+    response = _client(server, max_attempts=3).get("/path")
+
+    assert response.status_code == 503
+    assert len(server.requests) == 3
+
+
+def test_does_not_retry_client_errors(server: FakeServer) -> None:
+    server.reply(404)
+
+    response = _client(server).get("/path")
+
+    assert response.status_code == 404
+    assert len(server.requests) == 1
+
+
+def test_does_not_retry_non_idempotent_post(server: FakeServer) -> None:
+    server.reply(503)
+
+    response = _client(server).post("/path", data={"a": "b"})
+
+    assert response.status_code == 503
+    assert len(server.requests) == 1
+
+
+def test_retries_idempotent_post(server: FakeServer) -> None:
+    server.reply(503)
+    server.reply(201)
+
+    response = _client(server).post("/path", data={"a": "b"}, idempotent=True)
+
+    assert response.status_code == 201
+    assert len(server.requests) == 2
+
+
+def test_retries_connection_errors() -> None:
+    # Nothing listens on port 9 of the loopback interface.
+    client = HTTPClient("http://127.0.0.1:9", retry_policy=RetryPolicy(max_attempts=2))
+
+    with pytest.raises(requests.ConnectionError):
+        client.get("/path")
+
+
+def test_server_retry_after_takes_precedence() -> None:
+    retry_policy = RetryPolicy(max_backoff=60.0)
+
+    assert retry_policy.get_delay(1, {"Retry-After": "7"}) == 7.0
+    assert retry_policy.get_delay(1, {"X-RateLimit-RetryAfter": "7"}) == 7.0
+
+
+def test_server_retry_after_is_capped() -> None:
+    retry_policy = RetryPolicy(max_backoff=10.0)
+
+    assert retry_policy.get_delay(1, {"Retry-After": "3600"}) == 10.0
+    assert retry_policy.get_delay(1, {"X-RateLimit-RetryAfter": "3600"}) == 10.0
+
+
+def test_backoff_is_bounded() -> None:
+    retry_policy = RetryPolicy(backoff_factor=1.0, max_backoff=4.0)
+
+    for attempt in range(1, 10):
+        assert 0.0 <= retry_policy.get_delay(attempt) <= 4.0
+
+
+def test_retry_after_header_delays_retry(server: FakeServer, monkeypatch) -> None:
+    delays: List[float] = []
+    monkeypatch.setattr("time.sleep", delays.append)
+    server.reply(429, headers={"Retry-After": "2"})
+    server.reply(200)
+
+    response = _client(server).get("/path")
+
+    assert response.status_code == 200
+    assert delays == [2.0]
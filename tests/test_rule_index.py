@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Rule bundle index tests."""
+
+import zipfile
+from io import BytesIO
+from typing import Dict, List, Tuple
+
+import pytest
+
+from crowdstrike_client.api.models.download import Download
+from crowdstrike_client.rules import RuleBundle, RuleIndex, RuleType
+
+
+def _bundle(members: Dict[str, str]) -> RuleBundle:
+    content = BytesIO()
+    with zipfile.ZipFile(content, "w") as f:
+        for filename, text in members.items():
+            f.writestr(filename, text)
+    return RuleBundle(Download(content=content))
+
+
+def _rules(bundle: RuleBundle) -> List[Tuple[str, str]]:
+    return [(rule.key, rule.text) for rule in bundle]
+
+
+def test_multiline_yara_rules() -> None:
+    bundle = _bundle(
+        {
+            "a.yar": (
+                'import "pe"\n'
+                "\n"
+                "/* rule commented { } */\n"
+                "private rule a : tag\n"
+                "{\n"
+                "    strings:\n"
+                '        $s = "}{"\n'
+                "        $r = /\\}/ // }\n"
+                "        $h = { 4D 5A }\n"
+                "\n"
+                "    condition:\n"
+                "        any of them\n"
+                "}\n"
+            )
+        }
+    )
+
+    [(key, text)] = _rules(bundle)
+
+    assert key == "yara:a.yar:a"
+    assert text.startswith("private rule a : tag\n{\n")
+    assert "\n\n    condition:" in text
+    assert text.endswith("any of them\n}")
+
+
+def test_yara_rules_on_one_line_are_split() -> None:
+    bundle = _bundle(
+        {
+            "a.yar": (
+                "rule c { condition: true } rule d { condition: false }\n"
+                "rule e {\n"
+                "    condition: true\n"
+                "} rule f { condition: true } // trailing\n"
+            )
+        }
+    )
+
+    assert _rules(bundle) == [
+        ("yara:a.yar:c", "rule c { condition: true }"),
+        ("yara:a.yar:d", "rule d { condition: false }"),
+        ("yara:a.yar:e", "rule e {\n    condition: true\n}"),
+        ("yara:a.yar:f", "rule f { condition: true }"),
+    ]
+
+
+def test_yara_braces_in_strings_and_regexes_are_ignored() -> None:
+    bundle = _bundle(
+        {
+            "a.yar": (
+                "rule g {\n"
+                '    strings: $s = "}" $r = /{/\n'
+                "    condition: $s and $r and pe.pdb_path matches /x}/\n"
+                "}\n"
+                "rule h { condition: true }\n"
+            )
+        }
+    )
+
+    assert [key for key, _ in _rules(bundle)] == ["yara:a.yar:g", "yara:a.yar:h"]
+    assert _rules(bundle)[0][1].endswith("matches /x}/\n}")
+
+
+def test_same_yara_rule_name_in_two_files() -> None:
+    bundle = _bundle(
+        {
+            "a.yar": "rule x { condition: true }\n",
+            "b.yara": "rule x { condition: false }\n",
+        }
+    )
+
+    index = bundle.index()
+
+    assert len(index) == 2
+    entry = index.get(RuleType.YARA, "x", "b.yara")
+    assert entry is not None
+    assert entry.file == "b.yara"
+    with pytest.raises(ValueError):
+        index.get(RuleType.YARA, "x")
+
+
+def test_snort_rules() -> None:
+    bundle = _bundle(
+        {
+            "a.rules": (
+                "# comment\n"
+                'alert tcp any any -> any any (msg:"a"; sid:1; rev:1;)\n'
+                '# alert tcp any any -> any any (msg:"off"; sid:2; rev:1;)\n'
+                "alert tcp any any -> any any \\\n"
+                '    (msg:"b"; sid:3; rev:1;)\n'
+            )
+        }
+    )
+
+    assert [key for key, _ in _rules(bundle)] == ["snort:1", "snort:3"]
+    assert bundle.index().get(RuleType.SNORT, "3") is not None
+
+
+def test_diff_and_index_round_trip(tmp_path) -> None:
+    previous = _bundle(
+        {
+            "a.yar": "rule a { condition: true }\nrule b { condition: true }\n",
+            "a.rules": "alert ip any any -> any any (sid:1;)\n",
+        }
+    )
+    path = str(tmp_path / "rules.index")
+    previous.index().save(path)
+
+    current = _bundle(
+        {
+            "a.yar": "rule a { condition: false }\nrule c { condition: true }\n",
+            "a.rules": "alert ip any any -> any any (sid:1;)\n",
+        }
+    )
+    previous_index = RuleIndex.load(path)
+    assert previous_index is not None
+
+    diff = current.diff(previous_index)
+
+    assert [rule.key for rule in diff.added] == ["yara:a.yar:c"]
+    assert [rule.key for rule in diff.changed] == ["yara:a.yar:a"]
+    assert [entry.key for entry in diff.removed] == ["yara:a.yar:b"]
+    assert len(diff.index) == 3
+    assert RuleIndex.load(str(tmp_path / "missing.index")) is None
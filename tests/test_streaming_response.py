@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Streaming response tests."""
+
+import json
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+
+from crowdstrike_client.api.models import ParseMode
+from crowdstrike_client.api.models.exceptions import ModelException
+from crowdstrike_client.api.models.response import Error
+from crowdstrike_client.api.models.stream import StreamingResponse
+
+_META = {"trace_id": "t", "query_time": 0.5}
+
+_RESOURCES: List[Dict[str, Any]] = [
+    {"id": "a", "name": "Größe ドメイン 🛡", "score": 1600000123},
+    {"id": "b", "name": "x", "score": -12.5e3, "tags": [1, 23, 456]},
+    {"id": "c", "name": "", "score": 0, "nested": {"deep": [None, True]}},
+]
+
+
+class _FakeResponse:
+    # Serves a body in chunks of a fixed size, ignoring the requested size.
+
+    def __init__(self, body: bytes, chunk_size: int) -> None:
+        self.body = body
+        self.chunk_size = chunk_size
+        self.headers = {"next-page": "https://localhost/path?after=x"}
+        self.closed = False
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        size = self.chunk_size
+        for pos in range(0, len(self.body), size):
+            end = pos + size
+            yield self.body[pos:end]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _streaming_response(
+    body: Any,
+    chunk_size: int = 1,
+    resource_type: Any = dict,
+    parse_mode: ParseMode = ParseMode.RAW,
+) -> Tuple[StreamingResponse, _FakeResponse]:
+    if not isinstance(body, bytes):
+        body = json.dumps(body, ensure_ascii=False, indent=1).encode("utf-8")
+    response = _FakeResponse(body, chunk_size)
+    streaming_response = StreamingResponse.parse_http_response(
+        response, resource_type, parse_mode  # type: ignore
+    )
+    return streaming_response, response
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 13, 65536])
+def test_resources_decoded_across_chunk_edges(chunk_size: int) -> None:
+    body = {"meta": _META, "errors": [], "resources": _RESOURCES}
+    response, http_response = _streaming_response(body, chunk_size)
+
+    assert list(response) == _RESOURCES
+    assert response.meta is not None and response.meta.trace_id == "t"
+    assert response.errors == []
+    assert response.get_next_page_params() == {"after": ["x"]}
+    assert http_response.closed
+
+
+def test_number_split_at_end_of_chunk() -> None:
+    # The number is split after its first digit when read byte by byte.
+    response, _ = _streaming_response(b'{"resources": [1234567, 8]}')
+
+    assert list(response) == [1234567, 8]
+
+
+def test_null_resources() -> None:
+    response, _ = _streaming_response({"meta": _META, "resources": None})
+
+    assert list(response) == []
+    assert response.meta is not None
+
+
+def test_empty_object() -> None:
+    assert list(_streaming_response(b"{ }")[0]) == []
+
+
+def test_meta_and_errors_after_resources() -> None:
+    body = {
+        "resources": _RESOURCES,
+        "errors": [{"code": 500, "message": "partial"}],
+        "meta": _META,
+    }
+    response, http_response = _streaming_response(body, chunk_size=5)
+    resources = iter(response)
+
+    assert next(resources) == _RESOURCES[0]
+    assert response.meta is None
+
+    assert list(resources) == _RESOURCES[1:]
+    assert response.meta is not None and response.meta.query_time == 0.5
+    assert response.errors == [Error(code=500, message="partial")]
+
+
+def test_validated_resources() -> None:
+    body = {"resources": [{"code": 1, "message": "a"}, {"code": 2, "message": "b"}]}
+    response, _ = _streaming_response(body, 1, Error, ParseMode.VALIDATED)
+
+    assert [error.code for error in response] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"meta": {"trace_id": "t", "query_time": 0.5}, "resources": [{"id": "a"',
+        b'{"resources": [{"id": "a"}, ',
+        b'{"resources": [1, 2]',
+        b'{"resources": [1 2]}',
+        b"[]",
+        b"",
+    ],
+)
+def test_invalid_json_raises_and_closes(body: bytes) -> None:
+    response, http_response = _streaming_response(body, chunk_size=4)
+
+    with pytest.raises(ModelException):
+        list(response)
+    assert http_response.closed
+
+
+def test_close_while_iterating() -> None:
+    response, http_response = _streaming_response({"resources": _RESOURCES})
+    resources = iter(response)
+
+    next(resources)
+    assert not http_response.closed
+    response.close()
+
+    assert http_response.closed
+
+
+def test_response_iterated_once() -> None:
+    response, _ = _streaming_response({"resources": _RESOURCES})
+    list(response)
+
+    with pytest.raises(ModelException):
+        list(response)
+
+
+def test_close_without_reading() -> None:
+    response, http_response = _streaming_response({"resources": _RESOURCES})
+    response.close()
+
+    assert http_response.closed
+    with pytest.raises(ModelException):
+        list(response)
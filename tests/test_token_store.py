@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""HTTP token store tests."""
+
+import json
+import os
+import time
+
+from crowdstrike_client.http.authenticator import Token
+from crowdstrike_client.http.token_store import FileTokenStore
+
+
+def _token(expires_in: float = 1800.0) -> Token:
+    return Token({"Authorization": "bearer token"}, time.time() + expires_in)
+
+
+def test_set_and_get(tmp_path) -> None:
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    token = _token()
+
+    store.set("key", token)
+
+    stored_token = store.get("key")
+    assert stored_token is not None
+    assert stored_token.headers == token.headers
+    assert stored_token.expires_at == token.expires_at
+
+
+def test_delete(tmp_path) -> None:
+    store = FileTokenStore(str(tmp_path / "tokens.json"))
+    store.set("key", _token())
+
+    store.delete("key")
+
+    assert store.get("key") is None
+
+
+def test_expired_tokens_are_pruned(tmp_path) -> None:
+    path = tmp_path / "tokens.json"
+    store = FileTokenStore(str(path))
+    store.set("expired", _token(-1.0))
+
+    store.set("key", _token())
+
+    assert store.get("expired") is None
+    assert set(json.loads(path.read_text())) == {"key"}
+
+
+def test_malformed_entries_are_ignored(tmp_path) -> None:
+    path = tmp_path / "tokens.json"
+    path.write_text(
+        json.dumps(
+            {
+                "list": [],
+                "string": "token",
+                "null": None,
+                "bad_expiry": {"headers": {}, "expires_at": "never"},
+            }
+        )
+    )
+    store = FileTokenStore(str(path))
+
+    for key in ("list", "string", "null", "bad_expiry"):
+        assert store.get(key) is None
+
+    store.set("key", _token())
+
+    assert store.get("key") is not None
+    assert set(json.loads(path.read_text())) == {"key"}
+
+
+def test_unwritable_directory_disables_caching(tmp_path) -> None:
+    # A path below a regular file can never be created, even by root.
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    store = FileTokenStore(os.path.join(str(not_a_directory), "tokens.json"))
+
+    store.set("key", _token())
+
+    assert store.get("key") is None
+    store.delete("key")